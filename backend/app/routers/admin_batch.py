@@ -6,6 +6,8 @@ Generates sentences, audio, and images for vocabulary decks.
 """
 
 import asyncio
+import functools
+import importlib.util
 import json
 import logging
 import os
@@ -23,6 +25,9 @@ CONVEX_URL = os.getenv("VITE_CONVEX_URL") or os.getenv("CONVEX_URL")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-3-flash-preview")
 
+# Deck items generated at once by a batch job
+ADMIN_BATCH_CONCURRENCY = int(os.getenv("ADMIN_BATCH_CONCURRENCY", "8"))
+
 # Track active jobs
 active_jobs: dict[str, dict] = {}
 
@@ -58,6 +63,15 @@ async def health_check():
     )
 
 
+@functools.cache
+def get_http_client() -> httpx.AsyncClient:
+    """Shared HTTP client for Convex and Gemini calls (HTTP/2 when h2 is installed)."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+
+
 async def call_convex_query(function_name: str, args: dict) -> dict:
     """Call a Convex query function"""
     if not CONVEX_URL:
@@ -68,25 +82,25 @@ async def call_convex_query(function_name: str, args: dict) -> dict:
     base_url = CONVEX_URL.rstrip("/")
     url = f"{base_url}/api/query"
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url,
-            json={
-                "path": function_name,
-                "args": args,
-            },
-            headers={"Content-Type": "application/json"},
-            timeout=30.0,
-        )
+    client = get_http_client()
+    response = await client.post(
+        url,
+        json={
+            "path": function_name,
+            "args": args,
+        },
+        headers={"Content-Type": "application/json"},
+        timeout=30.0,
+    )
 
-        if response.status_code != 200:
-            logger.error(f"Convex query failed: {response.text}")
-            raise HTTPException(status_code=500, detail=f"Convex query failed: {response.text}")
+    if response.status_code != 200:
+        logger.error(f"Convex query failed: {response.text}")
+        raise HTTPException(status_code=500, detail=f"Convex query failed: {response.text}")
 
-        result = response.json()
-        if "value" in result:
-            return result["value"]
-        return result
+    result = response.json()
+    if "value" in result:
+        return result["value"]
+    return result
 
 
 async def call_convex_mutation(function_name: str, args: dict) -> dict:
@@ -97,25 +111,25 @@ async def call_convex_mutation(function_name: str, args: dict) -> dict:
     base_url = CONVEX_URL.rstrip("/")
     url = f"{base_url}/api/mutation"
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url,
-            json={
-                "path": function_name,
-                "args": args,
-            },
-            headers={"Content-Type": "application/json"},
-            timeout=30.0,
-        )
+    client = get_http_client()
+    response = await client.post(
+        url,
+        json={
+            "path": function_name,
+            "args": args,
+        },
+        headers={"Content-Type": "application/json"},
+        timeout=30.0,
+    )
 
-        if response.status_code != 200:
-            logger.error(f"Convex mutation failed: {response.text}")
-            raise HTTPException(status_code=500, detail=f"Convex mutation failed: {response.text}")
+    if response.status_code != 200:
+        logger.error(f"Convex mutation failed: {response.text}")
+        raise HTTPException(status_code=500, detail=f"Convex mutation failed: {response.text}")
 
-        result = response.json()
-        if "value" in result:
-            return result["value"]
-        return result
+    result = response.json()
+    if "value" in result:
+        return result["value"]
+    return result
 
 
 def build_sentence_prompt(
@@ -156,38 +170,71 @@ async def generate_sentence_for_item(item: dict, model: str) -> dict:
 
     url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url,
-            params={"key": GEMINI_API_KEY},
-            json={
-                "contents": [{"parts": [{"text": prompt}]}],
-                "generationConfig": {
-                    "responseMimeType": "application/json",
-                    "temperature": 0.7,
-                },
+    client = get_http_client()
+    response = await client.post(
+        url,
+        params={"key": GEMINI_API_KEY},
+        json={
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "responseMimeType": "application/json",
+                "temperature": 0.7,
             },
-            timeout=30.0,
-        )
+        },
+        timeout=30.0,
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Gemini API error: {response.text}")
+        return {"error": response.text}
 
-        if response.status_code != 200:
-            logger.error(f"Gemini API error: {response.text}")
-            return {"error": response.text}
+    result = response.json()
 
-        result = response.json()
+    try:
+        # Extract the generated text
+        text = result["candidates"][0]["content"]["parts"][0]["text"]
+        # Parse as JSON
+        data = json.loads(text)
+        return {
+            "sentence": data.get("sentence", ""),
+            "translation": data.get("translation", ""),
+        }
+    except (KeyError, json.JSONDecodeError) as e:
+        logger.error(f"Failed to parse Gemini response: {e}")
+        return {"error": str(e)}
+
+
+async def generate_and_save_sentence(deck_id: str, item: dict, model: str) -> None:
+    """Generate a sentence for one deck item and save it (or its failure) to Convex"""
+    try:
+        result = await generate_sentence_for_item(item, model)
+
+        if "error" not in result:
+            # Update item in Convex
+            await call_convex_mutation(
+                "premadeDecks:updateItemByWord",
+                {
+                    "deckId": deck_id,
+                    "word": item["word"],
+                    "sentence": result["sentence"],
+                    "sentenceTranslation": result["translation"],
+                    "generationStatus": "complete",
+                },
+            )
+        else:
+            logger.error(f"Failed to generate for {item['word']}: {result['error']}")
+            # Mark as failed
+            await call_convex_mutation(
+                "premadeDecks:updateItemByWord",
+                {
+                    "deckId": deck_id,
+                    "word": item["word"],
+                    "generationStatus": "failed",
+                },
+            )
 
-        try:
-            # Extract the generated text
-            text = result["candidates"][0]["content"]["parts"][0]["text"]
-            # Parse as JSON
-            data = json.loads(text)
-            return {
-                "sentence": data.get("sentence", ""),
-                "translation": data.get("translation", ""),
-            }
-        except (KeyError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to parse Gemini response: {e}")
-            return {"error": str(e)}
+    except Exception as e:
+        logger.error(f"Error processing {item.get('word', 'unknown')}: {e}")
 
 
 async def process_sentences_batch(deck_id: str, count: int, model: str, job_id: str):
@@ -210,46 +257,22 @@ async def process_sentences_batch(deck_id: str, count: int, model: str, job_id:
         logger.info(f"Processing {len(items)} items")
         active_jobs[job_id]["total"] = len(items)
 
-        # Process items one by one (could be parallelized with rate limiting)
-        for i, item in enumerate(items):
-            if active_jobs.get(job_id, {}).get("cancelled"):
-                logger.info("Job cancelled")
-                break
-
-            try:
-                result = await generate_sentence_for_item(item, model)
-
-                if "error" not in result:
-                    # Update item in Convex
-                    await call_convex_mutation(
-                        "premadeDecks:updateItemByWord",
-                        {
-                            "deckId": deck_id,
-                            "word": item["word"],
-                            "sentence": result["sentence"],
-                            "sentenceTranslation": result["translation"],
-                            "generationStatus": "complete",
-                        },
-                    )
-                    active_jobs[job_id]["processed"] = i + 1
-                else:
-                    logger.error(f"Failed to generate for {item['word']}: {result['error']}")
-                    # Mark as failed
-                    await call_convex_mutation(
-                        "premadeDecks:updateItemByWord",
-                        {
-                            "deckId": deck_id,
-                            "word": item["word"],
-                            "generationStatus": "failed",
-                        },
-                    )
+        # Process items concurrently, at most ADMIN_BATCH_CONCURRENCY at a time
+        semaphore = asyncio.Semaphore(ADMIN_BATCH_CONCURRENCY)
+
+        async def process_item(item: dict) -> None:
+            async with semaphore:
+                if active_jobs.get(job_id, {}).get("cancelled"):
+                    return
+                await generate_and_save_sentence(deck_id, item, model)
+                active_jobs[job_id]["processed"] += 1
 
                 # Small delay to avoid rate limits
                 await asyncio.sleep(0.5)
 
-            except Exception as e:
-                logger.error(f"Error processing {item.get('word', 'unknown')}: {e}")
-
+        await asyncio.gather(*map(process_item, items))
+        if active_jobs.get(job_id, {}).get("cancelled"):
+            logger.info("Job cancelled")
         # Update deck stats
         await call_convex_mutation("premadeDecks:updateDeckStats", {"deckId": deck_id})
 
@@ -0,0 +1,55 @@
+"""
+Shared Google Gemini client.
+
+Every genai.Client owns its own HTTP connection pools, so creating one per
+generator (or per script run) repeats DNS lookups and TLS handshakes. Callers
+get one client per API key instead, with a connection pool sized for
+concurrent generation (multiplexed over HTTP/2 when h2 is installed).
+
+The async pool binds to the event loop that first uses it, so share the
+client within one loop (the app, or one asyncio.run() in a script).
+"""
+
+import functools
+import importlib.util
+import os
+
+import httpx
+from google import genai
+from google.genai import types
+
+# Connection pool limits for concurrent Gemini requests
+GEMINI_MAX_CONNECTIONS = int(os.getenv("GEMINI_MAX_CONNECTIONS", "32"))
+GEMINI_MAX_KEEPALIVE = int(os.getenv("GEMINI_MAX_KEEPALIVE", "16"))
+
+
+def get_gemini_api_key() -> str | None:
+    """GEMINI_API_KEY, falling back to GOOGLE_AI_API_KEY."""
+    return os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_AI_API_KEY")
+
+
+def get_gemini_client(api_key: str | None = None) -> genai.Client | None:
+    """Get the shared Gemini client for an API key (default: from env), or None."""
+    api_key = api_key or get_gemini_api_key()
+    if not api_key:
+        return None
+    return _create_client(api_key)
+
+
+@functools.cache
+def _create_client(api_key: str) -> genai.Client:
+    """Create the client for an API key (once per key)."""
+    limits = httpx.Limits(
+        max_connections=GEMINI_MAX_CONNECTIONS,
+        max_keepalive_connections=GEMINI_MAX_KEEPALIVE,
+    )
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            client_args={"limits": limits},
+            async_client_args={
+                "limits": limits,
+                "http2": importlib.util.find_spec("h2") is not None,
+            },
+        ),
+    )
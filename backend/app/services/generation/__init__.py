@@ -13,10 +13,15 @@ from .image_generator import ImageGenerator
 # Shared media compression utilities
 from .media import (
     compress_audio_to_mp3,
+    compress_audio_to_opus,
     compress_image_to_webp,
     get_audio_bytes_as_mp3,
     get_image_bytes_as_webp,
+    split_pcm_on_silence,
 )
+
+# Client-side rate limiting for Gemini calls
+from .rate_limit import AsyncRateLimiter, call_with_retry
 from .story_generator import StoryGenerator
 
 __all__ = [
@@ -26,12 +31,17 @@ __all__ = [
     "AudioGenerator",
     # Media utilities - use these for all new pipelines
     "compress_audio_to_mp3",
+    "compress_audio_to_opus",
     "compress_image_to_webp",
     "get_audio_bytes_as_mp3",
     "get_image_bytes_as_webp",
+    "split_pcm_on_silence",
     # Batch API - use for bulk text generation (50% cost savings)
     "BatchJobRunner",
     "BatchJobStatus",
     "BatchRequest",
     "run_text_batch",
+    # Rate limiting - wrap concurrent Gemini calls
+    "AsyncRateLimiter",
+    "call_with_retry",
 ]
@@ -5,12 +5,13 @@ Generates audio narration for Japanese graded reader stories.
 Audio is uploaded directly to R2 storage - no local files are saved.
 """
 
+import asyncio
+import functools
 import logging
-import os
 
-from google import genai
 from google.genai import types
 
+from ..gemini_client import get_gemini_api_key, get_gemini_client
 from ..storage import upload_story_audio
 from .media import get_audio_bytes_as_mp3
 
@@ -28,6 +29,21 @@ VOICE_WEIGHTS = [0.30, 0.30, 0.20, 0.20]
 NARRATION_PROMPT = "Read aloud clearly and slowly for language learners:\n\n"
 
 
+@functools.cache
+def speech_config(voice: str) -> types.GenerateContentConfig:
+    """TTS request config for a voice (built once per voice, then reused)"""
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name=voice,
+                )
+            )
+        ),
+    )
+
+
 def select_voice() -> str:
     """Select a random voice based on weighted probabilities."""
     import random
@@ -40,10 +56,9 @@ class AudioGenerator:
 
     def __init__(self):
         # Use GEMINI_API_KEY or fall back to GOOGLE_AI_API_KEY
-        self.api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_AI_API_KEY")
-        self.client = None
-        if self.api_key:
-            self.client = genai.Client(api_key=self.api_key)
+        self.api_key = get_gemini_api_key()
+        # Shared client, so generators reuse one connection pool
+        self.client = get_gemini_client(self.api_key)
 
     @property
     def is_configured(self) -> bool:
@@ -188,30 +203,21 @@ class AudioGenerator:
             # Prepare the prompt with narration instructions
             prompt = NARRATION_PROMPT + text
 
-            # Generate audio using Gemini TTS
-            response = self.client.models.generate_content(
+            # Generate audio using Gemini TTS (async client - doesn't block the loop)
+            response = await self.client.aio.models.generate_content(
                 model=GEMINI_MODEL,
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_modalities=["AUDIO"],
-                    speech_config=types.SpeechConfig(
-                        voice_config=types.VoiceConfig(
-                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                voice_name=voice,
-                            )
-                        )
-                    ),
-                ),
+                config=speech_config(voice),
             )
 
             # Extract PCM audio data from response
             pcm_data = response.candidates[0].content.parts[0].inline_data.data
 
-            # Convert PCM to MP3 in memory
-            mp3_bytes = get_audio_bytes_as_mp3(pcm_data, bitrate="64k")
+            # Convert PCM to MP3 in memory (off the event loop)
+            mp3_bytes = await asyncio.to_thread(get_audio_bytes_as_mp3, pcm_data, bitrate="64k")
 
             # Upload to R2
-            url = upload_story_audio(mp3_bytes, story_id, language)
+            url = await asyncio.to_thread(upload_story_audio, mp3_bytes, story_id, language)
 
             logger.info(f"Audio uploaded to R2: {len(mp3_bytes) / 1024:.1f}KB")
             return url
@@ -236,16 +242,7 @@ class AudioGenerator:
             response = self.client.models.generate_content(
                 model=GEMINI_MODEL,
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_modalities=["AUDIO"],
-                    speech_config=types.SpeechConfig(
-                        voice_config=types.VoiceConfig(
-                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                voice_name=voice,
-                            )
-                        )
-                    ),
-                ),
+                config=speech_config(voice),
             )
             return response.candidates[0].content.parts[0].inline_data.data
         except Exception as e:
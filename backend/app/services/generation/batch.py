@@ -23,9 +23,11 @@ Usage:
 """
 
 import asyncio
+import base64
 import json
 import logging
 import os
+import random
 import tempfile
 import time
 from collections.abc import Callable
@@ -33,13 +35,17 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from google import genai
 from google.genai import types
 
+from ..gemini_client import get_gemini_client
+
 logger = logging.getLogger(__name__)
 
 # Batch API configuration
-BATCH_API_POLL_INTERVAL = 30  # seconds
+# The Batch API has no long-poll/watch endpoint, so status checks back off
+# exponentially (with jitter) from the min to the max interval
+BATCH_API_POLL_MIN_INTERVAL = 2  # seconds
+BATCH_API_POLL_INTERVAL = 60  # seconds (max between checks)
 BATCH_API_MAX_WAIT = 24 * 60 * 60  # 24 hours (batch jobs can take a while)
 
 
@@ -50,6 +56,29 @@ class BatchRequest:
     key: str  # Unique identifier to match response
     prompt: str  # User prompt
     system_prompt: str | None = None  # Optional system instruction
+    generation_config: dict[str, Any] | None = None  # Optional generationConfig (camelCase)
+
+
+def response_text(response: dict[str, Any]) -> str:
+    """Text of the first part of a batch response"""
+    candidates = response.get("candidates", [])
+    if candidates:
+        parts = candidates[0].get("content", {}).get("parts", [])
+        if parts:
+            return parts[0].get("text", "")
+    return ""
+
+
+def response_audio(response: dict[str, Any]) -> bytes:
+    """Inline audio (e.g. TTS PCM) of a batch response, concatenated across parts"""
+    candidates = response.get("candidates", [])
+    if not candidates:
+        return b""
+    return b"".join(
+        base64.b64decode(part["inlineData"]["data"])
+        for part in candidates[0].get("content", {}).get("parts", [])
+        if part.get("inlineData", {}).get("data")
+    )
 
 
 @dataclass
@@ -74,7 +103,7 @@ class BatchJobRunner:
         self.api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_AI_API_KEY")
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY not set")
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = get_gemini_client(self.api_key)
 
     def _build_jsonl_content(
         self,
@@ -96,13 +125,13 @@ class BatchJobRunner:
             if req.system_prompt:
                 request_obj["systemInstruction"] = {"parts": [{"text": req.system_prompt}]}
 
-            # Add generation config for structured output
-            if response_mime_type or response_schema:
-                gen_config: dict[str, Any] = {}
-                if response_mime_type:
-                    gen_config["responseMimeType"] = response_mime_type
-                if response_schema:
-                    gen_config["responseSchema"] = response_schema
+            # Add generation config (per-request settings, structured output)
+            gen_config: dict[str, Any] = dict(req.generation_config or {})
+            if response_mime_type:
+                gen_config["responseMimeType"] = response_mime_type
+            if response_schema:
+                gen_config["responseSchema"] = response_schema
+            if gen_config:
                 request_obj["generationConfig"] = gen_config
 
             # Build the full line with key
@@ -195,20 +224,23 @@ class BatchJobRunner:
         poll_interval: int = BATCH_API_POLL_INTERVAL,
         max_wait: int = BATCH_API_MAX_WAIT,
         on_progress: Callable[[BatchJobStatus], None] | None = None,
-    ) -> dict[str, str]:
+        extract: Callable[[dict[str, Any]], Any] = response_text,
+    ) -> dict[str, Any]:
         """
         Wait for a batch job to complete and return results.
 
         Args:
             job_name: Name of the batch job
-            poll_interval: Seconds between status checks
+            poll_interval: Maximum seconds between status checks
             max_wait: Maximum seconds to wait
             on_progress: Optional callback for progress updates
+            extract: Turns each response dict into a result (default: its text)
 
         Returns:
-            Dict mapping request keys to response texts
+            Dict mapping request keys to extracted results
         """
         start_time = time.time()
+        delay = BATCH_API_POLL_MIN_INTERVAL
         final_states = {
             "JOB_STATE_SUCCEEDED",
             "JOB_STATE_FAILED",
@@ -232,16 +264,21 @@ class BatchJobRunner:
             if state in final_states:
                 break
 
-            await asyncio.sleep(poll_interval)
+            # Back off so small jobs are noticed within seconds while long
+            # jobs settle at poll_interval between checks
+            await asyncio.sleep(random.uniform(BATCH_API_POLL_MIN_INTERVAL, delay))
+            delay = min(delay * 2, poll_interval)
 
         # Check final state
         if state != "JOB_STATE_SUCCEEDED":
             raise RuntimeError(f"Batch job failed with state: {state}")
 
         # Download results
-        return await self._download_results(job)
+        return await self._download_results(job, extract)
 
-    async def _download_results(self, job) -> dict[str, str]:
+    async def _download_results(
+        self, job, extract: Callable[[dict[str, Any]], Any] = response_text
+    ) -> dict[str, Any]:
         """Download and parse batch job results"""
         results = {}
 
@@ -259,32 +296,21 @@ class BatchJobRunner:
                 try:
                     result = json.loads(line)
                     key = result.get("key", "")
-                    response = result.get("response", {})
-
-                    # Extract text from response
-                    text = ""
-                    candidates = response.get("candidates", [])
-                    if candidates:
-                        content = candidates[0].get("content", {})
-                        parts = content.get("parts", [])
-                        if parts:
-                            text = parts[0].get("text", "")
-
                     if key:
-                        results[key] = text
+                        results[key] = extract(result.get("response", {}))
                 except json.JSONDecodeError:
                     logger.warning(f"Failed to parse result line: {line[:100]}")
 
         # Handle inline responses (for smaller batches)
         elif hasattr(job, "dest") and hasattr(job.dest, "inlined_responses"):
             for response in job.dest.inlined_responses:
-                key = response.key
-                text = ""
-                if response.response and response.response.candidates:
-                    candidate = response.response.candidates[0]
-                    if candidate.content and candidate.content.parts:
-                        text = candidate.content.parts[0].text
-                results[key] = text
+                # Same camelCase/base64 shape as the JSONL results
+                data = (
+                    response.response.model_dump(mode="json", by_alias=True, exclude_none=True)
+                    if response.response
+                    else {}
+                )
+                results[response.key] = extract(data)
 
         logger.info(f"Downloaded {len(results)} results")
         return results
@@ -310,7 +336,7 @@ class BatchJobRunner:
             display_name: Optional job name
             response_mime_type: Optional MIME type for structured output
             response_schema: Optional JSON schema for structured output
-            poll_interval: Seconds between status checks
+            poll_interval: Maximum seconds between status checks
             on_progress: Optional callback for progress updates
 
         Returns:
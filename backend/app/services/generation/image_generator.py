@@ -5,6 +5,7 @@ Generates cover art and chapter illustrations for Japanese graded reader stories
 Images are uploaded directly to R2 storage - no local files are saved.
 """
 
+import asyncio
 import base64
 import logging
 
@@ -202,15 +203,21 @@ Aspect ratio: {aspect_ratio}"""
         image_bytes = await self._call_openrouter_image(prompt, reference_image)
 
         if image_bytes:
-            # Compress to WebP in memory
-            webp_bytes = get_image_bytes_as_webp(image_bytes, quality=85, max_size=800)
+            # Compress to WebP in memory (off the event loop)
+            webp_bytes = await asyncio.to_thread(
+                get_image_bytes_as_webp, image_bytes, quality=85, max_size=800
+            )
 
             # Upload to R2 if story_id provided
             if story_id:
                 if chapter_num is not None:
-                    url = upload_story_chapter_image(webp_bytes, story_id, language, chapter_num)
+                    url = await asyncio.to_thread(
+                        upload_story_chapter_image, webp_bytes, story_id, language, chapter_num
+                    )
                 else:
-                    url = upload_story_cover(webp_bytes, story_id, language)
+                    url = await asyncio.to_thread(
+                        upload_story_cover, webp_bytes, story_id, language
+                    )
             else:
                 # Fallback: return None URL but still provide bytes
                 logger.warning("No story_id provided, image not uploaded to R2")
@@ -261,12 +268,14 @@ Aspect ratio: {aspect_ratio}"""
         image_bytes = await self._call_openrouter_image(prompt)
 
         if image_bytes:
-            # Compress to WebP in memory
-            webp_bytes = get_image_bytes_as_webp(image_bytes, quality=85, max_size=800)
+            # Compress to WebP in memory (off the event loop)
+            webp_bytes = await asyncio.to_thread(
+                get_image_bytes_as_webp, image_bytes, quality=85, max_size=800
+            )
 
             # Upload to R2 if story_id provided
             if story_id:
-                url = upload_story_cover(webp_bytes, story_id, language)
+                url = await asyncio.to_thread(upload_story_cover, webp_bytes, story_id, language)
             else:
                 logger.warning("No story_id provided, cover not uploaded to R2")
                 url = None
@@ -317,12 +326,16 @@ Aspect ratio: {aspect_ratio}"""
         image_bytes = await self._call_openrouter_image(prompt)
 
         if image_bytes:
-            # Compress to WebP in memory
-            webp_bytes = get_image_bytes_as_webp(image_bytes, quality=85, max_size=800)
+            # Compress to WebP in memory (off the event loop)
+            webp_bytes = await asyncio.to_thread(
+                get_image_bytes_as_webp, image_bytes, quality=85, max_size=800
+            )
 
             # Upload to R2 if story_id provided
             if story_id:
-                url = upload_story_chapter_image(webp_bytes, story_id, language, chapter_num)
+                url = await asyncio.to_thread(
+                    upload_story_chapter_image, webp_bytes, story_id, language, chapter_num
+                )
             else:
                 logger.warning("No story_id provided, chapter image not uploaded to R2")
                 url = None
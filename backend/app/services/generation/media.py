@@ -5,17 +5,24 @@ This module provides centralized compression functions to ensure all
 generation pipelines output optimized media files. New pipelines should
 use these utilities instead of implementing compression directly.
 
-Audio: PCM/WAV -> MP3 (64kbps)
+Audio: PCM/WAV -> MP3 (VBR, ~64kbps for speech) or Opus (32kbps)
 Images: PNG/JPEG -> WebP (quality 80-85)
 """
 
 import io
 import logging
+import os
 import subprocess
-import tempfile
-import wave
+import sys
+from array import array
+from itertools import pairwise
 from pathlib import Path
 
+try:
+    import lameenc
+except ImportError:  # Optional: falls back to ffmpeg
+    lameenc = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +31,123 @@ logger = logging.getLogger(__name__)
 # ============================================
 
 
+# ffmpeg raw PCM sample formats by sample width in bytes
+PCM_FORMATS = {1: "u8", 2: "s16le", 4: "s32le"}
+
+# libopus encoder complexity (0 = fastest, 10 = best, ffmpeg's default). 5 is
+# several times faster than 10 with no audible loss for 24kHz speech
+OPUS_COMPRESSION_LEVEL = os.getenv("OPUS_COMPRESSION_LEVEL", "5")
+
+# LAME quality setting for in-process encodes (2 = best, 7 = fastest)
+LAME_QUALITY = 3
+
+# MP3 VBR quality (libmp3lame -q:a scale: 0 = best, 9 = smallest). Level 6
+# averages ~64kbps for mono speech with smaller files than 64k CBR at the
+# same perceived quality. Set MP3_VBR_QUALITY="" to encode CBR at `bitrate`.
+_vbr_quality_env = os.getenv("MP3_VBR_QUALITY", "6")
+MP3_VBR_QUALITY: int | None = int(_vbr_quality_env) if _vbr_quality_env else None
+
+# Opus bitrate for speech. 32kbps mono Opus sounds better than 64kbps MP3
+# for narration at about half the size
+OPUS_BITRATE = os.getenv("OPUS_BITRATE", "32k")
+
+
+def _encode_pcm_with_lame(
+    pcm_data: bytes,
+    bitrate: str,
+    vbr_quality: int | None,
+    sample_rate: int,
+    channels: int,
+) -> bytes:
+    """Encode 16-bit PCM to MP3 in-process with libmp3lame (no ffmpeg fork)"""
+    encoder = lameenc.Encoder()
+    if vbr_quality is not None:
+        encoder.set_vbr(lameenc.VBR_MTRH)
+        encoder.set_vbr_quality(vbr_quality)
+    else:
+        encoder.set_bit_rate(int(bitrate.rstrip("kK")))
+    encoder.set_in_sample_rate(sample_rate)
+    encoder.set_channels(channels)
+    encoder.set_quality(LAME_QUALITY)
+    return bytes(encoder.encode(pcm_data) + encoder.flush())
+
+
+def _ffmpeg_pcm_command(sample_rate: int, channels: int, sample_width: int) -> list[str]:
+    """ffmpeg argv prefix reading raw PCM from stdin (quiet, non-interactive)"""
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-y",
+        "-f",
+        PCM_FORMATS[sample_width],
+        "-ar",
+        str(sample_rate),
+        "-ac",
+        str(channels),
+        "-i",
+        "pipe:0",
+    ]
+
+
+def _encode_pcm_with_ffmpeg(
+    pcm_data: bytes,
+    bitrate: str,
+    vbr_quality: int | None,
+    sample_rate: int,
+    channels: int,
+    sample_width: int,
+) -> bytes:
+    """Encode raw PCM to MP3 by piping it through ffmpeg's stdin/stdout"""
+    if vbr_quality is not None:
+        rate_args = ["-c:a", "libmp3lame", "-q:a", str(vbr_quality)]
+    else:
+        rate_args = ["-b:a", bitrate]
+
+    result = subprocess.run(
+        [
+            *_ffmpeg_pcm_command(sample_rate, channels, sample_width),
+            *rate_args,
+            "-f",
+            "mp3",
+            "pipe:1",
+        ],
+        input=pcm_data,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg error: {result.stderr.decode(errors='replace')}")
+
+    return result.stdout
+
+
+def _encode_pcm_to_mp3(
+    pcm_data: bytes,
+    bitrate: str,
+    vbr_quality: int | None,
+    sample_rate: int,
+    channels: int,
+    sample_width: int,
+) -> bytes:
+    """
+    Encode raw PCM to MP3 bytes without touching the disk.
+
+    Uses the in-process LAME encoder when lameenc is installed (16-bit PCM
+    only), which skips an ffmpeg fork and codec init per clip; otherwise
+    pipes the PCM through ffmpeg.
+
+    Raises:
+        RuntimeError: If ffmpeg conversion fails
+    """
+    if lameenc is not None and sample_width == 2:
+        return _encode_pcm_with_lame(pcm_data, bitrate, vbr_quality, sample_rate, channels)
+    return _encode_pcm_with_ffmpeg(
+        pcm_data, bitrate, vbr_quality, sample_rate, channels, sample_width
+    )
+
+
 def compress_audio_to_mp3(
     pcm_data: bytes,
     output_path: Path,
@@ -31,6 +155,7 @@ def compress_audio_to_mp3(
     sample_rate: int = 24000,
     channels: int = 1,
     sample_width: int = 2,
+    vbr_quality: int | None = MP3_VBR_QUALITY,
 ) -> Path:
     """
     Convert PCM audio data to MP3 format.
@@ -41,10 +166,11 @@ def compress_audio_to_mp3(
     Args:
         pcm_data: Raw PCM audio bytes
         output_path: Path to save the MP3 file (should end in .mp3)
-        bitrate: MP3 bitrate (default 64k for voice)
+        bitrate: MP3 bitrate for CBR encodes (default 64k for voice)
         sample_rate: PCM sample rate in Hz (default 24000 for Gemini TTS)
         channels: Number of audio channels (default 1 for mono)
         sample_width: Bytes per sample (default 2 for 16-bit)
+        vbr_quality: VBR quality (default MP3_VBR_QUALITY); None for CBR at bitrate
 
     Returns:
         Path to the saved MP3 file
@@ -59,73 +185,214 @@ def compress_audio_to_mp3(
     # Create parent directory if needed
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Save PCM as temporary WAV file (ffmpeg input)
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        with wave.open(tmp, "wb") as wf:
-            wf.setnchannels(channels)
-            wf.setsampwidth(sample_width)
-            wf.setframerate(sample_rate)
-            wf.writeframes(pcm_data)
-
-    try:
-        # Convert to MP3 using ffmpeg
-        result = subprocess.run(
-            ["ffmpeg", "-y", "-i", str(tmp_path), "-b:a", bitrate, str(output_path)],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg error: {result.stderr}")
+    mp3_bytes = _encode_pcm_to_mp3(
+        pcm_data, bitrate, vbr_quality, sample_rate, channels, sample_width
+    )
+    output_path.write_bytes(mp3_bytes)
 
-        # Log compression stats
+    # Log compression stats (called once per clip, so DEBUG only)
+    if logger.isEnabledFor(logging.DEBUG):
         original_size = len(pcm_data)
         final_size = output_path.stat().st_size
         savings = (1 - final_size / original_size) * 100
-        logger.info(
+        logger.debug(
             f"Audio compressed: {original_size / 1024:.1f}KB -> {final_size / 1024:.1f}KB ({savings:.0f}% savings)"
         )
 
-        return output_path
+    return output_path
+
+
+def _encode_pcm_to_opus(
+    pcm_data: bytes,
+    bitrate: str,
+    sample_rate: int,
+    channels: int,
+    sample_width: int,
+) -> bytes:
+    """
+    Encode raw PCM to Ogg/Opus bytes by piping it through ffmpeg's stdin/stdout.
+
+    Raises:
+        RuntimeError: If ffmpeg conversion fails
+    """
+    result = subprocess.run(
+        [
+            *_ffmpeg_pcm_command(sample_rate, channels, sample_width),
+            "-c:a",
+            "libopus",
+            "-b:a",
+            bitrate,
+            "-application",
+            "voip",
+            "-compression_level",
+            OPUS_COMPRESSION_LEVEL,
+            "-f",
+            "ogg",
+            "pipe:1",
+        ],
+        input=pcm_data,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg error: {result.stderr.decode(errors='replace')}")
+
+    return result.stdout
+
+
+def compress_audio_to_opus(
+    pcm_data: bytes,
+    output_path: Path,
+    bitrate: str = OPUS_BITRATE,
+    sample_rate: int = 24000,
+    channels: int = 1,
+    sample_width: int = 2,
+) -> Path:
+    """
+    Convert PCM audio data to Ogg/Opus format.
+
+    Smaller than MP3 at the same speech quality; use it where every client
+    plays Opus (all current browsers do).
+
+    Args:
+        pcm_data: Raw PCM audio bytes
+        output_path: Path to save the Opus file (should end in .opus)
+        bitrate: Opus bitrate (default OPUS_BITRATE)
+        sample_rate: PCM sample rate in Hz (default 24000 for Gemini TTS)
+        channels: Number of audio channels (default 1 for mono)
+        sample_width: Bytes per sample (default 2 for 16-bit)
+
+    Returns:
+        Path to the saved Opus file
+
+    Raises:
+        RuntimeError: If ffmpeg conversion fails
+    """
+    if output_path.suffix.lower() != ".opus":
+        output_path = output_path.with_suffix(".opus")
 
-    finally:
-        # Clean up temp file
-        tmp_path.unlink(missing_ok=True)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(
+        _encode_pcm_to_opus(pcm_data, bitrate, sample_rate, channels, sample_width)
+    )
+    return output_path
 
 
 def get_audio_bytes_as_mp3(
     pcm_data: bytes,
     bitrate: str = "64k",
     sample_rate: int = 24000,
+    vbr_quality: int | None = MP3_VBR_QUALITY,
 ) -> bytes:
     """
     Convert PCM audio data to MP3 and return as bytes.
 
     Use this when you need MP3 bytes for upload to cloud storage
-    rather than saving to local filesystem.
+    rather than saving to local filesystem. Nothing touches the disk.
 
     Args:
         pcm_data: Raw PCM audio bytes
-        bitrate: MP3 bitrate (default 64k)
+        bitrate: MP3 bitrate for CBR encodes (default 64k)
         sample_rate: PCM sample rate in Hz
+        vbr_quality: VBR quality (default MP3_VBR_QUALITY); None for CBR at bitrate
 
     Returns:
         MP3 audio as bytes
     """
-    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
+    return _encode_pcm_to_mp3(
+        pcm_data, bitrate, vbr_quality, sample_rate, channels=1, sample_width=2
+    )
+
 
-    try:
-        compress_audio_to_mp3(pcm_data, tmp_path, bitrate, sample_rate)
-        return tmp_path.read_bytes()
-    finally:
-        tmp_path.unlink(missing_ok=True)
+def split_pcm_on_silence(
+    pcm_data: bytes,
+    expected: int,
+    sample_rate: int = 24000,
+    min_silence_ms: int = 700,
+    silence_thresh_db: float = -40.0,
+) -> list[bytes] | None:
+    """
+    Split 16-bit mono PCM into `expected` utterances at the longest pauses.
+
+    Used to cut a multi-sentence TTS response back into one clip per
+    sentence. Only interior pauses of at least min_silence_ms count; when
+    there are more than needed, the longest ones are used (shorter pauses
+    are usually commas), and each cut falls in the middle of its pause.
+
+    Args:
+        pcm_data: Raw 16-bit little-endian mono PCM bytes
+        expected: Number of utterances the audio should contain
+        sample_rate: PCM sample rate in Hz
+        min_silence_ms: Minimum pause length that can separate utterances
+        silence_thresh_db: Peak level (dBFS) below which a frame is silent
+
+    Returns:
+        List of `expected` PCM byte segments, or None if the audio has
+        fewer pauses than needed
+    """
+    if expected <= 1:
+        return [pcm_data] if expected == 1 else []
+
+    samples = array("h")
+    samples.frombytes(pcm_data[: len(pcm_data) - len(pcm_data) % 2])
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    # Peak level per 10ms frame
+    frame = max(sample_rate // 100, 1)
+    threshold = 32768 * 10 ** (silence_thresh_db / 20)
+    silent = [
+        max(map(abs, samples[i : i + frame]), default=0) < threshold
+        for i in range(0, len(samples), frame)
+    ]
+
+    # Interior silent runs as (length, start_frame, end_frame)
+    min_frames = max(min_silence_ms * sample_rate // 1000 // frame, 1)
+    pauses: list[tuple[int, int, int]] = []
+    start = None
+    for i, is_silent in enumerate(silent):
+        if is_silent and start is None:
+            start = i
+        elif not is_silent and start is not None:
+            if start > 0 and i - start >= min_frames:
+                pauses.append((i - start, start, i))
+            start = None
+
+    if len(pauses) < expected - 1:
+        return None
+
+    longest = sorted(pauses, reverse=True)[: expected - 1]
+    cuts = sorted((s + e) // 2 * frame * 2 for _, s, e in longest)
+    bounds = [0, *cuts, len(pcm_data)]
+    return [pcm_data[a:b] for a, b in pairwise(bounds)]
 
 
 # ============================================
 # IMAGE COMPRESSION
 # ============================================
 
+# WebP encoder effort (0 = fastest, 6 = smallest). Method 6 is ~1.5-2x slower
+# to encode than 4 for files ~2-3% smaller; set WEBP_METHOD=4 for faster bulk
+# generation. Resize/encode also speed up with Pillow-SIMD installed in place
+# of Pillow (same API, see scripts/requirements-build.txt).
+WEBP_METHOD = int(os.getenv("WEBP_METHOD", "6"))
+
+
+def _open_image(image_data: bytes, max_size: int | None):
+    """
+    Open image bytes for WebP compression.
+
+    When the image will be downscaled, JPEGs are decoded directly at 1/2,
+    1/4 or 1/8 scale (never below max_size) instead of at full resolution.
+    draft() is a no-op for PNG and other formats.
+    """
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(image_data))
+    if max_size:
+        img.draft("RGB", (max_size, max_size))
+    img.load()
+    return img
+
 
 def compress_image_to_webp(
     image_data: bytes,
@@ -157,8 +424,8 @@ def compress_image_to_webp(
     # Create parent directory if needed
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Open and process image
-    img = Image.open(io.BytesIO(image_data))
+    # Open and process image (shrink-on-load for JPEG)
+    img = _open_image(image_data, max_size)
 
     # Convert color mode if needed
     if img.mode in ("RGBA", "P"):
@@ -169,15 +436,16 @@ def compress_image_to_webp(
         img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
 
     # Save as WebP
-    img.save(output_path, "WEBP", quality=quality, method=6)
-
-    # Log compression stats
-    original_size = len(image_data)
-    final_size = output_path.stat().st_size
-    savings = (1 - final_size / original_size) * 100
-    logger.info(
-        f"Image compressed: {original_size / 1024:.1f}KB -> {final_size / 1024:.1f}KB ({savings:.0f}% savings)"
-    )
+    img.save(output_path, "WEBP", quality=quality, method=WEBP_METHOD)
+
+    # Log compression stats (called once per image, so DEBUG only)
+    if logger.isEnabledFor(logging.DEBUG):
+        original_size = len(image_data)
+        final_size = output_path.stat().st_size
+        savings = (1 - final_size / original_size) * 100
+        logger.debug(
+            f"Image compressed: {original_size / 1024:.1f}KB -> {final_size / 1024:.1f}KB ({savings:.0f}% savings)"
+        )
 
     return output_path
 
@@ -203,7 +471,7 @@ def get_image_bytes_as_webp(
     """
     from PIL import Image
 
-    img = Image.open(io.BytesIO(image_data))
+    img = _open_image(image_data, max_size)
 
     if img.mode in ("RGBA", "P"):
         img = img.convert("RGB")
@@ -212,7 +480,7 @@ def get_image_bytes_as_webp(
         img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
 
     buffer = io.BytesIO()
-    img.save(buffer, "WEBP", quality=quality, method=6)
+    img.save(buffer, "WEBP", quality=quality, method=WEBP_METHOD)
 
     return buffer.getvalue()
 
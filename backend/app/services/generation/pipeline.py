@@ -5,6 +5,7 @@ Orchestrates story, image, and audio generation into a single workflow.
 All media is uploaded directly to R2 - no local files are saved.
 """
 
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -513,8 +514,8 @@ class StoryPipeline:
 
         logger.info(f"Generating audio for {story['id']} with voice {voice}")
 
-        # Generate PCM audio
-        pcm_data = self.audio_generator.get_pcm_audio(full_text, voice)
+        # Generate PCM audio (sync client call, so off the event loop)
+        pcm_data = await asyncio.to_thread(self.audio_generator.get_pcm_audio, full_text, voice)
         if not pcm_data:
             return None
 
@@ -525,11 +526,11 @@ class StoryPipeline:
         else:
             logger.info("Step 7/7: Skipping audio alignment")
 
-        # Convert to MP3 in memory
-        mp3_bytes = get_audio_bytes_as_mp3(pcm_data, bitrate="64k")
+        # Convert to MP3 in memory (off the event loop)
+        mp3_bytes = await asyncio.to_thread(get_audio_bytes_as_mp3, pcm_data, bitrate="64k")
 
         # Upload to R2
-        url = upload_story_audio(mp3_bytes, story["id"], language)
+        url = await asyncio.to_thread(upload_story_audio, mp3_bytes, story["id"], language)
         logger.info(f"Audio uploaded to R2: {len(mp3_bytes) / 1024:.1f}KB")
 
         return {
@@ -561,10 +562,11 @@ class StoryPipeline:
 
         try:
             logger.info("  Loading Whisper model for alignment...")
-            model = stable_whisper.load_model("small")
+            model = await asyncio.to_thread(stable_whisper.load_model, "small")
 
             logger.info("  Transcribing audio for alignment...")
-            result = model.transcribe(
+            result = await asyncio.to_thread(
+                model.transcribe,
                 tmp_path,
                 language="ja",
                 word_timestamps=True,
@@ -655,7 +657,7 @@ class StoryPipeline:
 
         # Upload to R2
         try:
-            url = upload_story_json(story_bytes, story["id"], language)
+            url = await asyncio.to_thread(upload_story_json, story_bytes, story["id"], language)
             logger.info(f"Story uploaded to R2: {url}")
         except Exception as e:
             logger.warning(f"R2 upload failed: {e}, saving locally only")
@@ -0,0 +1,118 @@
+"""
+Client-side rate limiting and retries for Gemini API calls.
+
+Concurrent generation bursts past per-minute quotas quickly, and every 429
+costs a full round trip plus a retry. Acquiring from a token bucket before
+each request keeps throughput at the quota ceiling instead; retries with
+exponential backoff and jitter are kept for the 429/5xx responses that
+still slip through (e.g. when the quota is shared with other clients).
+
+Usage:
+    from app.services.generation.rate_limit import AsyncRateLimiter, call_with_retry
+
+    TTS_LIMITER = AsyncRateLimiter(rate=10, period=60)  # 10 requests/minute
+
+    response = await call_with_retry(
+        lambda: client.aio.models.generate_content(...),
+        limiter=TTS_LIMITER,
+    )
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from google.genai import errors
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP status codes worth retrying (rate limited / transient server errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per `period` seconds.
+
+    Bursts of up to `rate` requests go through immediately; after that,
+    callers wait until the bucket refills. Safe to share across coroutines.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) * self.rate / self.period
+                self._tokens = min(self.rate, self._tokens + refill)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether a Gemini API error is worth retrying"""
+    return isinstance(error, errors.APIError) and error.code in RETRYABLE_STATUS_CODES
+
+
+async def call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    limiter: AsyncRateLimiter | None = None,
+    max_attempts: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> T:
+    """
+    Call an async Gemini request, rate limited and retried on 429/5xx.
+
+    Args:
+        func: Zero-argument callable returning the request awaitable
+        limiter: Optional rate limiter acquired before every attempt
+        max_attempts: Total attempts before the last error is raised
+        base_delay: Initial backoff in seconds (doubles each attempt)
+        max_delay: Maximum backoff in seconds
+
+    Returns:
+        The request's result
+    """
+    attempt = 1
+    while True:
+        if limiter:
+            await limiter.acquire()
+
+        try:
+            return await func()
+        except Exception as e:
+            if attempt >= max_attempts or not is_retryable(e):
+                raise
+
+            # Full jitter keeps concurrent callers from retrying in lockstep
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+            logger.warning(f"Gemini request failed ({e.code}), retry {attempt} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
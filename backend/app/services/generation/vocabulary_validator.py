@@ -247,7 +247,7 @@ IGNORED_WORDS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of vocabulary validation using Learning Value Score"""
 
@@ -297,6 +297,7 @@ class VocabularyValidator:
     def __init__(self):
         self._word_lists: dict[str, set[str]] = {}  # Cumulative lists
         self._level_specific: dict[str, set[str]] = {}  # Non-cumulative, level-specific words
+        self._word_levels: dict[str, str] = {}  # Word -> easiest level it appears at
         self._load_word_lists()
 
     def _load_word_lists(self):
@@ -326,15 +327,16 @@ class VocabularyValidator:
             self._word_lists[level] = cumulative.copy()
             logger.info(f"Cumulative {level}: {len(self._word_lists[level])} words")
 
+        # Reverse index, hardest level first so easier levels overwrite
+        for level in reversed(JLPT_LEVELS):
+            self._word_levels.update(dict.fromkeys(self._level_specific.get(level, set()), level))
+
     def get_word_level(self, word: str) -> str | None:
         """
         Get the JLPT level of a word.
         Returns the easiest level where this word appears, or None if not in any list.
         """
-        for level in JLPT_LEVELS:
-            if word in self._level_specific.get(level, set()):
-                return level
-        return None
+        return self._word_levels.get(word)
 
     def validate_tokens(self, tokens: list[dict], target_level: str) -> ValidationResult:
         """
@@ -388,22 +390,19 @@ class VocabularyValidator:
                 message="Validation skipped - word lists not loaded",
             )
 
-        target_level_idx = JLPT_LEVELS.index(target_level)
-
         # Count total tokens (for threshold scaling)
         total_tokens = len(tokens)
 
         # Extract unique words to check (use baseForm when available, fallback to surface)
-        words_to_check = set()
-        for token in tokens:
-            if isinstance(token, dict):
-                word = token.get("baseForm") or token.get("surface", "")
-            else:
-                # Handle Token objects
-                word = getattr(token, "baseForm", None) or getattr(token, "surface", "")
-
-            if word and word not in IGNORED_WORDS:
-                words_to_check.add(word)
+        words_to_check = {
+            token.get("baseForm") or token.get("surface", "")
+            if isinstance(token, dict)
+            # Handle Token objects
+            else getattr(token, "baseForm", None) or getattr(token, "surface", "")
+            for token in tokens
+        }
+        words_to_check -= IGNORED_WORDS
+        words_to_check -= {"", None}
 
         if not words_to_check:
             return ValidationResult(
@@ -425,45 +424,35 @@ class VocabularyValidator:
                 message="No words to validate",
             )
 
-        # Categorize words by level
-        words_by_level: dict[str, list[str]] = {level: [] for level in JLPT_LEVELS}
-        words_by_level["unknown"] = []
-        words_by_level["katakana"] = []  # Track katakana separately
-
-        target_level_words = []
-        above_level_words = []
-        below_level_words = []  # At or below target, but not at target
-        unknown_words = []
-
-        for word in words_to_check:
-            # Check if word is katakana (loanword) - don't count against above-level
-            is_katakana = bool(KATAKANA_PATTERN.match(word))
-
-            word_level = self.get_word_level(word)
-
-            if word_level is None:
-                # Word not in any JLPT list
-                if is_katakana:
-                    words_by_level["katakana"].append(word)
-                    # Don't count katakana as unknown - they're common loanwords
-                else:
-                    words_by_level["unknown"].append(word)
-                    unknown_words.append(word)
-            else:
-                words_by_level[word_level].append(word)
-                word_level_idx = JLPT_LEVELS.index(word_level)
-
-                if word_level_idx == target_level_idx:
-                    # Word is AT target level
-                    target_level_words.append(word)
-                elif word_level_idx < target_level_idx:
-                    # Word is BELOW target level (easier)
-                    below_level_words.append(word)
-                else:
-                    # Word is ABOVE target level (harder)
-                    # Skip katakana words - loanwords are common at all levels
-                    if not is_katakana:
-                        above_level_words.append(word)
+        # Categorize words by level with set intersections, easiest level first
+        # (a word listed at several levels belongs to the easiest, as in get_word_level)
+        words_by_level: dict[str, list[str]] = {}
+        remaining = set(words_to_check)
+        for level in JLPT_LEVELS:
+            level_words = remaining & self._level_specific.get(level, set())
+            remaining -= level_words
+            words_by_level[level] = list(level_words)
+
+        # Katakana words (loanwords) don't count as unknown or above-level
+        katakana = {word for word in words_to_check if KATAKANA_PATTERN.match(word)}
+        unknown_words = list(remaining - katakana)
+        words_by_level["unknown"] = unknown_words
+        words_by_level["katakana"] = list(remaining & katakana)  # Track katakana separately
+
+        target_level_idx = JLPT_LEVELS.index(target_level)
+        # Words AT target level
+        target_level_words = words_by_level[target_level]
+        # At or below target, but not at target (easier)
+        below_level_words = [
+            word for level in JLPT_LEVELS[:target_level_idx] for word in words_by_level[level]
+        ]
+        # Words ABOVE target level (harder); skip katakana - loanwords are common at all levels
+        above_level_words = [
+            word
+            for level in JLPT_LEVELS[target_level_idx + 1 :]
+            for word in words_by_level[level]
+            if word not in katakana
+        ]
 
         # Convert to counts for output
         words_by_level_counts = {level: len(words) for level, words in words_by_level.items()}
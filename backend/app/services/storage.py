@@ -10,9 +10,11 @@ Structure:
     └── image-{id}.webp       # Images
 """
 
+import functools
 import logging
 import os
 from pathlib import Path
+from typing import BinaryIO
 from urllib.parse import quote
 
 import boto3
@@ -31,14 +33,20 @@ R2_BUCKET_NAME = os.getenv("R2_BUCKET_NAME", "sanlang-media")
 R2_PUBLIC_URL = os.getenv("R2_PUBLIC_URL", "")
 
 
+@functools.lru_cache(maxsize=1)
 def get_r2_client():
-    """Get configured R2 client"""
+    """
+    Get the shared R2 client.
+
+    Built once from its own boto3 session: clients are thread-safe, so
+    uploads offloaded to worker threads can share it and its connection pool.
+    """
     if not all([R2_ACCOUNT_ID, R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY]):
         raise ValueError(
             "R2 credentials not configured. Set R2_ACCOUNT_ID, R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY"
         )
 
-    return boto3.client(
+    return boto3.session.Session().client(
         "s3",
         endpoint_url=f"https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com",
         aws_access_key_id=R2_ACCESS_KEY_ID,
@@ -87,7 +95,7 @@ def get_image_key(word: str, language: str, image_id: str) -> str:
 
 
 def upload_to_r2(
-    data: bytes,
+    data: bytes | BinaryIO,
     key: str,
     content_type: str,
     cache_control: str = "public, max-age=31536000, immutable",
@@ -96,7 +104,7 @@ def upload_to_r2(
     Upload data to R2 and return the public URL.
 
     Args:
-        data: File bytes
+        data: File bytes, or an open binary file (streamed, not read into memory)
         key: R2 object key (path)
         content_type: MIME type
         cache_control: Cache-Control header
@@ -118,12 +126,14 @@ def upload_to_r2(
     base_url = R2_PUBLIC_URL.rstrip("/")
     url = f"{base_url}/{key}"
 
-    logger.info(f"Uploaded to R2: {key}")
+    # Per-object detail only: bulk callers (deck generation) report progress in aggregate
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Uploaded to R2: {key}")
     return url
 
 
 def upload_word_audio(
-    data: bytes,
+    data: bytes | BinaryIO,
     word: str,
     language: str,
 ) -> str:
@@ -136,7 +146,7 @@ def upload_word_audio(
 
 
 def upload_sentence_audio(
-    data: bytes,
+    data: bytes | BinaryIO,
     word: str,
     language: str,
     sentence_id: str,
@@ -150,7 +160,7 @@ def upload_sentence_audio(
 
 
 def upload_word_image(
-    data: bytes,
+    data: bytes | BinaryIO,
     word: str,
     language: str,
     image_id: str,
@@ -283,17 +293,19 @@ def upload_file(
     Returns:
         Public URL of uploaded file, or None if file doesn't exist
     """
-    if not file_path.exists():
+    try:
+        f = file_path.open("rb")
+    except FileNotFoundError:
         logger.warning(f"File not found: {file_path}")
         return None
 
-    data = file_path.read_bytes()
-
-    if file_type == "word_audio":
-        return upload_word_audio(data, word, language)
-    elif file_type == "sentence_audio":
-        return upload_sentence_audio(data, word, language, item_id)
-    elif file_type == "image":
-        return upload_word_image(data, word, language, item_id)
-    else:
-        raise ValueError(f"Unknown file_type: {file_type}")
+    # Stream the open file to R2 instead of reading it into memory first
+    with f:
+        if file_type == "word_audio":
+            return upload_word_audio(f, word, language)
+        elif file_type == "sentence_audio":
+            return upload_sentence_audio(f, word, language, item_id)
+        elif file_type == "image":
+            return upload_word_image(f, word, language, item_id)
+        else:
+            raise ValueError(f"Unknown file_type: {file_type}")
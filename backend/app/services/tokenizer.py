@@ -5,6 +5,9 @@ import ipadic
 
 from app.models.story import Token, TokenPart
 
+# Katakana ァ-ヶ -> hiragana ぁ-ゖ (same offset for the whole block)
+KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+
 # Katakana compounds that should be kept together
 # These are common loanwords that may be incorrectly split
 KATAKANA_COMPOUNDS = {
@@ -254,15 +257,7 @@ class TokenizerService:
         """Convert katakana to hiragana"""
         if not text:
             return text
-
-        result = []
-        for char in text:
-            code = ord(char)
-            if 0x30A1 <= code <= 0x30F6:
-                result.append(chr(code - 0x60))
-            else:
-                result.append(char)
-        return "".join(result)
+        return text.translate(KATAKANA_TO_HIRAGANA)
 
 
 # Global instance
@@ -59,10 +59,11 @@ def find_audio_file(story_id: str) -> Path | None:
     if wav_path.exists():
         return wav_path
 
-    # Fall back to MP3
-    mp3_path = AUDIO_DIR / f"{story_id}.mp3"
-    if mp3_path.exists():
-        return mp3_path
+    # Fall back to the encoded audio (Opus, or MP3 for older stories)
+    for suffix in (".opus", ".mp3"):
+        audio_path = AUDIO_DIR / f"{story_id}{suffix}"
+        if audio_path.exists():
+            return audio_path
 
     return None
 
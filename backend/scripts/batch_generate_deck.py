@@ -21,11 +21,16 @@ Models:
 
 import argparse
 import asyncio
-import csv
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import os
 import sys
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -38,19 +43,37 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent.parent / "web" / ".env.local"
 load_dotenv(env_path)
 
+from deck_io import VocabWord, iter_words_from_csv
 from google import genai
 from google.genai import types
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, falls back to json
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop (not on Windows), falls back to asyncio
+    uvloop = None
+
 from app.config.languages import (
     CODE_TO_ISO,
     LANGUAGE_NAMES,
     get_translation_targets_for,
 )
+from app.services.gemini_client import get_gemini_client
 from app.services.generation.batch import BatchJobRunner
 
 # Import shared utilities
-from app.services.generation.media import get_audio_bytes_as_mp3, get_image_bytes_as_webp
+from app.services.generation.media import (
+    MP3_VBR_QUALITY,
+    get_audio_bytes_as_mp3,
+    get_image_bytes_as_webp,
+    split_pcm_on_silence,
+)
+from app.services.generation.rate_limit import AsyncRateLimiter, call_with_retry
 from app.services.storage import (
     upload_sentence_audio,
     upload_word_audio,
@@ -60,6 +83,9 @@ from app.services.storage import (
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Per-request client logging is noise at deck scale
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 # ============================================
 # CONFIGURATION
 # ============================================
@@ -72,36 +98,88 @@ CONVEX_DEPLOY_KEY = os.getenv("CONVEX_DEPLOY_KEY")  # For admin mutations
 TEXT_MODEL = "gemini-3-flash-preview"
 TTS_MODEL = "gemini-2.5-flash-preview-tts"
 IMAGE_MODEL = "gemini-2.5-flash-image"
+IMAGE_ASPECT_RATIO = "1:1"  # Flashcard images are square
 
 # Batch settings
 WORDS_PER_PROMPT = 20  # Number of words to batch in one prompt
+GROUPS_PER_REQUEST = 4  # Number of word groups packed into one sync API request
+BATCH_JOB_WORDS = 10_000  # Max words per Batch API job (streamed input is split into jobs)
 BATCH_API_URL = "https://generativelanguage.googleapis.com/v1beta"
 
+# Concurrent in-flight Gemini requests per media stage
+# (TTS defaults lower - it has a tighter concurrent-request cap)
+TTS_CONCURRENCY = int(os.getenv("GEMINI_TTS_CONCURRENCY", "4"))
+IMAGE_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "8"))
+
+# Requests per minute per media model (limited client-side; 429/5xx are retried)
+TTS_RPM = int(os.getenv("GEMINI_TTS_RPM", "10"))
+IMAGE_RPM = int(os.getenv("GEMINI_IMAGE_RPM", "60"))
+
+# Sentences read per TTS request; the returned audio is split back apart on
+# the pauses between them. Set TTS_BATCH_SIZE=1 for one request per sentence.
+TTS_BATCH_SIZE = int(os.getenv("TTS_BATCH_SIZE", "5"))
+
+# Log media progress every N words (per-word lines are DEBUG only)
+PROGRESS_LOG_EVERY = 25
+
+# Words queued for each media stage, and words in flight per stage. The CSV
+# reader waits once these are full, so memory stays bounded for any input size.
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "1000"))
+PIPELINE_MAX_IN_FLIGHT = int(os.getenv("PIPELINE_MAX_IN_FLIGHT", "200"))
+
+# Recent TTS inputs whose R2 URL is reused when they repeat within a run
+AUDIO_DEDUP_SIZE = int(os.getenv("AUDIO_DEDUP_SIZE", "10000"))
+
 # Output directory for generated media
 OUTPUT_DIR = Path(__file__).parent.parent / "generated"
 
-# ============================================
-# DATA CLASSES
-# ============================================
+# On-disk cache of generated media bytes, keyed by a hash of everything that
+# determines the output, so re-runs only call Gemini for new content.
+# Set MEDIA_CACHE=0 to always regenerate.
+MEDIA_CACHE_DIR = OUTPUT_DIR / "cache"
+MEDIA_CACHE_ENABLED = os.getenv("MEDIA_CACHE", "1") != "0"
 
 
-@dataclass
-class VocabWord:
-    """A vocabulary word to generate content for"""
+def get_client() -> genai.Client:
+    """Shared Gemini client, so concurrent requests reuse one connection pool"""
+    return get_gemini_client(GEMINI_API_KEY)
 
-    id: str  # Convex ID or local ID
-    word: str
-    reading: str | None = None
-    definitions: list[str] = None
-    language: str = "japanese"
-    level: str = "N5"
 
-    # Generated content
-    sentence: str | None = None
-    sentence_translations: dict[str, str] | None = None  # {"en": "...", "ja": "...", "fr": "..."}
-    audio_url: str | None = None  # R2 URL for sentence audio
-    word_audio_url: str | None = None  # R2 URL for word audio
-    image_url: str | None = None  # R2 URL for image
+def media_cache_key(*parts: object) -> str:
+    """Content hash of the inputs that determine a generated media file"""
+    return hashlib.blake2b("\x1f".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+
+
+def read_media_cache(kind: str, key: str) -> bytes | None:
+    """Cached media bytes, or None on a miss"""
+    if not MEDIA_CACHE_ENABLED:
+        return None
+    try:
+        return (MEDIA_CACHE_DIR / kind / key).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+@functools.cache
+def ensure_dir(path: Path) -> Path:
+    """Create a directory once per process (not once per file written to it)"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def write_media_cache(kind: str, key: str, data: bytes):
+    """Store media bytes atomically (concurrent writers may race on a key)"""
+    if not MEDIA_CACHE_ENABLED:
+        return
+    path = ensure_dir(MEDIA_CACHE_DIR / kind) / key
+    tmp_path = path.with_name(f"{key}.{os.getpid()}.{id(data)}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+# ============================================
+# DATA CLASSES
+# ============================================
 
 
 @dataclass
@@ -264,6 +342,29 @@ Use ISO language codes as keys: {", ".join(translation_iso_codes)}
     return prompt
 
 
+def build_grouped_contents(
+    groups: list[list[VocabWord]], level: str, language: str
+) -> types.Content:
+    """
+    Pack several word groups into a single request.
+
+    Each group's prompt becomes its own content part, and the model answers
+    with one JSON array per group (an array of arrays), so one round trip
+    covers len(groups) * WORDS_PER_PROMPT words.
+    """
+    intro = f"""You will receive {len(groups)} groups of vocabulary words, each with its own instructions.
+
+Respond with a JSON array containing exactly {len(groups)} arrays, one per group, in the same order as the groups.
+Each inner array must follow that group's instructions."""
+
+    parts = [types.Part.from_text(text=intro)]
+    for n, group in enumerate(groups):
+        group_prompt = build_multi_word_prompt(group, level, language)
+        parts.append(types.Part.from_text(text=f"GROUP {n + 1}:\n{group_prompt}"))
+
+    return types.Content(role="user", parts=parts)
+
+
 async def generate_sentences_batch(
     words: list[VocabWord],
     level: str,
@@ -303,38 +404,43 @@ async def _generate_sentences_sync(
     Generate sentences using synchronous API calls.
     Better for small batches where speed matters more than cost.
     """
-    client = genai.Client(api_key=GEMINI_API_KEY)
+    client = get_client()
     results = []
 
-    # Process in batches of WORDS_PER_PROMPT
-    for i in range(0, len(words), WORDS_PER_PROMPT):
-        batch = words[i : i + WORDS_PER_PROMPT]
-        logger.info(f"Processing batch {i // WORDS_PER_PROMPT + 1}: {len(batch)} words")
-
-        prompt = build_multi_word_prompt(batch, level, language)
+    # Process in requests of GROUPS_PER_REQUEST groups of WORDS_PER_PROMPT words
+    request_size = WORDS_PER_PROMPT * GROUPS_PER_REQUEST
+    for i in range(0, len(words), request_size):
+        batch = words[i : i + request_size]
+        groups = [batch[j : j + WORDS_PER_PROMPT] for j in range(0, len(batch), WORDS_PER_PROMPT)]
+        logger.info(
+            f"Processing request {i // request_size + 1}: {len(groups)} groups, {len(batch)} words"
+        )
 
         try:
-            response = client.models.generate_content(
+            response = await client.aio.models.generate_content(
                 model=TEXT_MODEL,
-                contents=prompt,
+                contents=build_grouped_contents(groups, level, language),
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json",
-                    response_schema=list[SentenceOutputItem],
+                    response_schema=list[list[SentenceOutputItem]],
                 ),
             )
 
-            sentences_data = json.loads(response.text)
+            groups_data = json.loads(response.text)
 
-            for item in sentences_data:
-                results.append(
-                    GeneratedSentence(
-                        word=item["word"],
-                        sentence=item["sentence"],
-                        translations=item.get("translations", {}),
+            generated = 0
+            for group_data in groups_data:
+                for item in group_data:
+                    results.append(
+                        GeneratedSentence(
+                            word=item["word"],
+                            sentence=item["sentence"],
+                            translations=item.get("translations", {}),
+                        )
                     )
-                )
+                    generated += 1
 
-            logger.info(f"  Generated {len(sentences_data)} sentences")
+            logger.info(f"  Generated {generated} sentences")
 
         except Exception as e:
             logger.error(f"  Batch failed: {e}")
@@ -432,6 +538,207 @@ Make sentences appropriate for the specified difficulty level."""
 
 TTS_VOICES = ["Leda", "Aoede", "Alnilam", "Rasalgethi"]
 
+# Shared across all concurrent TTS requests in the process
+AUDIO_LIMITER = AsyncRateLimiter(TTS_RPM, 60)
+
+TTS_PROMPT = "Read aloud clearly and slowly for language learners:\n\n{text}"
+
+# Multi-sentence prompt used by synthesize_mp3_batch ({numbered}: "1. ...\n2. ...")
+TTS_BATCH_PROMPT = (
+    "Read each numbered sentence aloud clearly and slowly for language learners, "
+    "pausing for one second between sentences. Do not read the numbers.\n\n"
+    "{numbered}"
+)
+
+
+@functools.cache
+def tts_config(voice: str) -> types.GenerateContentConfig:
+    """Gemini TTS request config for a prebuilt voice (built once per voice)"""
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name=voice,
+                )
+            )
+        ),
+    )
+
+
+def tts_cache_key(text: str, voice: str, batched: bool = False) -> str:
+    """
+    Media cache key for the MP3 of one utterance.
+
+    batched keys clips split out of a TTS_BATCH_PROMPT render, so they are
+    never served in place of a single-utterance render.
+    """
+    # MP3_VBR_QUALITY is None when encoding CBR at the helper's default bitrate
+    prompt = TTS_BATCH_PROMPT if batched else TTS_PROMPT
+    return media_cache_key(TTS_MODEL, voice, prompt, text, MP3_VBR_QUALITY)
+
+
+async def synthesize_mp3(text: str, voice: str) -> bytes:
+    """
+    Generate speech for text with Gemini TTS and return it as MP3 bytes.
+
+    Results are cached on disk by (model, voice, prompt, encoding), so
+    re-running a deck skips the TTS call for text it has seen before.
+    """
+    prompt = TTS_PROMPT.format(text=text)
+
+    cache_key = tts_cache_key(text, voice)
+    cached = await asyncio.to_thread(read_media_cache, "audio", cache_key)
+    if cached is not None:
+        return cached
+
+    client = get_client()
+    response = await call_with_retry(
+        lambda: client.aio.models.generate_content(
+            model=TTS_MODEL,
+            contents=prompt,
+            config=tts_config(voice),
+        ),
+        limiter=AUDIO_LIMITER,
+    )
+
+    # Extract PCM audio data
+    pcm_data = response.candidates[0].content.parts[0].inline_data.data
+
+    # Convert to MP3 in memory (off the event loop - ffmpeg encode blocks)
+    mp3_bytes = await asyncio.to_thread(get_audio_bytes_as_mp3, pcm_data)
+
+    await asyncio.to_thread(write_media_cache, "audio", cache_key, mp3_bytes)
+    return mp3_bytes
+
+
+async def synthesize_mp3_batch(texts: list[str], voice: str) -> list[bytes]:
+    """
+    Generate speech for several sentences with one Gemini TTS request.
+
+    The sentences are read as a numbered list with pauses between them and
+    the returned PCM is split on those pauses. If the split doesn't yield
+    one clip per sentence, each uncached sentence is synthesized separately.
+    Split clips are cached under their own batched keys; a cached
+    single-utterance render from synthesize_mp3 is used when there is one.
+
+    Returns:
+        MP3 bytes for each text, in order
+    """
+    cache_keys = [tts_cache_key(text, voice, batched=True) for text in texts]
+
+    def read_cached(i: int) -> bytes | None:
+        cached = read_media_cache("audio", tts_cache_key(texts[i], voice))
+        return cached if cached is not None else read_media_cache("audio", cache_keys[i])
+
+    results = list(
+        await asyncio.gather(*(asyncio.to_thread(read_cached, i) for i in range(len(texts))))
+    )
+    missing = [i for i, mp3 in enumerate(results) if mp3 is None]
+
+    if len(missing) == 1:
+        results[missing[0]] = await synthesize_mp3(texts[missing[0]], voice)
+    elif missing:
+        numbered = "\n".join(f"{n}. {texts[i]}" for n, i in enumerate(missing, 1))
+        prompt = TTS_BATCH_PROMPT.format(numbered=numbered)
+
+        client = get_client()
+        response = await call_with_retry(
+            lambda: client.aio.models.generate_content(
+                model=TTS_MODEL,
+                contents=prompt,
+                config=tts_config(voice),
+            ),
+            limiter=AUDIO_LIMITER,
+        )
+        pcm_data = response.candidates[0].content.parts[0].inline_data.data
+
+        segments = await asyncio.to_thread(split_pcm_on_silence, pcm_data, len(missing))
+        if segments is None:
+            logger.warning(
+                f"Batched TTS split failed for {len(missing)} sentences, "
+                "falling back to one request per sentence"
+            )
+            clips = await asyncio.gather(*(synthesize_mp3(texts[i], voice) for i in missing))
+        else:
+            clips = await asyncio.gather(
+                *(asyncio.to_thread(get_audio_bytes_as_mp3, segment) for segment in segments)
+            )
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(write_media_cache, "audio", cache_keys[i], clip)
+                    for i, clip in zip(missing, clips, strict=True)
+                )
+            )
+
+        for i, clip in zip(missing, clips, strict=True):
+            results[i] = clip
+
+    return results
+
+
+class SentenceAudioBatcher:
+    """
+    Groups concurrent sentence TTS requests into multi-utterance calls.
+
+    Requests are held until batch_size are waiting or `linger` seconds have
+    passed since the first one, then synthesized together with
+    synthesize_mp3_batch. Each batch holds one slot of `semaphore`.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        semaphore: asyncio.Semaphore,
+        voice: str = "Aoede",
+        linger: float = 0.05,
+    ):
+        self.batch_size = batch_size
+        self.semaphore = semaphore
+        self.voice = voice
+        self.linger = linger
+        self._pending: list[tuple[str, asyncio.Future[bytes]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def synthesize(self, text: str) -> bytes:
+        """MP3 bytes for one sentence, synthesized as part of a batch"""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bytes] = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.linger, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[bytes]]]):
+        try:
+            async with self.semaphore:
+                clips = await synthesize_mp3_batch([text for text, _ in batch], self.voice)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), clip in zip(batch, clips, strict=True):
+            if not future.done():
+                future.set_result(clip)
+
 
 async def generate_sentence_audio(
     text: str,
@@ -439,43 +746,27 @@ async def generate_sentence_audio(
     language: str,
     item_id: str,
     voice: str = "Aoede",
+    batcher: SentenceAudioBatcher | None = None,
 ) -> str | None:
     """
     Generate audio for a sentence using Gemini TTS and upload to R2.
 
+    With a batcher (using the same voice), the sentence is synthesized
+    together with other pending sentences in one TTS request.
+
     Returns R2 URL or None if failed.
     """
     if not GEMINI_API_KEY:
         return None
 
-    client = genai.Client(api_key=GEMINI_API_KEY)
-
     try:
-        prompt = f"Read aloud clearly and slowly for language learners:\n\n{text}"
-
-        response = client.models.generate_content(
-            model=TTS_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=voice,
-                        )
-                    )
-                ),
-            ),
-        )
-
-        # Extract PCM audio data
-        pcm_data = response.candidates[0].content.parts[0].inline_data.data
-
-        # Convert to MP3 in memory
-        mp3_bytes = get_audio_bytes_as_mp3(pcm_data, bitrate="64k")
+        if batcher is not None and batcher.voice == voice:
+            mp3_bytes = await batcher.synthesize(text)
+        else:
+            mp3_bytes = await synthesize_mp3(text, voice)
 
         # Upload to R2
-        url = upload_sentence_audio(mp3_bytes, word, language, item_id)
+        url = await asyncio.to_thread(upload_sentence_audio, mp3_bytes, word, language, item_id)
         return url
 
     except Exception as e:
@@ -496,34 +787,11 @@ async def generate_word_audio(
     if not GEMINI_API_KEY:
         return None
 
-    client = genai.Client(api_key=GEMINI_API_KEY)
-
     try:
-        prompt = f"Read aloud clearly and slowly for language learners:\n\n{word}"
-
-        response = client.models.generate_content(
-            model=TTS_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=voice,
-                        )
-                    )
-                ),
-            ),
-        )
-
-        # Extract PCM audio data
-        pcm_data = response.candidates[0].content.parts[0].inline_data.data
-
-        # Convert to MP3 in memory
-        mp3_bytes = get_audio_bytes_as_mp3(pcm_data, bitrate="64k")
+        mp3_bytes = await synthesize_mp3(word, voice)
 
         # Upload to R2
-        url = upload_word_audio(mp3_bytes, word, language)
+        url = await asyncio.to_thread(upload_word_audio, mp3_bytes, word, language)
         return url
 
     except Exception as e:
@@ -535,6 +803,9 @@ async def generate_word_audio(
 # IMAGE GENERATION (uploads directly to R2)
 # ============================================
 
+# Shared across all concurrent image requests in the process
+IMAGE_LIMITER = AsyncRateLimiter(IMAGE_RPM, 60)
+
 
 async def generate_image(
     word: str, sentence: str, language: str, image_id: str, max_size: int = 400, quality: int = 80
@@ -547,7 +818,7 @@ async def generate_image(
     if not GEMINI_API_KEY:
         return None
 
-    client = genai.Client(api_key=GEMINI_API_KEY)
+    client = get_client()
     lang_name = LANGUAGE_NAMES.get(language, "Japanese")
 
     prompt = f"""Generate a simple, memorable illustration for a {lang_name} vocabulary flashcard.
@@ -566,22 +837,36 @@ The image should:
 Style: Simple vector-like illustration with clean lines."""
 
     try:
-        response = client.models.generate_content(
-            model=IMAGE_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=["IMAGE"],
-            ),
-        )
+        # Re-runs reuse the cached WebP for an identical prompt and settings
+        cache_key = media_cache_key(IMAGE_MODEL, IMAGE_ASPECT_RATIO, prompt, max_size, quality)
+        webp_bytes = await asyncio.to_thread(read_media_cache, "images", cache_key)
+
+        if webp_bytes is None:
+            response = await call_with_retry(
+                lambda: client.aio.models.generate_content(
+                    model=IMAGE_MODEL,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        response_modalities=["IMAGE"],
+                        # Square 1K is the smallest output Gemini offers (no sub-1K
+                        # sizes); pinning it keeps the payload at that size
+                        image_config=types.ImageConfig(aspect_ratio=IMAGE_ASPECT_RATIO),
+                    ),
+                ),
+                limiter=IMAGE_LIMITER,
+            )
 
-        # Extract image data
-        image_data = response.candidates[0].content.parts[0].inline_data.data
+            # Extract image data
+            image_data = response.candidates[0].content.parts[0].inline_data.data
 
-        # Compress to WebP in memory
-        webp_bytes = get_image_bytes_as_webp(image_data, quality=quality, max_size=max_size)
+            # Compress to WebP in memory (off the event loop - PIL encode blocks)
+            webp_bytes = await asyncio.to_thread(
+                get_image_bytes_as_webp, image_data, quality=quality, max_size=max_size
+            )
+            await asyncio.to_thread(write_media_cache, "images", cache_key, webp_bytes)
 
         # Upload to R2
-        url = upload_word_image(webp_bytes, word, language, image_id)
+        url = await asyncio.to_thread(upload_word_image, webp_bytes, word, language, image_id)
         return url
 
     except Exception as e:
@@ -590,75 +875,88 @@ Style: Simple vector-like illustration with clean lines."""
 
 
 # ============================================
-# CSV IMPORT
+# OUTPUT MANAGEMENT (optional, for debugging)
 # ============================================
 
+# Output directory for results JSON (if save_results is enabled)
+OUTPUT_DIR = Path(__file__).parent.parent / "generated"
 
-def load_words_from_csv(csv_path: Path, language: str, level: str) -> list[VocabWord]:
-    """Load vocabulary words from a CSV file"""
-    words = []
-
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-
-        for i, row in enumerate(reader):
-            # Flexible column names
-            word = row.get("word") or row.get("expression") or row.get("kanji") or ""
-            reading = row.get("reading") or row.get("kana") or row.get("hiragana")
-            definition = row.get("definition") or row.get("meaning") or row.get("english") or ""
-
-            if not word.strip():
-                continue
+# Checkpoint log in OUTPUT_DIR: one JSON line per word as soon as all its
+# stages finish, so an interrupted run can be resumed (--resume)
+RESULTS_CHECKPOINT = "results.jsonl"
 
-            words.append(
-                VocabWord(
-                    id=f"csv_{i}",
-                    word=word.strip(),
-                    reading=reading.strip() if reading else None,
-                    definitions=[definition.strip()] if definition else [],
-                    language=language,
-                    level=level,
-                )
-            )
 
-    logger.info(f"Loaded {len(words)} words from {csv_path}")
-    return words
+def result_record(w: VocabWord) -> dict:
+    """Metadata saved for a processed word"""
+    return {
+        "id": w.id,
+        "word": w.word,
+        "reading": w.reading,
+        "definitions": w.definitions,
+        "language": w.language,
+        "level": w.level,
+        "sentence": w.sentence,
+        "translations": w.sentence_translations or {},
+        "audioUrl": w.audio_url,
+        "wordAudioUrl": w.word_audio_url,
+        "imageUrl": w.image_url,
+    }
 
 
-# ============================================
-# OUTPUT MANAGEMENT (optional, for debugging)
-# ============================================
+def dump_json(record: dict) -> bytes:
+    """Serialize a record as compact UTF-8 JSON (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode()
 
-# Output directory for results JSON (if save_results is enabled)
-OUTPUT_DIR = Path(__file__).parent.parent / "generated"
 
+def load_checkpoint(path: Path) -> dict[tuple[str, str], dict]:
+    """
+    Latest checkpoint record per (id, word).
 
-def save_results_json(words: list[VocabWord], output_path: Path):
+    A partially written last line (from a crash mid-write) is skipped.
+    """
+    records = {}
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[(record["id"], record["word"])] = record
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def restore_from_record(w: VocabWord, record: dict):
+    """Copy generated content from a checkpoint record onto a word"""
+    w.sentence = record.get("sentence") or w.sentence
+    w.sentence_translations = record.get("translations") or w.sentence_translations
+    w.audio_url = record.get("audioUrl") or w.audio_url
+    w.word_audio_url = record.get("wordAudioUrl") or w.word_audio_url
+    w.image_url = record.get("imageUrl") or w.image_url
+
+
+def save_results_json(records: Iterable[bytes], output_path: Path):
     """
     Save generated content to JSON for reference/debugging.
     Note: Media is already uploaded to R2, this just saves metadata.
-    """
-    data = []
-    for w in words:
-        data.append(
-            {
-                "id": w.id,
-                "word": w.word,
-                "reading": w.reading,
-                "definitions": w.definitions,
-                "language": w.language,
-                "level": w.level,
-                "sentence": w.sentence,
-                "translations": w.sentence_translations or {},
-                "audioUrl": w.audio_url,
-                "wordAudioUrl": w.word_audio_url,
-                "imageUrl": w.image_url,
-            }
-        )
 
+    Records are already-serialized JSON lines (e.g. read back from the
+    results.jsonl checkpoint) and are streamed to disk one per line, so the
+    words never have to be held in memory.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(output_path, "wb") as f:
+        f.write(b"[\n")
+        for i, record in enumerate(records):
+            if i:
+                f.write(b",\n")
+            f.write(b"  ")
+            f.write(record.rstrip(b"\n"))
+        f.write(b"\n]\n")
 
     logger.info(f"Results saved to {output_path}")
 
@@ -669,101 +967,299 @@ def save_results_json(words: list[VocabWord], output_path: Path):
 
 
 async def run_pipeline(
-    words: list[VocabWord],
+    words: Iterable[VocabWord],
     generate_sentences: bool = True,
     generate_audio_flag: bool = False,
     generate_images_flag: bool = False,
     count: int | None = None,
     use_batch_api: bool = True,
     save_results: bool = True,
+    resume: bool = False,
 ):
     """
     Run the generation pipeline.
     All media is uploaded directly to R2 during generation.
+
+    `words` may be a lazy iterable (e.g. streamed from a large CSV). It is
+    read one group at a time, so generation starts before it is exhausted.
+    Reading waits while the media stages are backed up, and each word is
+    dropped once all its stages finish, so memory does not grow with the
+    size of the input.
+
+    With save_results, each finished word is appended to the results.jsonl
+    checkpoint, and results.json is written from this run's checkpoint lines
+    at the end. With resume, words found there get their saved content back
+    and only run the stages they are still missing.
+
+    Returns the number of words processed.
     """
 
     # Limit count if specified
-    if count and count < len(words):
-        words = words[:count]
+    pending = iter(words)
+    if count:
+        pending = itertools.islice(pending, count)
+
+    processed = 0
+    sentences_done = 0
+
+    checkpoint_path = OUTPUT_DIR / RESULTS_CHECKPOINT
+    resumed = load_checkpoint(checkpoint_path) if resume and save_results else {}
+    if resumed:
+        logger.info(f"Resuming from {checkpoint_path} ({len(resumed)} words)")
+    restored: set[int] = set()  # id() of in-progress words restored from the checkpoint
+
+    # Stages run as a producer/consumer pipeline: as soon as a group of words has
+    # sentences, audio and image generation for those words can start. The
+    # queues are bounded so the producer waits for the consumers to catch up.
+    consumer_queues: list[asyncio.Queue[VocabWord | None]] = []
+    audio_q: asyncio.Queue[VocabWord | None] = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+    images_q: asyncio.Queue[VocabWord | None] = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+    if generate_audio_flag:
+        consumer_queues.append(audio_q)
+    if generate_images_flag:
+        consumer_queues.append(images_q)
+
+    # id(word) -> media stages still running for it
+    remaining: dict[int, int] = {}
+
+    def finish(w: VocabWord):
+        """Mark one stage done for a word; checkpoint it once all are"""
+        left = remaining.pop(id(w), 1) - 1
+        if left > 0:
+            remaining[id(w)] = left
+            return
+        # Nothing refers to the word after this, so its id() may be reused
+        restored.discard(id(w))
+        if checkpoint is not None:
+            checkpoint.write(dump_json(result_record(w)) + b"\n")
+            checkpoint.flush()
+
+    async def enqueue(batch: list[VocabWord]):
+        for w in batch:
+            if w.sentence and consumer_queues:
+                remaining[id(w)] = len(consumer_queues)
+                for q in consumer_queues:
+                    await q.put(w)
+            else:
+                finish(w)
+
+    # Step 1: Generate sentences (producer)
+    async def produce_sentences():
+        nonlocal processed, sentences_done
+
+        if generate_sentences:
+            logger.info("=== Generating Sentences ===")
+
+        # Batch API jobs take many words at once; the sync API can hand off
+        # each request's groups as soon as it completes
+        group_size = BATCH_JOB_WORDS if use_batch_api else WORDS_PER_PROMPT * GROUPS_PER_REQUEST
+
+        # Pulling a group may parse the next CSV chunk, so do it off the loop
+        while group := await asyncio.to_thread(list, itertools.islice(pending, group_size)):
+            processed += len(group)
+
+            for w in group:
+                record = resumed.pop((w.id, w.word), None)
+                if record:
+                    restore_from_record(w, record)
+                    restored.add(id(w))
+
+            # Resumed words keep their saved sentences
+            todo = [w for w in group if not (id(w) in restored and w.sentence)]
+            if generate_sentences and todo:
+                # Get level from first word (assuming all same level)
+                sentences = await generate_sentences_batch(
+                    todo, todo[0].level, todo[0].language, use_batch_api=use_batch_api
+                )
 
-    logger.info(f"Processing {len(words)} words")
+                # Match results back to words
+                word_map = {w.word: w for w in todo}
+                for sent in sentences:
+                    if sent.word in word_map and sent.sentence:
+                        word_map[sent.word].sentence = sent.sentence
+                        word_map[sent.word].sentence_translations = sent.translations
 
-    # Get level from first word (assuming all same level)
-    level = words[0].level if words else "N5"
-    language = words[0].language if words else "japanese"
+            sentences_done += sum(1 for w in group if w.sentence)
+            await enqueue(group)
 
-    # Step 1: Generate sentences
-    if generate_sentences:
-        logger.info("=== Generating Sentences ===")
-        sentences = await generate_sentences_batch(
-            words, level, language, use_batch_api=use_batch_api
-        )
+        logger.info(f"Processed {processed} words")
+        if generate_sentences:
+            logger.info(f"Sentences generated: {sentences_done}/{processed}")
 
-        # Match results back to words
-        word_map = {w.word: w for w in words}
-        for sent in sentences:
-            if sent.word in word_map and sent.sentence:
-                word_map[sent.word].sentence = sent.sentence
-                word_map[sent.word].sentence_translations = sent.translations
+        # Sentinel: tell each consumer no more words are coming (if this task
+        # fails instead, the TaskGroup cancels the consumers)
+        for q in consumer_queues:
+            await q.put(None)
 
-        success = sum(1 for w in words if w.sentence)
-        logger.info(f"Sentences generated: {success}/{len(words)}")
+    async def consume(q: asyncio.Queue[VocabWord | None], handle):
+        """Run handle(word) for each queued word, at most PIPELINE_MAX_IN_FLIGHT at a time"""
+        in_flight = asyncio.Semaphore(PIPELINE_MAX_IN_FLIGHT)
 
-    # Step 2: Generate audio and upload to R2
-    if generate_audio_flag:
-        logger.info("=== Generating Audio (uploading to R2) ===")
+        async def run(w: VocabWord):
+            try:
+                await handle(w)
+            finally:
+                in_flight.release()
+
+        async with asyncio.TaskGroup() as tg:
+            while True:
+                # Stop taking words while the stage is full, so the queue backs up
+                await in_flight.acquire()
+                w = await q.get()
+                if w is None:
+                    break
+                tg.create_task(run(w))
+
+    audio_sem = asyncio.Semaphore(TTS_CONCURRENCY)
+    image_sem = asyncio.Semaphore(IMAGE_CONCURRENCY)
+
+    # Identical TTS inputs (repeated words or sentences in a deck) are generated
+    # and uploaded once while they are among the last AUDIO_DEDUP_SIZE inputs;
+    # later occurrences reuse the same R2 URL
+    audio_tasks: OrderedDict[tuple[str, str, str], asyncio.Task[str | None]] = OrderedDict()
+    audio_requests = 0
+
+    # Sentence audio is batched into multi-utterance TTS requests; the batcher
+    # takes audio_sem per request rather than per sentence
+    sentence_batcher = (
+        SentenceAudioBatcher(TTS_BATCH_SIZE, audio_sem) if TTS_BATCH_SIZE > 1 else None
+    )
 
-        for i, w in enumerate(words):
-            if not w.sentence:
-                continue
+    def shared_audio(
+        key: tuple[str, str, str], make_coro, limit: bool = True
+    ) -> asyncio.Task[str | None]:
+        nonlocal audio_requests
 
-            logger.info(f"[{i + 1}/{len(words)}] Audio for: {w.word}")
+        task = audio_tasks.get(key)
+        if task is not None:
+            audio_tasks.move_to_end(key)
+            return task
 
-            # Sentence audio -> R2
-            audio_url = await generate_sentence_audio(
-                text=w.sentence,
-                word=w.word,
-                language=w.language,
-                item_id=w.id,
-            )
-            if audio_url:
-                w.audio_url = audio_url
-                logger.info(f"  Sentence audio uploaded: {audio_url}")
+        async def limited():
+            async with audio_sem:
+                return await make_coro()
+
+        task = audio_tasks[key] = asyncio.create_task(limited() if limit else make_coro())
+        audio_requests += 1
+        if len(audio_tasks) > AUDIO_DEDUP_SIZE:
+            audio_tasks.popitem(last=False)
+        return task
+
+    # Step 2: Generate audio and upload to R2 (consumer)
+    audio_done = 0
 
+    async def audio_for(w: VocabWord):
+        nonlocal audio_done
+
+        # Resumed words keep audio they already have
+        if id(w) in restored and w.audio_url and w.word_audio_url:
+            finish(w)
+            return
+
+        # Sentence and word audio run concurrently (bounded by audio_sem)
+        audio_url, word_audio_url = await asyncio.gather(
+            # Sentence audio -> R2
+            shared_audio(
+                ("sentence", w.language, w.sentence),
+                lambda: generate_sentence_audio(
+                    text=w.sentence,
+                    word=w.word,
+                    language=w.language,
+                    item_id=w.id,
+                    batcher=sentence_batcher,
+                ),
+                limit=sentence_batcher is None,
+            ),
             # Word-only audio -> R2
-            word_audio_url = await generate_word_audio(
-                word=w.word,
-                language=w.language,
-            )
-            if word_audio_url:
-                w.word_audio_url = word_audio_url
-                logger.info(f"  Word audio uploaded: {word_audio_url}")
+            shared_audio(
+                ("word", w.language, w.word),
+                lambda: generate_word_audio(
+                    word=w.word,
+                    language=w.language,
+                ),
+            ),
+        )
+        if audio_url:
+            w.audio_url = audio_url
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"  Sentence audio for {w.word}: {audio_url}")
+        if word_audio_url:
+            w.word_audio_url = word_audio_url
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"  Word audio for {w.word}: {word_audio_url}")
+
+        finish(w)
+        audio_done += 1
+        if audio_done % PROGRESS_LOG_EVERY == 0:
+            logger.info(f"Audio progress: {audio_done} words")
+
+    async def consume_audio():
+        logger.info("=== Generating Audio (uploading to R2) ===")
 
-    # Step 3: Generate images and upload to R2
-    if generate_images_flag:
-        logger.info("=== Generating Images (uploading to R2) ===")
+        await consume(audio_q, audio_for)
+
+        logger.info(f"Audio requests: {audio_requests} for {audio_done} words")
+
+    # Step 3: Generate images and upload to R2 (consumer)
+    images_done = 0
 
-        for i, w in enumerate(words):
-            if not w.sentence:
-                continue
+    async def image_for(w: VocabWord):
+        nonlocal images_done
 
-            logger.info(f"[{i + 1}/{len(words)}] Image for: {w.word}")
+        # Resumed words keep images they already have
+        if id(w) in restored and w.image_url:
+            finish(w)
+            return
 
+        async with image_sem:
             image_url = await generate_image(
                 word=w.word,
                 sentence=w.sentence,
                 language=w.language,
                 image_id=w.id,
             )
-            if image_url:
-                w.image_url = image_url
-                logger.info(f"  Image uploaded: {image_url}")
+        if image_url:
+            w.image_url = image_url
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"  Image for {w.word}: {image_url}")
+
+        finish(w)
+        images_done += 1
+        if images_done % PROGRESS_LOG_EVERY == 0:
+            logger.info(f"Image progress: {images_done} words")
+
+    async def consume_images():
+        logger.info("=== Generating Images (uploading to R2) ===")
 
-    # Save results (optional, for debugging)
+        await consume(images_q, image_for)
+
+        logger.info(f"Images done: {images_done} words")
+
+    with contextlib.ExitStack() as stack:
+        checkpoint = None
+        if save_results:
+            checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            checkpoint = stack.enter_context(open(checkpoint_path, "ab" if resume else "wb"))
+            run_start = checkpoint.tell()  # This run's records follow any resumed ones
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce_sentences())
+            if generate_audio_flag:
+                tg.create_task(consume_audio())
+            if generate_images_flag:
+                tg.create_task(consume_images())
+
+    if not processed:
+        logger.error("No words to process")
+        return processed
+
+    # Save results (optional, for debugging), streamed from this run's checkpoint lines
     if save_results:
-        save_results_json(words, OUTPUT_DIR / "results.json")
+        with open(checkpoint_path, "rb") as f:
+            f.seek(run_start)
+            save_results_json(f, OUTPUT_DIR / "results.json")
 
-    return words
+    return processed
 
 
 # ============================================
@@ -793,23 +1289,32 @@ def main():
         action="store_true",
         help="Don't save results.json (all media goes directly to R2)",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Skip work already recorded in generated/{RESULTS_CHECKPOINT} by an interrupted run",
+    )
 
     args = parser.parse_args()
+    if args.resume and args.no_save:
+        # The checkpoint is only kept when saving, so nothing would be skipped
+        parser.error("--resume needs the results checkpoint and can't be used with --no-save")
 
-    # Load words
+    # Stream words (generation starts while the rest of the CSV is read)
     if args.import_csv:
-        words = load_words_from_csv(args.import_csv, args.language, args.level)
+        words = (
+            w
+            for chunk in iter_words_from_csv(args.import_csv, args.language, args.level)
+            for w in chunk
+        )
     else:
         # TODO: Load from Convex
         logger.error("Either --import-csv or Convex integration required")
         return
 
-    if not words:
-        logger.error("No words to process")
-        return
-
-    # Run pipeline
-    asyncio.run(
+    # Run pipeline (on uvloop when installed)
+    run_async = uvloop.run if uvloop is not None else asyncio.run
+    run_async(
         run_pipeline(
             words=words,
             generate_sentences=args.type in ["sentences", "all"],
@@ -818,6 +1323,7 @@ def main():
             count=args.count,
             use_batch_api=not args.no_batch_api,
             save_results=not args.no_save,
+            resume=args.resume,
         )
     )
 
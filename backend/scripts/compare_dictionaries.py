@@ -5,6 +5,7 @@ Compare different MeCab dictionaries for Japanese tokenization quality.
 Tests: ipadic, unidic-lite, unidic (full)
 """
 
+import re
 import sys
 
 sys.path.insert(0, ".")
@@ -42,6 +43,12 @@ KATAKANA = [
     "コンピューター",
 ]
 
+# Katakana ァ-ヶ -> hiragana ぁ-ゖ (same offset for the whole block)
+KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+
+# Hiragana, katakana, or CJK unified ideographs
+JAPANESE_RE = re.compile(r"[\u3040-\u30FF\u4E00-\u9FFF]")
+
 
 def get_reading(tagger, word, dict_type):
     """Get reading for a word from the tagger."""
@@ -74,23 +81,12 @@ def katakana_to_hiragana(text):
     """Convert katakana to hiragana."""
     if not text:
         return text
-    result = []
-    for char in text:
-        code = ord(char)
-        if 0x30A1 <= code <= 0x30F6:
-            result.append(chr(code - 0x60))
-        else:
-            result.append(char)
-    return "".join(result)
+    return text.translate(KATAKANA_TO_HIRAGANA)
 
 
 def is_japanese(text):
     """Check if text contains Japanese characters."""
-    for char in text:
-        code = ord(char)
-        if 0x3040 <= code <= 0x30FF or 0x4E00 <= code <= 0x9FFF:
-            return True
-    return False
+    return JAPANESE_RE.search(text) is not None
 
 
 def is_single_token(tagger, word):
@@ -15,7 +15,8 @@ Requirements:
 
 import json
 import sys
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import asdict, dataclass
 from typing import Any
 
 # Add parent directory to path for imports
@@ -80,74 +81,74 @@ BENCHMARK_CASES = [
 ]
 
 
+@dataclass
+class CaseResult:
+    """Outcome of a single benchmark case."""
+
+    word: str
+    category: str
+    passed: bool
+    is_single_token: bool
+    token_count: int
+    tokens: list[str]
+    expected_reading: str | None
+    actual_reading: str | None
+
+
 def run_benchmark(verbose: bool = False) -> dict[str, Any]:
     """Run the benchmark suite and return results."""
-    tokenizer = get_tokenizer_service()
-
-    results = {
-        "summary": {
-            "total": 0,
-            "passed": 0,
-            "failed": 0,
-        },
-        "by_category": {},
-        "details": [],
-    }
-
-    categories = {}
+    # Bound once; the loop below runs per case
+    tokenize = get_tokenizer_service().tokenize_text
 
+    case_results = []
     for case in BENCHMARK_CASES:
-        results["summary"]["total"] += 1
-
-        tokens = tokenizer.tokenize_text(case.word)
+        word = case.word
+        tokens = tokenize(word)
+        surfaces = [t.surface for t in tokens]
 
         # Evaluate results
-        is_single_token = len(tokens) == 1 and tokens[0].surface == case.word
-
-        reading = None
-        if tokens and tokens[0].parts:
-            reading = tokens[0].parts[0].reading
-
-        reading_correct = case.expected_reading is None or reading == case.expected_reading
-
-        passed = is_single_token and reading_correct
-
-        if passed:
-            results["summary"]["passed"] += 1
-        else:
-            results["summary"]["failed"] += 1
-
-        # Track by category
-        if case.category not in categories:
-            categories[case.category] = {"passed": 0, "total": 0, "cases": []}
-        categories[case.category]["total"] += 1
-        if passed:
-            categories[case.category]["passed"] += 1
-
-        detail = {
-            "word": case.word,
-            "category": case.category,
-            "passed": passed,
-            "is_single_token": is_single_token,
-            "token_count": len(tokens),
-            "tokens": [t.surface for t in tokens],
-            "expected_reading": case.expected_reading,
-            "actual_reading": reading,
-        }
+        is_single_token = surfaces == [word]
+        reading = tokens[0].parts[0].reading if tokens and tokens[0].parts else None
+        expected = case.expected_reading
+        passed = is_single_token and (expected is None or reading == expected)
+
+        case_results.append(
+            CaseResult(
+                word=word,
+                category=case.category,
+                passed=passed,
+                is_single_token=is_single_token,
+                token_count=len(tokens),
+                tokens=surfaces,
+                expected_reading=expected,
+                actual_reading=reading,
+            )
+        )
 
-        results["details"].append(detail)
-        categories[case.category]["cases"].append(detail)
+    details = [asdict(r) for r in case_results]
 
-    results["by_category"] = categories
+    # Track by category
+    categories = defaultdict(lambda: {"passed": 0, "total": 0, "cases": []})
+    for detail in details:
+        cat = categories[detail["category"]]
+        cat["total"] += 1
+        cat["passed"] += detail["passed"]
+        cat["cases"].append(detail)
 
     # Calculate percentages
-    total = results["summary"]["total"]
-    results["summary"]["pass_rate"] = results["summary"]["passed"] / total * 100 if total > 0 else 0
+    total = len(details)
+    passed_count = sum(cat["passed"] for cat in categories.values())
+    summary = {
+        "total": total,
+        "passed": passed_count,
+        "failed": total - passed_count,
+        "pass_rate": passed_count / total * 100 if total > 0 else 0,
+    }
 
     for cat in categories.values():
         cat["pass_rate"] = cat["passed"] / cat["total"] * 100 if cat["total"] > 0 else 0
 
-    return results
+    return {"summary": summary, "by_category": dict(categories), "details": details}
 
 
 def print_results(results: dict[str, Any], verbose: bool = False):
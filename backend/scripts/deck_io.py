@@ -0,0 +1,147 @@
+"""
+Deck CSV import.
+
+Kept as a small, fully-annotated module so it can be compiled to a C
+extension for large imports:
+
+    cd scripts && mypyc deck_io.py
+
+The compiled module is picked up transparently by `import deck_io`; the
+pure-Python source keeps working when it is not built.
+
+When pandas is installed, CSVs are parsed with its C reader by
+deck_io_pandas (a separate module, so this one compiles without pandas
+stubs). Without it, the stdlib csv reader is used.
+"""
+
+from __future__ import annotations
+
+import csv
+import importlib.util
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+# Optional: falls back to the csv module
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VocabWord:
+    """A vocabulary word to generate content for"""
+
+    id: str  # Convex ID or local ID
+    word: str
+    reading: str | None = None
+    definitions: list[str] | None = None
+    language: str = "japanese"
+    level: str = "N5"
+
+    # Generated content
+    sentence: str | None = None
+    sentence_translations: dict[str, str] | None = None  # {"en": "...", "ja": "...", "fr": "..."}
+    audio_url: str | None = None  # R2 URL for sentence audio
+    word_audio_url: str | None = None  # R2 URL for word audio
+    image_url: str | None = None  # R2 URL for image
+
+
+# Flexible column names, in order of preference
+WORD_COLUMNS = ("word", "expression", "kanji")
+READING_COLUMNS = ("reading", "kana", "hiragana")
+DEFINITION_COLUMNS = ("definition", "meaning", "english")
+
+# Rows parsed per chunk when streaming a CSV
+CSV_CHUNK_SIZE = 50_000
+
+
+def _column_indices(header: list[str], names: tuple[str, ...]) -> list[int]:
+    """Indices of the columns present in the header, in preference order"""
+    return [header.index(name) for name in names if name in header]
+
+
+def _first_value(row: list[str], indices: list[int]) -> str:
+    """First non-empty value among the given columns"""
+    for idx in indices:
+        if idx < len(row) and row[idx]:
+            return row[idx]
+    return ""
+
+
+def _iter_words_with_csv_module(
+    csv_path: Path, language: str, level: str, chunksize: int
+) -> Iterator[list[VocabWord]]:
+    """Parse row by row with the stdlib csv reader"""
+    words = []
+
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        # Blank lines are skipped before they take a row index, as DictReader
+        # and pandas do, so IDs don't depend on them
+        rows = (row for row in csv.reader(f) if row)
+
+        # Resolve column positions once from the header
+        header = [h.strip().lower() for h in next(rows, [])]
+        word_cols = _column_indices(header, WORD_COLUMNS)
+        reading_cols = _column_indices(header, READING_COLUMNS)
+        definition_cols = _column_indices(header, DEFINITION_COLUMNS)
+
+        for i, row in enumerate(rows):
+            word = _first_value(row, word_cols).strip()
+            if not word:
+                continue
+
+            reading = _first_value(row, reading_cols).strip()
+            definition = _first_value(row, definition_cols)
+
+            words.append(
+                VocabWord(
+                    id=f"csv_{i}",
+                    word=word,
+                    reading=reading or None,
+                    definitions=[definition.strip()] if definition else [],
+                    language=language,
+                    level=level,
+                )
+            )
+            if len(words) >= chunksize:
+                yield words
+                words = []
+
+    if words:
+        yield words
+
+
+def iter_words_from_csv(
+    csv_path: Path, language: str, level: str, chunksize: int = CSV_CHUNK_SIZE
+) -> Iterator[list[VocabWord]]:
+    """
+    Stream vocabulary words from a CSV file in chunks.
+
+    Only about `chunksize` rows are held at a time, so large files can be
+    processed while they are still being read.
+
+    Args:
+        csv_path: CSV file with a header row
+        language: Language assigned to every word
+        level: Level assigned to every word
+        chunksize: Maximum rows (pandas) or words (csv module) per chunk
+
+    Yields:
+        Non-empty lists of words, in file order
+    """
+    if HAS_PANDAS:
+        from deck_io_pandas import iter_words_with_pandas
+
+        yield from iter_words_with_pandas(csv_path, language, level, chunksize)
+    else:
+        yield from _iter_words_with_csv_module(csv_path, language, level, chunksize)
+
+
+def load_words_from_csv(csv_path: Path, language: str, level: str) -> list[VocabWord]:
+    """Load vocabulary words from a CSV file"""
+    words = [w for chunk in iter_words_from_csv(csv_path, language, level) for w in chunk]
+
+    logger.info(f"Loaded {len(words)} words from {csv_path}")
+    return words
@@ -0,0 +1,64 @@
+"""
+pandas CSV parsing for deck_io.
+
+Kept out of deck_io so that module can still be compiled with mypyc;
+this one is always imported as plain Python, and only when pandas is
+installed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd  # type: ignore[import-untyped]
+from deck_io import DEFINITION_COLUMNS, READING_COLUMNS, WORD_COLUMNS, VocabWord
+
+
+def _coalesce_columns(df, names: tuple[str, ...]):
+    """First non-empty value per row among the columns present, in preference order"""
+    values = pd.Series("", index=df.index)
+    for name in reversed(names):
+        if name in df.columns:
+            values = df[name].where(df[name] != "", values)
+    return values
+
+
+def _words_from_frame(df, language: str, level: str) -> list[VocabWord]:
+    """Build words from a parsed chunk; looping is limited to the dataclasses"""
+    df.columns = df.columns.str.strip().str.lower()
+    df = df.fillna("")  # Short rows
+
+    words_col = _coalesce_columns(df, WORD_COLUMNS).str.strip()
+    keep = words_col != ""
+
+    readings = _coalesce_columns(df, READING_COLUMNS)[keep].str.strip()
+    definitions = _coalesce_columns(df, DEFINITION_COLUMNS)[keep]
+
+    # Row positions (after the header) keep IDs identical to the csv path
+    return [
+        VocabWord(
+            id=f"csv_{i}",
+            word=word,
+            reading=reading or None,
+            definitions=[definition.strip()] if definition else [],
+            language=language,
+            level=level,
+        )
+        for i, word, reading, definition in zip(
+            words_col.index[keep], words_col[keep], readings, definitions, strict=True
+        )
+    ]
+
+
+def iter_words_with_pandas(
+    csv_path: Path, language: str, level: str, chunksize: int
+) -> Iterator[list[VocabWord]]:
+    """Parse with pandas' C reader, one chunk of rows at a time"""
+    with pd.read_csv(
+        csv_path, dtype=str, keep_default_na=False, encoding="utf-8", chunksize=chunksize
+    ) as reader:
+        for df in reader:
+            words = _words_from_frame(df, language, level)
+            if words:
+                yield words
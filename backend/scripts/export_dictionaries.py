@@ -7,12 +7,23 @@ that can be loaded in the browser for instant autocomplete.
 
 import json
 import sqlite3
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, falls back to json
+    orjson = None
+
 # Output directory
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "web" / "public" / "dictionaries"
 CACHE_SIZE = 20000  # Words per language
 
+# WordNet part-of-speech codes -> compact tags ("s" is a satellite adjective)
+POS_MAP = {"n": "n", "v": "v", "a": "adj", "s": "adj", "r": "adv"}
+POS_KEYS = frozenset(POS_MAP)
+
 
 def get_wn_db_path() -> Path | None:
     """Get the path to the wn SQLite database."""
@@ -25,146 +36,229 @@ def get_wn_db_path() -> Path | None:
     return None
 
 
-def export_english():
-    """Export top English words."""
-    db_path = get_wn_db_path()
-    if not db_path:
-        print("WordNet database not found!")
-        return
+def _open_conn(db_path: Path, frequency_lang: str | None = None) -> sqlite3.Connection:
+    """Open a dictionary database read-only, tuned for the big export queries.
 
-    print(f"Loading English from {db_path}...")
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
+    The GROUP BY/window aggregates are kept in RAM instead of spilling temp
+    B-trees to disk, and pages are memory-mapped rather than re-read.
 
-    cursor.execute(
+    With frequency_lang, that language's word frequencies are also copied
+    into an in-memory `frequencies` table, so the per-form lookups probe a
+    small RAM-resident index instead of the shared on-disk table.
+    """
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    conn.executescript(
+        """
+        PRAGMA cache_size=-262144;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=1073741824;
         """
-        SELECT f.form,
-               GROUP_CONCAT(d.definition, '|||'),
-               GROUP_CONCAT(e.pos, ','),
-               COALESCE(wf.frequency, 0) as freq
-        FROM forms f
-        JOIN entries e ON f.entry_rowid = e.rowid
-        JOIN senses s ON s.entry_rowid = e.rowid
-        JOIN definitions d ON d.synset_rowid = s.synset_rowid
-        JOIN lexicons l ON f.lexicon_rowid = l.rowid
-        LEFT JOIN word_frequencies wf ON LOWER(f.form) = wf.word AND wf.lang = 'en'
-        WHERE l.language = 'en'
-          AND f.form NOT LIKE '% %'
-          AND LENGTH(f.form) > 1
-        GROUP BY f.form
-        ORDER BY freq DESC, LENGTH(f.form)
-        LIMIT ?
-    """,
-        (CACHE_SIZE,),
     )
 
-    pos_map = {"n": "n", "v": "v", "a": "adj", "s": "adj", "r": "adv"}
-    words = []
+    if frequency_lang:
+        conn.execute(
+            """
+            CREATE TEMP TABLE frequencies AS
+            SELECT word, frequency FROM word_frequencies WHERE lang = ?
+            """,
+            (frequency_lang,),
+        )
+        conn.execute("CREATE INDEX temp.idx_frequencies_word ON frequencies(word)")
 
-    for row in cursor.fetchall():
-        word, definitions_str, pos_str, _ = row
-        if not definitions_str:
-            continue
+    conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+# Built once: json.dumps() with non-default options constructs a new encoder
+# on every call, which adds up over tens of thousands of entries
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def dump_json(entry: list) -> bytes:
+    """Serialize an entry as compact UTF-8 JSON (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(entry)
+    return _json_encode(entry).encode()
+
+
+def write_json_array(output_file: Path, entries: Iterable[list]) -> int:
+    """Stream entries into a compact JSON array, returning how many were written.
 
-        # Take first 2 meanings, truncate to save space
-        meanings = [m[:100] for m in definitions_str.split("|||")[:2] if m]
+    Entries are encoded straight to UTF-8 bytes one at a time, so neither the
+    rows nor the full JSON string are ever held in memory at once.
+    """
+    count = 0
+    with open(output_file, "wb") as f:
+        f.write(b"[")
+        for entry in entries:
+            if count:
+                f.write(b",")
+            f.write(dump_json(entry))
+            count += 1
+        f.write(b"]")
+    return count
+
+
+def wordnet_entries(cursor: sqlite3.Cursor) -> Iterator[list]:
+    """Yield compact [word, meanings, pos?] entries from a WordNet export query."""
+    for word, first, second, pos_str, _ in cursor:
+        # The query already picked the first 2 meanings, truncated to save space
+        meanings = [m for m in (first, second) if m]
         if not meanings:
             continue
 
-        pos_tags = set(pos_str.split(",")) if pos_str else set()
-        pos = next((pos_map.get(p) for p in pos_tags if p in pos_map), None)
+        # Any known tag will do; min() just keeps the pick independent of
+        # the string hash seed, so re-exports are reproducible
+        pos_tags = POS_KEYS.intersection(pos_str.split(",")) if pos_str else None
+        pos = POS_MAP[min(pos_tags)] if pos_tags else None
 
         # Compact format: [word, meanings_array, pos_or_null]
         entry = [word, meanings]
         if pos:
             entry.append(pos)
-        words.append(entry)
+        yield entry
 
-    conn.close()
 
-    # Save as compact JSON
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    output_file = OUTPUT_DIR / "en.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(words, f, ensure_ascii=False, separators=(",", ":"))
+def jamdict_entries(cursor: sqlite3.Cursor) -> Iterator[list]:
+    """Yield compact [word, reading, meanings] entries from the jamdict export query.
 
-    size_kb = output_file.stat().st_size / 1024
-    print(f"Exported {len(words)} English words to {output_file} ({size_kb:.1f} KB)")
+    The query already returns each written form once, for its highest
+    priority entry.
+    """
+    for word_text, reading_text, glosses_str, _ in cursor:
+        if not word_text or not glosses_str:
+            continue
+
+        meanings = [m for m in glosses_str.split("|||") if m]
+        if not meanings:
+            continue
 
+        yield [word_text, reading_text or "", meanings]
 
-def export_french():
-    """Export top French words with English definitions."""
+
+def export_english():
+    """Export top English words."""
     db_path = get_wn_db_path()
     if not db_path:
         print("WordNet database not found!")
         return
 
-    print(f"Loading French from {db_path}...")
-    conn = sqlite3.connect(str(db_path))
+    print(f"Loading English from {db_path}...")
+    conn = _open_conn(db_path, frequency_lang="en")
     cursor = conn.cursor()
 
     cursor.execute(
         """
-        SELECT f.form,
-               GROUP_CONCAT(en_d.definition, '|||'),
-               GROUP_CONCAT(e.pos, ','),
-               COALESCE(wf.frequency, 0) as freq
-        FROM forms f
-        JOIN entries e ON f.entry_rowid = e.rowid
-        JOIN senses s ON s.entry_rowid = e.rowid
-        JOIN synsets syn ON s.synset_rowid = syn.rowid
-        JOIN lexicons l ON f.lexicon_rowid = l.rowid
-        LEFT JOIN ilis i ON syn.ili_rowid = i.rowid
-        LEFT JOIN synsets en_syn ON en_syn.ili_rowid = i.rowid
-        LEFT JOIN lexicons en_l ON en_syn.lexicon_rowid = en_l.rowid AND en_l.language = 'en'
-        LEFT JOIN definitions en_d ON en_d.synset_rowid = en_syn.rowid
-        LEFT JOIN word_frequencies wf ON LOWER(f.form) = wf.word AND wf.lang = 'fr'
-        WHERE l.language = 'fr'
-          AND f.form NOT LIKE '% %'
-          AND LENGTH(f.form) > 1
-        GROUP BY f.form
-        HAVING GROUP_CONCAT(en_d.definition, '|||') IS NOT NULL
-        ORDER BY freq DESC, LENGTH(f.form)
+        WITH ranked AS (
+            SELECT f.form,
+                   e.pos,
+                   d.definition,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY f.form ORDER BY d.definition IS NULL, s.rowid, d.rowid
+                   ) AS rn
+            FROM forms f
+            JOIN entries e ON f.entry_rowid = e.rowid
+            JOIN senses s ON s.entry_rowid = e.rowid
+            JOIN definitions d ON d.synset_rowid = s.synset_rowid
+            JOIN lexicons l ON f.lexicon_rowid = l.rowid
+            WHERE l.language = 'en'
+              AND f.form NOT LIKE '% %'
+              AND LENGTH(f.form) > 1
+        )
+        SELECT form,
+               MAX(CASE WHEN rn = 1 THEN SUBSTR(definition, 1, 100) END),
+               MAX(CASE WHEN rn = 2 THEN SUBSTR(definition, 1, 100) END),
+               GROUP_CONCAT(pos, ','),
+               COALESCE(
+                   (
+                       SELECT wf.frequency FROM frequencies wf
+                       WHERE wf.word = LOWER(form)
+                   ),
+                   0
+               ) as freq
+        FROM ranked
+        GROUP BY form
+        HAVING MAX(rn = 1 AND definition IS NOT NULL)
+        ORDER BY freq DESC, LENGTH(form)
         LIMIT ?
     """,
         (CACHE_SIZE,),
     )
 
-    pos_map = {"n": "n", "v": "v", "a": "adj", "s": "adj", "r": "adv"}
-    words = []
+    # Save as compact JSON, streamed straight from the cursor
+    output_file = OUTPUT_DIR / "en.json"
+    count = write_json_array(output_file, wordnet_entries(cursor))
+    conn.close()
 
-    for row in cursor.fetchall():
-        word, definitions_str, pos_str, _ = row
-        if not definitions_str:
-            continue
+    size_kb = output_file.stat().st_size / 1024
+    print(f"Exported {count} English words to {output_file} ({size_kb:.1f} KB)")
 
-        meanings = [m[:100] for m in definitions_str.split("|||")[:2] if m]
-        if not meanings:
-            continue
 
-        pos_tags = set(pos_str.split(",")) if pos_str else set()
-        pos = next((pos_map.get(p) for p in pos_tags if p in pos_map), None)
+def export_french():
+    """Export top French words with English definitions."""
+    db_path = get_wn_db_path()
+    if not db_path:
+        print("WordNet database not found!")
+        return
 
-        entry = [word, meanings]
-        if pos:
-            entry.append(pos)
-        words.append(entry)
+    print(f"Loading French from {db_path}...")
+    conn = _open_conn(db_path, frequency_lang="fr")
+    cursor = conn.cursor()
 
-    conn.close()
+    cursor.execute(
+        """
+        WITH ranked AS (
+            SELECT f.form,
+                   e.pos,
+                   en_d.definition,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY f.form ORDER BY en_d.definition IS NULL, s.rowid, en_d.rowid
+                   ) AS rn
+            FROM forms f
+            JOIN entries e ON f.entry_rowid = e.rowid
+            JOIN senses s ON s.entry_rowid = e.rowid
+            JOIN synsets syn ON s.synset_rowid = syn.rowid
+            JOIN lexicons l ON f.lexicon_rowid = l.rowid
+            LEFT JOIN ilis i ON syn.ili_rowid = i.rowid
+            LEFT JOIN synsets en_syn ON en_syn.ili_rowid = i.rowid
+            LEFT JOIN lexicons en_l
+                ON en_syn.lexicon_rowid = en_l.rowid AND en_l.language = 'en'
+            LEFT JOIN definitions en_d ON en_d.synset_rowid = en_syn.rowid
+            WHERE l.language = 'fr'
+              AND f.form NOT LIKE '% %'
+              AND LENGTH(f.form) > 1
+        )
+        SELECT form,
+               MAX(CASE WHEN rn = 1 THEN SUBSTR(definition, 1, 100) END),
+               MAX(CASE WHEN rn = 2 THEN SUBSTR(definition, 1, 100) END),
+               GROUP_CONCAT(pos, ','),
+               COALESCE(
+                   (
+                       SELECT wf.frequency FROM frequencies wf
+                       WHERE wf.word = LOWER(form)
+                   ),
+                   0
+               ) as freq
+        FROM ranked
+        GROUP BY form
+        HAVING MAX(rn = 1 AND definition IS NOT NULL)
+        ORDER BY freq DESC, LENGTH(form)
+        LIMIT ?
+    """,
+        (CACHE_SIZE,),
+    )
 
     output_file = OUTPUT_DIR / "fr.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(words, f, ensure_ascii=False, separators=(",", ":"))
+    count = write_json_array(output_file, wordnet_entries(cursor))
+    conn.close()
 
     size_kb = output_file.stat().st_size / 1024
-    print(f"Exported {len(words)} French words to {output_file} ({size_kb:.1f} KB)")
+    print(f"Exported {count} French words to {output_file} ({size_kb:.1f} KB)")
 
 
 def export_japanese():
     """Export Japanese words from jamdict using efficient direct database access."""
     try:
-        import sqlite3 as jamdict_sqlite
-
         from jamdict import Jamdict
     except ImportError:
         print("jamdict not installed, skipping Japanese export")
@@ -213,7 +307,7 @@ def export_japanese():
         return
 
     try:
-        conn = jamdict_sqlite.connect(str(db_path))
+        conn = _open_conn(db_path)
         cursor = conn.cursor()
 
         # Get entries with kanji and kana forms, prioritizing by frequency
@@ -230,169 +324,304 @@ def export_japanese():
         # - Lower nfXX or ichi2/news2: priority 30-49
         cursor.execute(
             """
+            WITH priorities AS (
+                -- Score each entry from its kanji/kana priority tags only, so
+                -- the aggregate never sees the sense x gloss fan-out
+                SELECT
+                    e.idseq,
+                    (
+                        -- Base score from nfXX (if present)
+                        COALESCE(
+                            MAX(CASE
+                                WHEN COALESCE(kp.text, knp.text) LIKE 'nf%' THEN
+                                    CASE
+                                        -- nf01-nf10: priority 90-99 (top 5000 words)
+                                        WHEN CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER) <= 10
+                                            THEN 100 - CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER)
+                                        -- nf11-nf24: priority 65-78
+                                        WHEN CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER) <= 24
+                                            THEN 89 - CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER)
+                                        -- nf25-nf48: priority 30-54
+                                        ELSE 79 - CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER)
+                                    END
+                            END),
+                            0
+                        )
+                        +
+                        -- Bonus for ichi1/news1 (high value to ensure common words rank high)
+                        -- ichi1 = "Ichimango" 10k most common words - should rank VERY high
+                        COALESCE(
+                            MAX(CASE
+                                WHEN COALESCE(kp.text, knp.text) = 'ichi1' THEN 100
+                                WHEN COALESCE(kp.text, knp.text) = 'news1' THEN 80
+                                WHEN COALESCE(kp.text, knp.text) = 'ichi2' THEN 20
+                                WHEN COALESCE(kp.text, knp.text) = 'news2' THEN 15
+                                WHEN COALESCE(kp.text, knp.text) = 'gai1' THEN 10
+                                ELSE 0
+                            END),
+                            0
+                        )
+                    ) as priority
+                FROM Entry e
+                LEFT JOIN Kanji k ON k.idseq = e.idseq
+                LEFT JOIN Kana r ON r.idseq = e.idseq
+                LEFT JOIN KJP kp ON kp.kid = k.ID
+                LEFT JOIN KNP knp ON knp.kid = r.ID
+                WHERE (k.text IS NOT NULL OR r.text IS NOT NULL)
+                GROUP BY e.idseq
+            ),
+            entries AS (
+                SELECT
+                    p.idseq,
+                    p.priority,
+                    COALESCE(
+                        (SELECT k.text FROM Kanji k WHERE k.idseq = p.idseq ORDER BY k.ID LIMIT 1),
+                        (SELECT r.text FROM Kana r WHERE r.idseq = p.idseq ORDER BY r.ID LIMIT 1)
+                    ) as word,
+                    (SELECT r.text FROM Kana r WHERE r.idseq = p.idseq ORDER BY r.ID LIMIT 1)
+                        as reading
+                FROM priorities p
+                WHERE EXISTS (
+                    SELECT 1 FROM Sense s
+                    JOIN SenseGloss g ON g.sid = s.ID AND g.lang = 'eng'
+                    WHERE s.idseq = p.idseq
+                )
+            ),
+            ranked AS (
+                -- Keep only the highest priority entry for each written form
+                SELECT
+                    *,
+                    ROW_NUMBER() OVER (PARTITION BY word ORDER BY priority DESC, idseq)
+                        as word_rank
+                FROM entries
+            )
             SELECT
-                COALESCE(k.text, r.text) as word,
-                r.text as reading,
-                GROUP_CONCAT(g.text, '|||') as glosses,
+                word,
+                reading,
                 (
-                    -- Base score from nfXX (if present)
-                    COALESCE(
-                        MAX(CASE
-                            WHEN COALESCE(kp.text, knp.text) LIKE 'nf%' THEN
-                                CASE
-                                    -- nf01-nf10: priority 90-99 (top 5000 words)
-                                    WHEN CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER) <= 10
-                                        THEN 100 - CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER)
-                                    -- nf11-nf24: priority 65-78
-                                    WHEN CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER) <= 24
-                                        THEN 89 - CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER)
-                                    -- nf25-nf48: priority 30-54
-                                    ELSE 79 - CAST(SUBSTR(COALESCE(kp.text, knp.text), 3) AS INTEGER)
-                                END
-                        END),
-                        0
-                    )
-                    +
-                    -- Bonus for ichi1/news1 (high value to ensure common words rank high)
-                    -- ichi1 = "Ichimango" 10k most common words - should rank VERY high
-                    COALESCE(
-                        MAX(CASE
-                            WHEN COALESCE(kp.text, knp.text) = 'ichi1' THEN 100
-                            WHEN COALESCE(kp.text, knp.text) = 'news1' THEN 80
-                            WHEN COALESCE(kp.text, knp.text) = 'ichi2' THEN 20
-                            WHEN COALESCE(kp.text, knp.text) = 'news2' THEN 15
-                            WHEN COALESCE(kp.text, knp.text) = 'gai1' THEN 10
-                            ELSE 0
-                        END),
-                        0
+                    -- First 2 distinct English glosses, truncated to save space
+                    SELECT GROUP_CONCAT(SUBSTR(text, 1, 80), '|||') FROM (
+                        SELECT g.text FROM Sense s
+                        JOIN SenseGloss g ON g.sid = s.ID AND g.lang = 'eng'
+                        WHERE s.idseq = ranked.idseq
+                        GROUP BY g.text
+                        ORDER BY MIN(s.ID), MIN(g.rowid)
+                        LIMIT 2
                     )
-                ) as priority
-            FROM Entry e
-            LEFT JOIN Kanji k ON k.idseq = e.idseq
-            LEFT JOIN Kana r ON r.idseq = e.idseq
-            LEFT JOIN KJP kp ON kp.kid = k.ID
-            LEFT JOIN KNP knp ON knp.kid = r.ID
-            JOIN Sense s ON s.idseq = e.idseq
-            JOIN SenseGloss g ON g.sid = s.ID AND g.lang = 'eng'
-            WHERE (k.text IS NOT NULL OR r.text IS NOT NULL)
-            GROUP BY e.idseq
-            ORDER BY priority DESC, LENGTH(COALESCE(k.text, r.text))
+                ) as glosses,
+                priority
+            FROM ranked
+            WHERE word_rank = 1
+            ORDER BY priority DESC, LENGTH(word)
             LIMIT ?
         """,
             (CACHE_SIZE,),
         )
 
-        words = []
-        seen = set()
+        output_file = OUTPUT_DIR / "ja.json"
+        count = write_json_array(output_file, jamdict_entries(cursor))
+        conn.close()
 
-        for row in cursor.fetchall():
-            word_text, reading_text, glosses_str, _ = row
-            word_text = word_text or ""
-            reading_text = reading_text or ""
+        size_kb = output_file.stat().st_size / 1024
+        print(f"Exported {count} Japanese words to {output_file} ({size_kb:.1f} KB)")
 
-            if not word_text or word_text in seen:
-                continue
-            seen.add(word_text)
+    except Exception as e:
+        print(f"Database export failed: {e}")
+        print("Falling back to search method...")
+        export_japanese_search_method(db_path)
+
+
+# Search prefixes for the fallback export, in dictionary order
+HIRAGANA = (
+    "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
+)
+SEARCH_LIMIT = 5000  # Limit to 5k for speed
+SEARCH_PER_PREFIX = 200
+GLOSS_BATCH_SIZE = 500  # Entries per IN (...) gloss query
+
+# Entries with a kana or kanji form starting with one of the :heads characters,
+# first SEARCH_PER_PREFIX per character, in a single pass over the hiragana
+# range of the text columns
+PREFIX_ENTRIES_SQL = f"""
+    WITH matches AS (
+        SELECT idseq, SUBSTR(text, 1, 1) AS head FROM Kana
+        WHERE text >= 'あ' AND text < 'ゔ'
+        UNION
+        SELECT idseq, SUBSTR(text, 1, 1) AS head FROM Kanji
+        WHERE text >= 'あ' AND text < 'ゔ'
+    ),
+    ranked AS (
+        SELECT head, idseq, ROW_NUMBER() OVER (PARTITION BY head ORDER BY idseq) AS rn
+        FROM matches
+        WHERE INSTR(:heads, head) > 0
+    )
+    SELECT ranked.head,
+           ranked.idseq,
+           (SELECT k.text FROM Kanji k WHERE k.idseq = ranked.idseq ORDER BY k.ID LIMIT 1),
+           (SELECT r.text FROM Kana r WHERE r.idseq = ranked.idseq ORDER BY r.ID LIMIT 1)
+    FROM ranked
+    WHERE rn <= {SEARCH_PER_PREFIX}
+    ORDER BY INSTR(:heads, ranked.head), ranked.idseq
+"""
 
-            if not glosses_str:
-                continue
+# English glosses of the given entries' senses, in sense order (NULL for
+# senses without any)
+SENSE_GLOSSES_SQL = """
+    SELECT s.idseq, s.ID, g.text
+    FROM Sense s
+    LEFT JOIN SenseGloss g ON g.sid = s.ID AND g.lang = 'eng'
+    WHERE s.idseq IN ({placeholders})
+    ORDER BY s.idseq, s.ID, g.rowid
+"""
 
-            meanings = [m[:80] for m in glosses_str.split("|||")[:2] if m]
-            if not meanings:
-                continue
 
-            words.append([word_text, reading_text, meanings])
+def _describe_jamdict_entry(entry) -> tuple[str, str, list[str]]:
+    """Get (word, reading, meanings) for an entry returned by jamdict's lookup."""
+    word_text = ""
+    reading = ""
 
-        conn.close()
+    if entry.kanji_forms:
+        word_text = entry.kanji_forms[0].text
+    if entry.kana_forms:
+        reading = entry.kana_forms[0].text
+        if not word_text:
+            word_text = reading
 
-        output_file = OUTPUT_DIR / "ja.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(words, f, ensure_ascii=False, separators=(",", ":"))
+    meanings = []
+    for sense in entry.senses[:2]:
+        if sense.gloss:
+            gloss_texts = [g.text for g in sense.gloss if g.text][:2]
+            if gloss_texts:
+                meanings.append(", ".join(gloss_texts)[:80])
 
-        size_kb = output_file.stat().st_size / 1024
-        print(f"Exported {len(words)} Japanese words to {output_file} ({size_kb:.1f} KB)")
+    return word_text, reading, meanings
 
-    except Exception as e:
-        print(f"Database export failed: {e}")
-        print("Falling back to search method...")
-        export_japanese_search_method()
 
+def _describe_db_entry(entry: tuple) -> tuple[str, str, list[str]]:
+    """Get (word, reading, meanings) for a (kanji, kana, sense glosses) database entry."""
+    kanji_text, reading, senses = entry
+    reading = reading or ""
+    meanings = [", ".join(texts[:2])[:80] for texts in list(senses.values())[:2] if texts]
+    return kanji_text or reading, reading, meanings
 
-def export_japanese_search_method():
-    """Fallback: Export Japanese using jamdict search (slower)."""
-    try:
-        from jamdict import Jamdict
-    except ImportError:
-        print("jamdict not installed")
-        return
 
-    print("Using jamdict search method (this may take a while)...")
-    jmd = Jamdict()
+def _search_jamdict(jmd) -> Iterator[tuple[str, object]]:
+    """Yield (prefix, entry) pairs from one jamdict lookup per hiragana."""
+    for char in HIRAGANA:
+        try:
+            result = jmd.lookup(f"{char}%")
+        except Exception as e:
+            print(f"Error searching {char}: {e}")
+            continue
+
+        for entry in result.entries[:SEARCH_PER_PREFIX]:
+            yield char, entry
+
+
+def _search_db(conn: sqlite3.Connection) -> Iterator[tuple[str, tuple]]:
+    """Yield (prefix, entry) pairs from one range query plus batched gloss lookups."""
+    rows = conn.execute(PREFIX_ENTRIES_SQL, {"heads": HIRAGANA}).fetchall()
+
+    for start in range(0, len(rows), GLOSS_BATCH_SIZE):
+        batch = rows[start : start + GLOSS_BATCH_SIZE]
+        idseqs = list({idseq for _, idseq, _, _ in batch})
+
+        glosses: dict[int, dict[int, list[str]]] = {}
+        sql = SENSE_GLOSSES_SQL.format(placeholders=",".join("?" * len(idseqs)))
+        for idseq, sense_id, gloss in conn.execute(sql, idseqs):
+            gloss_texts = glosses.setdefault(idseq, {}).setdefault(sense_id, [])
+            if gloss:
+                gloss_texts.append(gloss)
+
+        for head, idseq, kanji_text, reading in batch:
+            yield head, (kanji_text, reading, glosses.get(idseq, {}))
+
+
+def export_japanese_search_method(db_path: Path | None = None):
+    """Fallback: Export Japanese with prefix searches (slower).
+
+    When jamdict's database is known, all prefixes are fetched with a single
+    range query on a direct connection; otherwise, or if that query fails,
+    each one goes through jamdict's lookup.
+    """
+    results = None
+    if db_path:
+        print(f"Using prefix search on {db_path}...")
+        conn = None
+        try:
+            conn = _open_conn(db_path)
+            # Read everything here so database errors surface before exporting
+            results = list(_search_db(conn))
+            describe = _describe_db_entry
+        except sqlite3.Error as e:
+            print(f"Direct database search failed ({e}), using jamdict lookups")
+        finally:
+            if conn:
+                conn.close()
+
+    if results is None:
+        try:
+            from jamdict import Jamdict
+        except ImportError:
+            print("jamdict not installed")
+            return
+
+        print("Using jamdict search method (this may take a while)...")
+        results = _search_jamdict(Jamdict())
+        describe = _describe_jamdict_entry
 
     words = []
     seen = set()
 
-    # Use all hiragana as search prefixes
-    hiragana = list(
-        "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん"
-    )
-
-    for char in hiragana:
-        if len(words) >= 5000:  # Limit to 5k for speed
+    for char, entry in results:
+        if len(words) >= SEARCH_LIMIT:
             break
 
+        # One malformed entry shouldn't throw away the rest of the export
         try:
-            result = jmd.lookup(f"{char}%")
-            for entry in result.entries[:200]:
-                if len(words) >= 5000:
-                    break
-
-                word_text = ""
-                reading = ""
-
-                if entry.kanji_forms:
-                    word_text = entry.kanji_forms[0].text
-                if entry.kana_forms:
-                    reading = entry.kana_forms[0].text
-                    if not word_text:
-                        word_text = reading
-
-                if not word_text or word_text in seen:
-                    continue
-                seen.add(word_text)
-
-                meanings = []
-                for sense in entry.senses[:2]:
-                    if sense.gloss:
-                        gloss_texts = [g.text for g in sense.gloss if g.text][:2]
-                        if gloss_texts:
-                            meanings.append(", ".join(gloss_texts)[:80])
-
-                if meanings:
-                    words.append([word_text, reading, meanings])
-
+            word_text, reading, meanings = describe(entry)
         except Exception as e:
-            print(f"Error searching {char}: {e}")
+            print(f"Skipping entry under {char}: {e}")
             continue
 
+        if not word_text or word_text in seen:
+            continue
+        seen.add(word_text)
+
+        if meanings:
+            words.append([word_text, reading, meanings])
+
     output_file = OUTPUT_DIR / "ja.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(words, f, ensure_ascii=False, separators=(",", ":"))
+    write_json_array(output_file, words)
 
     size_kb = output_file.stat().st_size / 1024
     print(f"Exported {len(words)} Japanese words to {output_file} ({size_kb:.1f} KB)")
 
 
+EXPORTERS = {
+    "en": export_english,
+    "fr": export_french,
+    "ja": export_japanese,
+}
+
+
+def _run(name: str) -> None:
+    """Run one exporter by name (lambdas can't be sent to worker processes)."""
+    EXPORTERS[name]()
+
+
 def main():
     print("Exporting dictionaries for client-side search...")
     print(f"Output directory: {OUTPUT_DIR}")
     print()
 
-    export_english()
-    print()
-    export_french()
-    print()
-    export_japanese()
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    # The exporters share no state and each opens its own read-only
+    # connection, so run them side by side
+    with ProcessPoolExecutor(max_workers=len(EXPORTERS)) as executor:
+        list(executor.map(_run, EXPORTERS))
+
     print()
     print("Done!")
 
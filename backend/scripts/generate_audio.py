@@ -4,16 +4,23 @@ Generate audio for stories using Google Gemini TTS API.
 
 Usage:
     export GEMINI_API_KEY=your_api_key
-    python scripts/generate_audio.py [--level N5] [--story story_id] [--list]
+    python scripts/generate_audio.py [--level N5] [--story story_id] [--list] [--batch]
 
 Environment Variables:
     GEMINI_API_KEY - Your Google AI API key (required)
+    KEEP_WAV_ORIGINALS - Set to 1 to also keep WAV originals (same as --keep-wav)
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import os
+import shutil
+import struct
 import sys
-import wave
+import threading
+from operator import itemgetter
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -33,11 +40,41 @@ except ImportError:
     print("Error: google-genai not installed. Run: pip install google-genai")
     sys.exit(1)
 
-import subprocess
+from app.services.gemini_client import get_gemini_client
+from app.services.generation.batch import BatchJobRunner, BatchRequest, response_audio
+from app.services.generation.media import (
+    MP3_VBR_QUALITY,
+    OPUS_BITRATE,
+    OPUS_COMPRESSION_LEVEL,
+    compress_audio_to_mp3,
+    compress_audio_to_opus,
+)
+from app.services.generation.rate_limit import call_with_retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, falls back to json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: read story metadata without parsing content
+    ijson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop (not on Windows), falls back to asyncio
+    uvloop = None
 
 # Configuration
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_AI_API_KEY")
 GEMINI_MODEL = "gemini-2.5-flash-preview-tts"
+# TTS requests in flight at once (429s are retried with backoff by call_with_retry)
+TTS_CONCURRENCY = int(os.getenv("GEMINI_TTS_CONCURRENCY", "4"))
+# Stories processed at once by generate_all_audio
+STORY_WORKERS = int(os.getenv("AUDIO_STORY_WORKERS", "3"))
+# Silence between separately narrated segments (0.4s of 24kHz 16-bit mono)
+SEGMENT_PAUSE = bytes(2 * 24000 * 4 // 10)
 
 # Voice selection with weighted probabilities
 # 30% Leda, 30% Aoede, 20% Alnilam, 20% Rasalgethi
@@ -55,11 +92,36 @@ def select_voice() -> str:
     return random.choices(VOICES, weights=VOICE_WEIGHTS, k=1)[0]
 
 
+# Story audio encoders by file extension. Opus is about half the size of MP3
+# for the same speech quality; MP3 stays available via --codec mp3
+AUDIO_ENCODERS = {".opus": compress_audio_to_opus, ".mp3": compress_audio_to_mp3}
+# Encoder settings per extension (part of the narration cache key)
+ENCODING_SETTINGS = {
+    ".opus": (OPUS_BITRATE, OPUS_COMPRESSION_LEVEL),
+    ".mp3": (MP3_VBR_QUALITY,),
+}
+DEFAULT_CODEC = "opus"
+
 # Paths
 STORIES_DIR = Path(__file__).parent.parent / "app" / "data" / "stories"
 AUDIO_DIR = Path(__file__).parent.parent / "app" / "static" / "audio"
 AUDIO_ORIGINALS_DIR = AUDIO_DIR / "originals"
 
+# Narrations are cached by content hash (same layout as the deck media cache),
+# so re-running a story whose text and voice are unchanged skips the TTS call.
+# Each segment's PCM is cached too, so editing a story only re-narrates the
+# changed segments. Set MEDIA_CACHE=0 (or pass --no-cache) to always regenerate.
+NARRATION_CACHE_DIR = Path(__file__).parent.parent / "generated" / "cache" / "narration"
+MEDIA_CACHE_ENABLED = os.getenv("MEDIA_CACHE", "1") != "0"
+
+# Story id/metadata from previous runs, keyed by file name and invalidated by
+# mtime/size, so unchanged stories are not re-read on every invocation
+STORY_INDEX_PATH = Path(__file__).parent.parent / "generated" / "cache" / "story_index.json"
+
+# WAV originals are only needed for debugging or re-encoding, so they are not
+# written unless asked for (KEEP_WAV_ORIGINALS=1 or --keep-wav)
+KEEP_WAV = os.getenv("KEEP_WAV_ORIGINALS") == "1"
+
 
 def extract_text_from_tokens(tokens: list) -> str:
     """Extract plain text from token list by joining surface forms."""
@@ -68,20 +130,93 @@ def extract_text_from_tokens(tokens: list) -> str:
 
 def load_story(story_path: Path) -> dict:
     """Load a story JSON file."""
-    with open(story_path, encoding="utf-8") as f:
-        return json.load(f)
+    data = story_path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def load_story_meta(story_path: Path) -> dict:
+    """
+    Load just a story's id and metadata.
+
+    With ijson installed, parsing stops as soon as both top-level keys have
+    been read, so the chapters/tokens that follow are never decoded.
+    """
+    if ijson is None:
+        story = load_story(story_path)
+        return {"id": story.get("id"), "metadata": story.get("metadata", {})}
+
+    meta = {"id": None, "metadata": {}}
+    found = set()
+    with open(story_path, "rb") as f:
+        for key, value in ijson.kvitems(f, "", use_float=True):
+            if key in meta:
+                meta[key] = value
+                found.add(key)
+                if len(found) == len(meta):
+                    break
+    return meta
+
+
+@functools.cache
+def story_metas() -> dict[Path, dict]:
+    """
+    Id, metadata and narration text hash of every story file (built once per run).
+
+    Reuses the on-disk index for files whose mtime and size are unchanged and
+    rewrites it when anything was re-read. The text hash needs a full parse,
+    so it is only computed for stories whose audio recorded one.
+    """
+    try:
+        data = STORY_INDEX_PATH.read_bytes()
+        cached = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        cached = {}
+
+    index = {}
+    metas = {}
+    for story_file in sorted(STORIES_DIR.glob("*.json")):
+        stat = story_file.stat()
+        entry = cached.get(story_file.name)
+        if not entry or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            entry.update(load_story_meta(story_file))
+            if entry["metadata"].get("audioTextHash"):
+                entry["text_hash"] = narration_text_hash(load_story(story_file))
+        index[story_file.name] = entry
+        metas[story_file] = {
+            "id": entry["id"],
+            "metadata": entry["metadata"],
+            "text_hash": entry.get("text_hash"),
+        }
+
+    if index != cached:
+        STORY_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = STORY_INDEX_PATH.with_name(f"{STORY_INDEX_PATH.name}.{os.getpid()}.tmp")
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(index))
+        else:
+            tmp_path.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(STORY_INDEX_PATH)
+
+    return metas
 
 
 def save_story(story_path: Path, story: dict) -> None:
-    """Save a story JSON file."""
-    with open(story_path, "w", encoding="utf-8") as f:
-        json.dump(story, f, ensure_ascii=False, indent=2)
+    """Save a story JSON file (atomically, so readers never see half a file)."""
+    if orjson is not None:
+        data = orjson.dumps(story, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(story, ensure_ascii=False, indent=2).encode()
+    tmp_path = story_path.with_name(f"{story_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(story_path)
 
 
 def get_segment_text(segment: dict) -> str:
     """Extract plain text from a segment."""
     if "tokens" in segment and segment["tokens"]:
-        return "".join(token["surface"] for token in segment["tokens"])
+        # map/itemgetter runs in C, without a generator frame per token
+        return "".join(map(itemgetter("surface"), segment["tokens"]))
     return segment.get("text", "")
 
 
@@ -110,13 +245,18 @@ def extract_story_text(story_data: dict) -> list[dict]:
     return segments
 
 
+def narration_text_hash(story_data: dict) -> str:
+    """Hash of the text a story's narration is generated from."""
+    text = "\n".join(seg["text"] for seg in extract_story_text(story_data))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
 def list_stories() -> None:
     """List all stories and their audio status."""
     print("\nStories in library:")
     print("-" * 60)
 
-    for story_file in sorted(STORIES_DIR.glob("*.json")):
-        story = load_story(story_file)
+    for story in story_metas().values():
         story_id = story["id"]
         level = story["metadata"].get("jlptLevel", "?")
         title = story["metadata"].get("titleJapanese") or story["metadata"]["title"]
@@ -128,78 +268,232 @@ def list_stories() -> None:
     print("-" * 60)
 
 
-def save_audio(pcm_data: bytes, output_path: Path) -> bool:
-    """Save PCM audio as WAV original and MP3 for serving."""
-    # Ensure directories exist
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+def original_wav_path(output_path: Path) -> Path:
+    """WAV original kept alongside an encoded output path."""
     AUDIO_ORIGINALS_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Save WAV original
-    wav_path = AUDIO_ORIGINALS_DIR / output_path.with_suffix(".wav").name
-    with wave.open(str(wav_path), "wb") as wf:
-        wf.setnchannels(1)  # mono
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(24000)  # 24kHz
-        wf.writeframes(pcm_data)
-    print(f"  WAV original saved: {wav_path.name}")
-
+    return AUDIO_ORIGINALS_DIR / output_path.with_suffix(".wav").name
+
+
+def wav_header(n_bytes: int) -> bytes:
+    """Canonical 44-byte RIFF header for n_bytes of 24kHz 16-bit mono PCM."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + n_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        1,  # mono
+        24000,  # 24kHz
+        48000,  # byte rate
+        2,  # block align
+        16,  # 16-bit
+        b"data",
+        n_bytes,
+    )
+
+
+def cache_key(*parts: object) -> str:
+    """Content hash of everything that determines a cached audio file."""
+    return hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()
+
+
+def narration_cache_path(text: str, voice: str, suffix: str) -> Path:
+    """Cache location of the encoded narration for this text, voice, model and encoding."""
+    key = cache_key(
+        GEMINI_MODEL,
+        voice,
+        NARRATION_PROMPT,
+        text,
+        len(SEGMENT_PAUSE),
+        *ENCODING_SETTINGS[suffix],
+    )
+    return NARRATION_CACHE_DIR / f"{key}{suffix}"
+
+
+def segment_cache_path(text: str, voice: str) -> Path:
+    """Cache location of the raw PCM for one narrated segment."""
+    key = cache_key(GEMINI_MODEL, voice, NARRATION_PROMPT, text)
+    return NARRATION_CACHE_DIR / "segments" / f"{key}.pcm"
+
+
+def write_cache_file(cache_path: Path, data: bytes) -> None:
+    """Store a cache entry atomically (worker threads may write the same entry at once)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(cache_path)
+
+
+def read_segment_cache(text: str, voice: str) -> bytes | None:
+    """Cached PCM for a segment, or None."""
+    if not MEDIA_CACHE_ENABLED:
+        return None
     try:
-        # Convert to MP3 using ffmpeg
-        result = subprocess.run(
-            ["ffmpeg", "-y", "-i", str(wav_path), "-b:a", "64k", str(output_path)],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            print(f"  ffmpeg error: {result.stderr}")
-            return False
-        return True
-    except Exception as e:
-        print(f"  Error saving audio: {e}")
-        return False
+        return segment_cache_path(text, voice).read_bytes()
+    except FileNotFoundError:
+        return None
 
 
-def generate_audio(client: genai.Client, text: str, output_path: Path, voice: str) -> bool:
-    """Generate audio using Gemini TTS API."""
-    try:
-        prompt = NARRATION_PROMPT + text
-
-        print(f"  Calling Gemini TTS API with voice: {voice}...")
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=voice,
-                        )
-                    )
-                ),
-            ),
+def write_segment_cache(text: str, voice: str, pcm: bytes) -> None:
+    """Cache a segment's PCM, so an edited story only re-narrates changed segments."""
+    if MEDIA_CACHE_ENABLED and pcm:
+        write_cache_file(segment_cache_path(text, voice), pcm)
+
+
+def reuse_cached_narration(cache_path: Path, output_path: Path) -> bool:
+    """Copy a cached narration to output_path if there is one."""
+    if not MEDIA_CACHE_ENABLED or not cache_path.exists():
+        return False
+    print(f"  Reusing cached narration: {cache_path.name}")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(cache_path, output_path)
+    return True
+
+
+async def save_narration(
+    segments_pcm: list[bytes], output_path: Path, cache_path: Path, archive_wav: bool
+) -> None:
+    """Join segment PCM in story order, then encode (and cache) the narration."""
+    # Reassemble in story order, with a short pause between segments
+    pcm_data = SEGMENT_PAUSE.join(segments_pcm)
+
+    # The WAV original is only for debugging/re-encoding; alignment falls
+    # back to the encoded audio when it is missing
+    if archive_wav:
+        wav_path = original_wav_path(output_path)
+        wav_path.write_bytes(wav_header(len(pcm_data)) + pcm_data)
+        print(f"  WAV original saved: {wav_path.name}")
+
+    # Encode straight from memory (PCM is piped to the encoder) and off
+    # the event loop - the encode blocks
+    encode = AUDIO_ENCODERS[output_path.suffix]
+    await asyncio.to_thread(encode, pcm_data, output_path)
+    if MEDIA_CACHE_ENABLED:
+        write_cache_file(cache_path, output_path.read_bytes())
+
+
+@functools.cache
+def narration_config(voice: str) -> types.GenerateContentConfig:
+    """TTS request config for a narrator voice (built once per voice)."""
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name=voice,
+                )
+            )
+        ),
+    )
+
+
+async def generate_segment_pcm(
+    client: genai.Client, text: str, voice: str, semaphore: asyncio.Semaphore
+) -> bytes:
+    """Narrate one segment, returning its raw 24kHz mono PCM."""
+    cached = await asyncio.to_thread(read_segment_cache, text, voice)
+    if cached is not None:
+        return cached
+
+    prompt = NARRATION_PROMPT + text
+    async with semaphore:
+        response = await call_with_retry(
+            lambda: client.aio.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=prompt,
+                config=narration_config(voice),
+            )
         )
 
-        # Extract PCM audio data from response
-        audio_data = response.candidates[0].content.parts[0].inline_data.data
+    if not response.candidates or not response.candidates[0].content:
+        return b""
+    pcm = b"".join(
+        part.inline_data.data
+        for part in response.candidates[0].content.parts or []
+        if part.inline_data and part.inline_data.data
+    )
+    await asyncio.to_thread(write_segment_cache, text, voice, pcm)
+    return pcm
+
+
+async def generate_audio(
+    client: genai.Client,
+    texts: list[str],
+    output_path: Path,
+    voice: str,
+    semaphore: asyncio.Semaphore,
+    archive_wav: bool = False,
+) -> bool:
+    """Generate audio using Gemini TTS API, one request per segment."""
+    try:
+        cache_path = narration_cache_path("\n".join(texts), voice, output_path.suffix)
+        if reuse_cached_narration(cache_path, output_path):
+            return True
+
+        # Segments are narrated concurrently (bounded by the semaphore), so a
+        # story takes about as long as its slowest segment
+        print(f"  Calling Gemini TTS API with voice: {voice} ({len(texts)} segments)...")
+        results = await asyncio.gather(
+            *(generate_segment_pcm(client, text, voice, semaphore) for text in texts),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            print(f"  {len(errors)} segment(s) failed: {errors[0]}")
+            return False
+        if not all(results):
+            print("  No audio in response")
+            return False
 
-        # Save to file
-        return save_audio(audio_data, output_path)
+        await save_narration(results, output_path, cache_path, archive_wav)
+        return True
 
     except Exception as e:
         print(f"  Error generating audio: {e}")
         return False
 
 
-def generate_story_audio(client: genai.Client, story_id: str) -> bool:
+@functools.cache
+def story_index() -> dict[str, Path]:
+    """Map story IDs to their JSON files (built once per run)."""
+    index = {}
+    for story_file, story in story_metas().items():
+        story_id = story["id"]
+        if story_id:
+            index.setdefault(story_id, story_file)
+    return index
+
+
+def record_story_audio(story_file: Path, story_data: dict, audio_path: Path, voice: str) -> None:
+    """Update the story JSON with its new audio metadata."""
+    story_data["metadata"]["audioURL"] = f"/cdn/audio/{audio_path.name}"
+    story_data["metadata"]["audioModel"] = GEMINI_MODEL
+    story_data["metadata"]["audioPrompt"] = NARRATION_PROMPT.strip()
+    story_data["metadata"]["audioVoice"] = voice
+    story_data["metadata"]["audioTextHash"] = narration_text_hash(story_data)
+    save_story(story_file, story_data)
+
+    file_size = audio_path.stat().st_size / 1024
+    print(f"  Audio saved: {audio_path} ({file_size:.1f}KB)")
+    print(f"  Model: {GEMINI_MODEL}")
+    print(f"  Voice: {voice}")
+
+
+async def generate_story_audio(
+    client: genai.Client,
+    story_id: str,
+    story_file: Path | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    archive_wav: bool = False,
+    codec: str = DEFAULT_CODEC,
+) -> bool:
     """Generate audio for all segments in a story."""
     # Find the story file
-    story_file = None
-    for f in STORIES_DIR.glob("*.json"):
-        data = load_story(f)
-        if data.get("id") == story_id:
-            story_file = f
-            break
+    if story_file is None:
+        story_file = story_index().get(story_id)
 
     if not story_file:
         print(f"Story not found: {story_id}")
@@ -219,39 +513,30 @@ def generate_story_audio(client: genai.Client, story_id: str) -> bool:
     print(f"  Segments: {len(segments)}")
     print(f"  Total characters: {len(full_text)}")
 
-    # Select random voice
-    voice = select_voice()
+    # Keep the story's narrator on re-runs (so unchanged text hits the
+    # narration cache), otherwise select a random voice
+    voice = story_data["metadata"].get("audioVoice") or select_voice()
 
     # Generate full story audio
-    audio_filename = f"{story_id}.mp3"
+    audio_filename = f"{story_id}.{codec}"
     audio_path = AUDIO_DIR / audio_filename
 
-    success = generate_audio(client, full_text, audio_path, voice)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+    texts = [seg["text"] for seg in segments]
+    success = await generate_audio(client, texts, audio_path, voice, semaphore, archive_wav)
 
     if success:
-        # Update story JSON with audio metadata
-        story_data["metadata"]["audioURL"] = f"/cdn/audio/{audio_filename}"
-        story_data["metadata"]["audioModel"] = GEMINI_MODEL
-        story_data["metadata"]["audioPrompt"] = NARRATION_PROMPT.strip()
-        story_data["metadata"]["audioVoice"] = voice
-        save_story(story_file, story_data)
-
-        file_size = audio_path.stat().st_size / 1024
-        print(f"  Audio saved: {audio_path} ({file_size:.1f}KB)")
-        print(f"  Model: {GEMINI_MODEL}")
-        print(f"  Voice: {voice}")
+        record_story_audio(story_file, story_data, audio_path, voice)
         return True
 
     return False
 
 
-def generate_all_audio(client: genai.Client, level: str | None = None):
-    """Generate audio for all stories (optionally filtered by level)."""
-    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-
-    for story_file in sorted(STORIES_DIR.glob("*.json")):
-        story_data = load_story(story_file)
-
+def pending_stories(level: str | None = None) -> list[tuple[str, Path]]:
+    """(id, file) of stories without up-to-date audio, optionally filtered by level."""
+    todo = []
+    for story_file, story_data in story_metas().items():
         # Filter by level if specified
         story_level = story_data["metadata"].get("jlptLevel", "").upper()
         if level and story_level != level.upper():
@@ -261,29 +546,188 @@ def generate_all_audio(client: genai.Client, level: str | None = None):
         if not story_id:
             continue
 
-        # Skip if audio already exists
-        if story_data["metadata"].get("audioURL"):
-            print(f"Skipping {story_id} - audio already exists")
+        # Skip if audio already exists for the current text (audio made before
+        # text hashes were recorded is kept as-is)
+        metadata = story_data["metadata"]
+        if metadata.get("audioURL"):
+            audio_hash = metadata.get("audioTextHash")
+            if audio_hash is None or audio_hash == story_data["text_hash"]:
+                print(f"Skipping {story_id} - audio already exists")
+                continue
+            print(f"Regenerating {story_id} - text changed since its audio was made")
+
+        todo.append((story_id, story_file))
+
+    return todo
+
+
+async def generate_all_audio(
+    client: genai.Client,
+    level: str | None = None,
+    archive_wav: bool = False,
+    codec: str = DEFAULT_CODEC,
+):
+    """Generate audio for all stories (optionally filtered by level)."""
+    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+    todo = pending_stories(level)
+
+    # A few workers pull stories from a queue, so only STORY_WORKERS stories
+    # hold segment audio in memory at once. They share one semaphore, so
+    # TTS_CONCURRENCY bounds the segment requests in flight across the run
+    queue: asyncio.Queue[tuple[str, Path]] = asyncio.Queue()
+    for item in todo:
+        queue.put_nowait(item)
+    semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+
+    async def worker() -> None:
+        while True:
+            story_id, story_file = await queue.get()
+            try:
+                await generate_story_audio(
+                    client, story_id, story_file, semaphore, archive_wav, codec
+                )
+            except Exception as e:
+                print(f"  Error generating audio for {story_id}: {e}")
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(STORY_WORKERS, len(todo)))]
+    await queue.join()
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def generate_all_audio_batch(
+    level: str | None = None, archive_wav: bool = False, codec: str = DEFAULT_CODEC
+) -> None:
+    """
+    Generate audio for all stories through one Gemini Batch API job.
+
+    Half the cost of live TTS calls, but results can take hours; meant for
+    bulk (re)generation runs. Cached narrations are reused without a request.
+    """
+    AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+
+    # (story file, story data, segment texts, voice, audio path, cache path)
+    stories = []
+    requests = []
+    cached = {}
+    for story_id, story_file in pending_stories(level):
+        print(f"\nProcessing: {story_file.name}")
+        story_data = load_story(story_file)
+        texts = [seg["text"] for seg in extract_story_text(story_data)]
+        if not texts:
+            print("  No segments found")
             continue
 
-        generate_story_audio(client, story_id)
+        voice = story_data["metadata"].get("audioVoice") or select_voice()
+        audio_path = AUDIO_DIR / f"{story_id}.{codec}"
+        cache_path = narration_cache_path("\n".join(texts), voice, audio_path.suffix)
+        if reuse_cached_narration(cache_path, audio_path):
+            record_story_audio(story_file, story_data, audio_path, voice)
+            continue
 
-        # Rate limit - wait between requests
-        print("  Waiting 1 second before next request...")
-        import time
+        # Only segments without cached audio go into the batch
+        config = narration_config(voice).model_dump(mode="json", by_alias=True, exclude_none=True)
+        for i, text in enumerate(texts):
+            key = f"{story_id}/{i}"
+            pcm = read_segment_cache(text, voice)
+            if pcm is not None:
+                cached[key] = pcm
+            else:
+                requests.append(
+                    BatchRequest(key=key, prompt=NARRATION_PROMPT + text, generation_config=config)
+                )
+        stories.append((story_file, story_data, texts, voice, audio_path, cache_path))
+
+    if not stories:
+        return
 
-        time.sleep(1)
+    results = dict(cached)
+    if requests:
+        runner = BatchJobRunner(api_key=GEMINI_API_KEY)
+        job = await runner.create_batch_job(
+            requests, model=GEMINI_MODEL, display_name=f"story_audio_{len(stories)}"
+        )
+        print(f"\nBatch job {job.name}: {len(requests)} segments from {len(stories)} stories")
+        results.update(await runner.wait_for_completion(job.name, extract=response_audio))
+
+    async def finish(story_file, story_data, texts, voice, audio_path, cache_path) -> None:
+        story_id = story_data["id"]
+        segments_pcm = [results.get(f"{story_id}/{i}", b"") for i in range(len(texts))]
+        for text, pcm in zip(texts, segments_pcm, strict=True):
+            write_segment_cache(text, voice, pcm)
+        if not all(segments_pcm):
+            print(f"  {story_id}: {segments_pcm.count(b'')} segment(s) missing from batch results")
+            return
+        try:
+            await save_narration(segments_pcm, audio_path, cache_path, archive_wav)
+        except Exception as e:
+            print(f"  Error encoding audio for {story_id}: {e}")
+            return
+        record_story_audio(story_file, story_data, audio_path, voice)
+
+    # Encodes run in worker threads (ffmpeg is a subprocess), so they overlap
+    await asyncio.gather(*(finish(*story) for story in stories))
+
+
+async def run(
+    story_id: str | None,
+    level: str | None,
+    archive_wav: bool = False,
+    codec: str = DEFAULT_CODEC,
+) -> None:
+    """Generate the requested audio over one shared connection pool."""
+    # Every TTS call reuses the shared client's keep-alive connections
+    # (multiplexed over HTTP/2 when h2 is installed) instead of handshaking
+    # per story
+    client = get_gemini_client(GEMINI_API_KEY)
+
+    if story_id:
+        await generate_story_audio(client, story_id, archive_wav=archive_wav, codec=codec)
+    else:
+        await generate_all_audio(client, level, archive_wav, codec)
 
 
 def main():
     import argparse
 
+    global MEDIA_CACHE_ENABLED
+
     parser = argparse.ArgumentParser(description="Generate audio for stories using Gemini TTS")
     parser.add_argument("--level", help="Filter by JLPT level (e.g., N5)")
     parser.add_argument("--story", help="Generate audio for specific story ID")
     parser.add_argument("--list", action="store_true", help="List stories and their audio status")
+    parser.add_argument(
+        "--keep-wav",
+        "--archive-wav",
+        dest="keep_wav",
+        action="store_true",
+        default=KEEP_WAV,
+        help="Also keep a WAV original in static/audio/originals",
+    )
+    parser.add_argument(
+        "--codec",
+        choices=[suffix.lstrip(".") for suffix in AUDIO_ENCODERS],
+        default=DEFAULT_CODEC,
+        help=f"Audio format to encode (default: {DEFAULT_CODEC})",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit all pending stories as one Batch API job (50%% cheaper, slower)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate narrations even if cached audio exists",
+    )
     args = parser.parse_args()
 
+    if args.no_cache:
+        MEDIA_CACHE_ENABLED = False
+
     if args.list:
         list_stories()
         return
@@ -302,13 +746,12 @@ def main():
         list_stories()
         return
 
-    # Initialize client
-    client = genai.Client(api_key=GEMINI_API_KEY)
-
-    if args.story:
-        generate_story_audio(client, args.story)
+    # Run on uvloop when installed
+    run_async = uvloop.run if uvloop is not None else asyncio.run
+    if args.batch and not args.story:
+        run_async(generate_all_audio_batch(args.level, args.keep_wav, args.codec))
     else:
-        generate_all_audio(client, args.level)
+        run_async(run(args.story, args.level, args.keep_wav, args.codec))
 
 
 if __name__ == "__main__":
@@ -34,6 +34,11 @@ load_dotenv(env_path)
 
 from app.services.generation.pipeline import StoryPipeline
 
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop (not on Windows), falls back to asyncio
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"
@@ -212,8 +217,9 @@ Available image styles:
 
     args = parser.parse_args()
 
-    # Run the pipeline
-    asyncio.run(
+    # Run the pipeline (on uvloop when installed)
+    run_async = uvloop.run if uvloop is not None else asyncio.run
+    run_async(
         generate_story(
             jlpt_level=args.level,
             genre=args.genre,
@@ -10,8 +10,11 @@ Usage:
 
 import argparse
 import asyncio
+import hashlib
 import json
+import os
 import sys
+from collections.abc import Awaitable
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -25,6 +28,36 @@ load_dotenv(env_path)
 
 from app.services.generation.image_generator import ImageGenerator
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, falls back to json
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop (not on Windows), falls back to asyncio
+    uvloop = None
+
+# Image requests in flight at once
+IMAGE_CONCURRENCY = int(os.getenv("IMAGE_CONCURRENCY", "4"))
+
+
+def save_story(story_path: Path, story: dict) -> None:
+    """Save a story JSON file (atomically, so readers never see half a file)."""
+    if orjson is not None:
+        data = orjson.dumps(story, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(story, ensure_ascii=False, indent=2).encode()
+    tmp_path = story_path.with_name(f"{story_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(story_path)
+
+
+def image_prompt_hash(model: str, kind: str, params: dict) -> str:
+    """Hash of everything that shapes an image (model, kind, prompt, style, aspect ratio)."""
+    key = json.dumps([model, kind, params], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()
+
 
 def extract_chapter_description(chapter: dict) -> str:
     """Extract a description from chapter content for image generation"""
@@ -51,9 +84,13 @@ def extract_chapter_description(chapter: dict) -> str:
 
 
 async def generate_images(
-    story_path: str, style: str = "anime", skip_cover: bool = False, skip_chapters: bool = False
+    story_path: str,
+    style: str = "anime",
+    skip_cover: bool = False,
+    skip_chapters: bool = False,
+    force: bool = False,
 ):
-    """Generate all images for a story"""
+    """Generate all images for a story (skipping ones whose prompt is unchanged)"""
 
     story_file = Path(story_path)
     if not story_file.exists():
@@ -61,8 +98,8 @@ async def generate_images(
         return
 
     # Load the story
-    with open(story_file, encoding="utf-8") as f:
-        story = json.load(f)
+    data = story_file.read_bytes()
+    story = orjson.loads(data) if orjson is not None else json.loads(data)
 
     print(f"Loaded story: {story['metadata']['title']}")
     if story["metadata"].get("titleJapanese"):
@@ -82,13 +119,35 @@ async def generate_images(
     print(f"Using model: {generator.model}")
     print()
 
-    # Generate cover image (4:5 portrait for thumbnail)
+    # Cover and chapter images are independent requests, so they all run at
+    # once (bounded by the semaphore) instead of one after another
+    semaphore = asyncio.Semaphore(IMAGE_CONCURRENCY)
+
+    async def bounded(request: Awaitable[dict | None]) -> dict | None:
+        async with semaphore:
+            return await request
+
+    # (label, target dict, metadata key prefix, prompt hash) for each requested image
+    targets = []
+    requests = []
+
+    def request_image(label: str, target: dict, prefix: str, method, **params) -> None:
+        prompt_hash = image_prompt_hash(generator.model, method.__name__, params)
+        unchanged = target.get(f"{prefix}PromptHash") == prompt_hash
+        if target.get(f"{prefix}URL") and unchanged and not force:
+            print(f"Skipping {label} - unchanged since it was generated")
+            return
+        print(f"Generating {label}...")
+        targets.append((label, target, prefix, prompt_hash))
+        requests.append(method(**params))
+
+    # Cover image (4:5 portrait for thumbnail)
     if not skip_cover:
-        print("=" * 50)
-        print("Generating cover image (4:5 portrait)...")
-        print("=" * 50)
-
-        cover_result = await generator.generate_cover(
+        request_image(
+            "cover image (4:5 portrait)",
+            story["metadata"],
+            "coverImage",
+            generator.generate_cover,
             story_title=story["metadata"]["title"],
             story_summary=story["metadata"].get("summary", story["metadata"]["title"]),
             genre=story["metadata"].get("genre", "general"),
@@ -97,30 +156,20 @@ async def generate_images(
             aspect_ratio="4:5",
         )
 
-        if cover_result:
-            print(f"Cover image generated: {cover_result['url']}")
-            story["metadata"]["coverImageURL"] = cover_result["url"]
-            story["metadata"]["coverImageModel"] = cover_result["model"]
-            story["metadata"]["coverImageModelName"] = cover_result["model_name"]
-        else:
-            print("Failed to generate cover image")
-
-        print()
-        await asyncio.sleep(1)
-
-    # Generate chapter images (16:9 landscape)
+    # Chapter images (16:9 landscape)
     if not skip_chapters and story.get("chapters"):
         for i, chapter in enumerate(story["chapters"]):
             chapter_title = chapter.get("titleJapanese") or chapter.get("title", f"Chapter {i + 1}")
 
-            print("=" * 50)
-            print(f"Generating image for: {chapter_title}")
-            print("=" * 50)
-
             description = extract_chapter_description(chapter)
-            print(f"Description: {description[:100]}...")
-
-            chapter_result = await generator.generate_chapter_image(
+            print(f"Chapter: {chapter_title}")
+            print(f"  Description: {description[:100]}...")
+
+            request_image(
+                f"image for: {chapter_title}",
+                chapter,
+                "image",
+                generator.generate_chapter_image,
                 chapter_title=chapter_title,
                 chapter_content=description,
                 story_title=story["metadata"]["title"],
@@ -129,27 +178,33 @@ async def generate_images(
                 aspect_ratio="16:9",
             )
 
-            if chapter_result:
-                print(f"Chapter image generated: {chapter_result['url']}")
-                chapter["imageURL"] = chapter_result["url"]
-                chapter["imageModel"] = chapter_result["model"]
-                chapter["imageModelName"] = chapter_result["model_name"]
-            else:
-                print(f"Failed to generate image for: {chapter_title}")
-
-            print()
+    if not requests:
+        print()
+        print("All images are up to date (use --force to regenerate)")
+        return
 
-            # Wait between requests (except after the last one)
-            if i < len(story["chapters"]) - 1:
-                await asyncio.sleep(1)
+    print()
+    results = await asyncio.gather(*map(bounded, requests), return_exceptions=True)
+
+    for (label, target, prefix, prompt_hash), result in zip(targets, results, strict=True):
+        if isinstance(result, BaseException):
+            print(f"Failed to generate {label}: {result}")
+        elif result:
+            print(f"Generated {label}: {result['url']}")
+            target[f"{prefix}URL"] = result["url"]
+            target[f"{prefix}Model"] = result["model"]
+            target[f"{prefix}ModelName"] = result["model_name"]
+            target[f"{prefix}PromptHash"] = prompt_hash
+        else:
+            print(f"Failed to generate {label}")
+    print()
 
     # Save updated story
     print("=" * 50)
     print("Saving updated story...")
     print("=" * 50)
 
-    with open(story_file, "w", encoding="utf-8") as f:
-        json.dump(story, f, ensure_ascii=False, indent=2)
+    save_story(story_file, story)
 
     print(f"Story saved to: {story_file}")
     print()
@@ -169,15 +224,21 @@ def main():
     parser.add_argument(
         "--skip-chapters", action="store_true", help="Skip chapter image generation"
     )
+    parser.add_argument(
+        "--force", action="store_true", help="Regenerate images even if their prompt is unchanged"
+    )
 
     args = parser.parse_args()
 
-    asyncio.run(
+    # Run on uvloop when installed
+    run_async = uvloop.run if uvloop is not None else asyncio.run
+    run_async(
         generate_images(
             args.story_file,
             style=args.style,
             skip_cover=args.skip_cover,
             skip_chapters=args.skip_chapters,
+            force=args.force,
         )
     )
 
@@ -10,8 +10,13 @@ Enforces patterns documented in docs/DEVELOPMENT.md:
 Run: python scripts/lint_patterns.py
 """
 
+import bisect
+import hashlib
+import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Files that are allowed to have the patterns we're checking for
@@ -29,14 +34,46 @@ EXCLUDED_DIRS = {
     "tests",  # Test files may have legitimate uses
 }
 
-
-def should_check_file(path: Path) -> bool:
-    """Check if a file should be linted."""
-    if path.name in EXCLUDED_FILES:
-        return False
-    if any(excluded in path.parts for excluded in EXCLUDED_DIRS):
-        return False
-    return path.suffix == ".py"
+# .save() calls with a .png extension
+PNG_SAVE = r'\.save\([^)\n]*["\'].*\.png["\']'
+# String literals naming a .wav file
+WAV_LITERAL = r'["\'].*\.wav["\']'
+# ["japanese", "english", "french"] written out by hand
+LANG_LIST = (
+    r'\[[^\S\n]*["\']japanese["\'][^\S\n]*,[^\S\n]*["\']english["\'][^\S\n]*,'
+    r'[^\S\n]*["\']french["\'][^\S\n]*\]'
+)
+
+# All checks in one pass over the whole file. Each alternative sits in a
+# lookahead so matches never consume text and hide a later match on the same
+# line; none of them can span lines. Checks are reported in this order.
+CHECKS = ("png", "wav", "lang")
+PATTERN_RE = re.compile(
+    f"(?=(?P<png>{PNG_SAVE})|(?P<wav>{WAV_LITERAL})|(?P<lang>{LANG_LIST}))", re.IGNORECASE
+)
+NEWLINE_RE = re.compile("\n")
+# Every check needs one of these (lowercased) in the file, so files without
+# any are skipped before decoding
+TRIGGERS = (b".png", b".wav", b'"japanese"', b"'japanese'")
+
+# Results of earlier runs, reused for files that have not changed
+SCAN_CACHE_PATH = Path(__file__).parent.parent / "generated" / "cache" / "lint_patterns.json"
+
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+
+def find_python_files(root: Path) -> list[Path]:
+    """All files under root to lint, without descending into excluded directories."""
+    py_files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in EXCLUDED_DIRS]
+        py_files.extend(
+            Path(dirpath, name)
+            for name in filenames
+            if name.endswith(".py") and name not in EXCLUDED_FILES
+        )
+    return sorted(py_files)
 
 
 def check_file(path: Path) -> list[str]:
@@ -44,35 +81,50 @@ def check_file(path: Path) -> list[str]:
     violations = []
 
     try:
-        content = path.read_text()
+        raw = path.read_bytes()
+        lowered = raw.lower()
+        if not any(trigger in lowered for trigger in TRIGGERS):
+            return []
+        content = raw.decode()
     except Exception as e:
         return [f"{path}: Could not read file: {e}"]
 
-    lines = content.split("\n")
+    # Files that already use the shared helpers are allowed these patterns
+    has_webp_helper = "compress_image_to_webp" in content
+    has_mp3_helper = "compress_audio_to_mp3" in content
+
+    # Line number of each match comes from the offsets where lines start
+    line_starts = [0, *(match.end() for match in NEWLINE_RE.finditer(content))]
+    found = {
+        (bisect.bisect_right(line_starts, match.start()), CHECKS.index(match.lastgroup))
+        for match in PATTERN_RE.finditer(content)
+    }
+
+    for line_num, check in sorted(found):
+        line_end = content.find("\n", line_starts[line_num - 1])
+        line = content[line_starts[line_num - 1] : line_end if line_end != -1 else None]
 
-    for line_num, line in enumerate(lines, 1):
         # Skip comments and docstrings (basic heuristic)
         stripped = line.strip()
         if stripped.startswith("#") or stripped.startswith('"""') or stripped.startswith("'''"):
             continue
 
         # Check 1: Saving PNG without using compress_image_to_webp
-        # Look for .save() calls with .png extension
-        if re.search(r'\.save\([^)]*["\'].*\.png["\']', line, re.IGNORECASE):
-            if "compress_image_to_webp" not in content:
+        if CHECKS[check] == "png":
+            if not has_webp_helper:
                 violations.append(
                     f"{path}:{line_num}: Saving PNG file directly. "
                     "Use compress_image_to_webp() from app.services.generation.media"
                 )
 
         # Check 2: Creating WAV files without using compress_audio_to_mp3
-        if re.search(r'["\'].*\.wav["\']', line, re.IGNORECASE):
+        elif CHECKS[check] == "wav":
             # Allow reading WAV (input), flag writing WAV (output)
             if any(
                 write_pattern in line.lower()
                 for write_pattern in ["open(", "write", "save", "export", "output"]
             ):
-                if "compress_audio_to_mp3" not in content:
+                if not has_mp3_helper:
                     violations.append(
                         f"{path}:{line_num}: Writing WAV file. "
                         "Use compress_audio_to_mp3() from app.services.generation.media"
@@ -81,26 +133,43 @@ def check_file(path: Path) -> list[str]:
         # Check 3: Hardcoded language lists
         # Pattern: ["japanese", "english", "french"] or similar combinations
         # Skip Literal type definitions (they're a known pattern for type safety)
-        is_literal_type = "Literal[" in line or "Literal [" in line
-
-        if re.search(
-            r'\[\s*["\']japanese["\']\s*,\s*["\']english["\']\s*,\s*["\']french["\']\s*\]',
-            line,
-            re.IGNORECASE,
-        ):
-            if is_literal_type:
-                # Literal types are OK for now - they need the actual values
-                # TODO: Consider exporting SupportedLanguage from languages.py
-                pass
-            else:
-                violations.append(
-                    f"{path}:{line_num}: Hardcoded language list. "
-                    "Use LANGUAGE_CODES from app.config.languages"
-                )
+        elif "Literal[" in line or "Literal [" in line:
+            # Literal types are OK for now - they need the actual values
+            # TODO: Consider exporting SupportedLanguage from languages.py
+            pass
+        else:
+            violations.append(
+                f"{path}:{line_num}: Hardcoded language list. "
+                "Use LANGUAGE_CODES from app.config.languages"
+            )
 
     return violations
 
 
+def content_hash(path: Path) -> str:
+    """Hash of a file's bytes (catches files touched without being edited)."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def load_scan_cache(rules_hash: str) -> dict:
+    """Cached results from the last run, or {} if missing or made by other rules."""
+    try:
+        cached = json.loads(SCAN_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if cached.get("rules") != rules_hash:
+        return {}
+    return cached["files"]
+
+
+def save_scan_cache(rules_hash: str, files: dict) -> None:
+    """Write the scan cache atomically."""
+    SCAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = SCAN_CACHE_PATH.with_name(f"{SCAN_CACHE_PATH.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps({"rules": rules_hash, "files": files}), encoding="utf-8")
+    tmp_path.replace(SCAN_CACHE_PATH)
+
+
 def main():
     """Run pattern checks on all Python files in app/."""
     app_dir = Path(__file__).parent.parent / "app"
@@ -109,17 +178,52 @@ def main():
         print(f"Error: {app_dir} does not exist")
         sys.exit(1)
 
-    all_violations = []
-    files_checked = 0
+    py_files = find_python_files(app_dir)
+
+    # Reuse results for unchanged files: same mtime and size skips the file
+    # entirely, and a matching content hash catches files that were only touched.
+    # Cached results are dropped whenever this script (the rules) changes.
+    rules_hash = content_hash(Path(__file__))
+    cached = load_scan_cache(rules_hash)
+    entries = {}
+    to_check = []
+    for py_file in py_files:
+        entry = cached.get(str(py_file))
+        try:
+            stat = py_file.stat()
+            fresh = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            if entry and entry["mtime_ns"] == fresh["mtime_ns"] and entry["size"] == fresh["size"]:
+                entries[py_file] = entry
+                continue
+            fresh["hash"] = content_hash(py_file)
+        except Exception as e:
+            # Reported like check_file does; without a hash it is not cached
+            entries[py_file] = {"violations": [f"{py_file}: Could not read file: {e}"]}
+            continue
+        if entry and entry["hash"] == fresh["hash"]:
+            entries[py_file] = {**entry, **fresh}
+        else:
+            entries[py_file] = fresh
+            to_check.append(py_file)
+
+    # Files are independent, so large trees are checked across all cores
+    if len(to_check) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(check_file, to_check, chunksize=16)
+            for py_file, violations in zip(to_check, results, strict=True):
+                entries[py_file]["violations"] = violations
+    else:
+        for py_file in to_check:
+            entries[py_file]["violations"] = check_file(py_file)
+
+    files = {str(py_file): entry for py_file, entry in entries.items() if "hash" in entry}
+    if files != cached:
+        save_scan_cache(rules_hash, files)
 
-    for py_file in app_dir.rglob("*.py"):
-        if should_check_file(py_file):
-            files_checked += 1
-            violations = check_file(py_file)
-            all_violations.extend(violations)
+    all_violations = [v for entry in entries.values() for v in entry["violations"]]
 
     # Summary
-    print(f"Checked {files_checked} Python files")
+    print(f"Checked {len(py_files)} Python files")
 
     if all_violations:
         print(f"\n❌ Found {len(all_violations)} pattern violation(s):\n")
@@ -3,10 +3,16 @@ Script to optimize existing images by converting to WebP and resizing.
 """
 
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, falls back to json
+    orjson = None
+
 IMAGES_DIR = Path(__file__).parent.parent / "app" / "static" / "images"
 STORY_FILE = Path(__file__).parent.parent / "app" / "data" / "stories" / "n5_my_day_at_school.json"
 
@@ -14,21 +20,20 @@ STORY_FILE = Path(__file__).parent.parent / "app" / "data" / "stories" / "n5_my_
 def optimize_image(input_path: Path, max_size: int = 800, quality: int = 85) -> Path:
     """Convert image to optimized WebP"""
     output_path = input_path.with_suffix(".webp")
-
-    img = Image.open(input_path)
-
-    # Convert to RGB if necessary
-    if img.mode in ("RGBA", "P"):
-        img = img.convert("RGB")
-
     original_size = input_path.stat().st_size
 
-    # Resize if larger than max_size
-    if max(img.size) > max_size:
-        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    # Closing the source releases its file handle as soon as it is decoded
+    with Image.open(input_path) as img:
+        # Convert to RGB if necessary (the only full copy of the pixels)
+        if img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+
+        # Resize if larger than max_size
+        if max(img.size) > max_size:
+            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
 
-    # Save as WebP
-    img.save(output_path, "WEBP", quality=quality, method=6)
+        # Save as WebP
+        img.save(output_path, "WEBP", quality=quality, method=6)
 
     final_size = output_path.stat().st_size
     print(
@@ -52,21 +57,23 @@ def main():
     # Track old -> new filename mapping
     filename_map = {}
 
-    for png_path in png_files:
-        webp_path = optimize_image(png_path)
-        old_name = f"/cdn/images/{png_path.name}"
-        new_name = f"/cdn/images/{webp_path.name}"
-        filename_map[old_name] = new_name
+    # WebP encoding (method=6) is CPU-bound, so images are encoded one per core
+    with ProcessPoolExecutor() as executor:
+        webp_paths = executor.map(optimize_image, png_files)
+        for png_path, webp_path in zip(png_files, webp_paths, strict=True):
+            old_name = f"/cdn/images/{png_path.name}"
+            new_name = f"/cdn/images/{webp_path.name}"
+            filename_map[old_name] = new_name
 
-        # Remove original PNG
-        png_path.unlink()
+            # Remove original PNG
+            png_path.unlink()
 
     print()
     print("Updating story JSON...")
 
     # Update story JSON with new filenames
-    with open(STORY_FILE, encoding="utf-8") as f:
-        story = json.load(f)
+    data = STORY_FILE.read_bytes()
+    story = orjson.loads(data) if orjson is not None else json.loads(data)
 
     # Update cover image URL
     if story["metadata"].get("coverImageURL") in filename_map:
@@ -77,8 +84,10 @@ def main():
         if chapter.get("imageURL") in filename_map:
             chapter["imageURL"] = filename_map[chapter["imageURL"]]
 
-    with open(STORY_FILE, "w", encoding="utf-8") as f:
-        json.dump(story, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        STORY_FILE.write_bytes(orjson.dumps(story, option=orjson.OPT_INDENT_2))
+    else:
+        STORY_FILE.write_text(json.dumps(story, ensure_ascii=False, indent=2), encoding="utf-8")
 
     print("Done!")
 
@@ -13,18 +13,106 @@ Options:
     --dry-run            Show what would be changed without modifying files
     --verbose            Show detailed output
     --single FILE        Retokenize a single file only
+    --workers N          Files retokenized in parallel (default: one per CPU)
+    --no-cache           Tokenize every segment, ignoring cached results
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import io
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, ".")
 
+from app.services import tokenizer as tokenizer_module
 from app.services.tokenizer import get_tokenizer_service
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, falls back to json
+    orjson = None
+
+# Token dicts of previously tokenized texts, reused while the tokenizer is unchanged
+TOKEN_CACHE_PATH = Path(__file__).parent.parent / "generated" / "cache" / "retokenize.json"
+TOKEN_CACHE_ENABLED = True
+
+# Cache loaded at startup (inherited or reloaded by workers), and the entries
+# added while processing the current file
+_token_cache: dict[str, list] = {}
+_new_token_entries: dict[str, list] = {}
+
+
+@functools.cache
+def tokenizer_version() -> str:
+    """Identifies tokenizer output: fugashi/IPADIC versions plus the code shaping tokens."""
+    parts = [importlib.metadata.version(name) for name in ("fugashi", "ipadic")]
+    sources = (Path(tokenizer_module.__file__), Path(__file__))
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+    for source in sources:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def load_token_cache() -> None:
+    """Load cached token dicts made by the current tokenizer version."""
+    try:
+        data = TOKEN_CACHE_PATH.read_bytes()
+        cached = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return
+    if cached.get("version") == tokenizer_version():
+        _token_cache.update(cached["tokens"])
+
+
+def save_token_cache(new_entries: dict[str, list]) -> None:
+    """Add new entries to the on-disk cache (written atomically)."""
+    tokens = {**_token_cache, **new_entries}
+    payload = {"version": tokenizer_version(), "tokens": tokens}
+    TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = TOKEN_CACHE_PATH.with_name(f"{TOKEN_CACHE_PATH.name}.{os.getpid()}.tmp")
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(payload))
+    else:
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(TOKEN_CACHE_PATH)
+
+
+def tokenize_to_dicts(text: str, tokenizer) -> list:
+    """Tokenize text into token dicts, reusing the cached result for the same text."""
+    key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    cached = _token_cache.get(key) if TOKEN_CACHE_ENABLED else None
+    if cached is not None:
+        return cached
+
+    tokens = tokenizer.tokenize_text(text)
+    token_dicts = [
+        {
+            "surface": token.surface,
+            "parts": [
+                {"text": p.text, "reading": p.reading} if p.reading else {"text": p.text}
+                for p in token.parts
+            ]
+            if token.parts
+            else None,
+            "baseForm": token.baseForm,
+            "partOfSpeech": token.partOfSpeech,
+        }
+        for token in tokens
+    ]
+    if TOKEN_CACHE_ENABLED:
+        _token_cache[key] = _new_token_entries[key] = token_dicts
+    return token_dicts
+
 
 def tokenize_segments(segments: list, tokenizer) -> list:
     """Retokenize all segments in a list."""
@@ -42,23 +130,7 @@ def tokenize_segments(segments: list, tokenizer) -> list:
             continue
 
         # Tokenize the text
-        tokens = tokenizer.tokenize_text(text)
-
-        # Convert tokens to dict format
-        token_dicts = []
-        for token in tokens:
-            token_dict = {
-                "surface": token.surface,
-                "parts": [
-                    {"text": p.text, "reading": p.reading} if p.reading else {"text": p.text}
-                    for p in token.parts
-                ]
-                if token.parts
-                else None,
-                "baseForm": token.baseForm,
-                "partOfSpeech": token.partOfSpeech,
-            }
-            token_dicts.append(token_dict)
+        token_dicts = tokenize_to_dicts(text, tokenizer)
 
         # Create new segment with tokens
         new_segment = {
@@ -74,21 +146,7 @@ def tokenize_segments(segments: list, tokenizer) -> list:
 
 def tokenize_title(title: str, tokenizer) -> list:
     """Tokenize a title string and return token dicts."""
-    tokens = tokenizer.tokenize_text(title)
-    return [
-        {
-            "surface": token.surface,
-            "parts": [
-                {"text": p.text, "reading": p.reading} if p.reading else {"text": p.text}
-                for p in token.parts
-            ]
-            if token.parts
-            else None,
-            "baseForm": token.baseForm,
-            "partOfSpeech": token.partOfSpeech,
-        }
-        for token in tokens
-    ]
+    return tokenize_to_dicts(title, tokenizer)
 
 
 def retokenize_story(story_data: dict, tokenizer, verbose: bool = False) -> dict:
@@ -131,16 +189,80 @@ def find_story_files(stories_dir: Path) -> list:
     """Find all JSON story files in the stories directory."""
     story_files = []
 
-    for json_file in stories_dir.rglob("*.json"):
-        # Skip non-story files
-        if json_file.name.startswith("."):
-            continue
-        story_files.append(json_file)
+    for dirpath, _dirnames, filenames in os.walk(stories_dir):
+        story_files.extend(
+            Path(dirpath, name)
+            for name in filenames
+            # Skip non-story files
+            if name.endswith(".json") and not name.startswith(".")
+        )
 
     return sorted(story_files)
 
 
+def retokenize_file(story_file: Path, dry_run: bool, verbose: bool) -> tuple[str, str, dict]:
+    """
+    Retokenize one story file.
+
+    Returns (status, output, new cache entries) where status is "saved",
+    "skipped" or "error". Output is collected rather than printed so parallel
+    workers don't interleave.
+    """
+    _new_token_entries.clear()
+    output = io.StringIO()
+    status = "saved"
+    with contextlib.redirect_stdout(output):
+        try:
+            print(f"\nProcessing: {story_file.name}")
+
+            # Load story
+            data = story_file.read_bytes()
+            story_data = orjson.loads(data) if orjson is not None else json.loads(data)
+
+            # Validate it's a story file
+            if "metadata" not in story_data or "id" not in story_data:
+                if verbose:
+                    print("  Skipping: Not a valid story file")
+                status = "skipped"
+            else:
+                # Retokenize
+                story_data = retokenize_story(story_data, get_tokenizer_service(), verbose)
+
+                # Save
+                if not dry_run:
+                    if orjson is not None:
+                        data = orjson.dumps(story_data, option=orjson.OPT_INDENT_2)
+                    else:
+                        data = json.dumps(story_data, ensure_ascii=False, indent=2).encode()
+                    story_file.write_bytes(data)
+                    print("  ✓ Saved")
+                else:
+                    print("  Would save")
+
+        except json.JSONDecodeError as e:
+            print(f"  ✗ JSON error: {e}")
+            status = "error"
+        except Exception as e:
+            print(f"  ✗ Error: {e}")
+            status = "error"
+
+    new_entries = dict(_new_token_entries)
+    _new_token_entries.clear()
+    return status, output.getvalue(), new_entries
+
+
+def init_worker(cache_enabled: bool) -> None:
+    """Load the tokenizer (and token cache) once per worker process, before its first file."""
+    global TOKEN_CACHE_ENABLED
+    TOKEN_CACHE_ENABLED = cache_enabled
+    if cache_enabled and not _token_cache:
+        load_token_cache()
+    get_tokenizer_service()
+
+
 def main():
+    global TOKEN_CACHE_ENABLED
+
     parser = argparse.ArgumentParser(description="Retokenize story JSON files")
     parser.add_argument(
         "--stories-dir",
@@ -153,8 +275,18 @@ def main():
     )
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed output")
     parser.add_argument("--single", type=Path, help="Retokenize a single file only")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Files retokenized in parallel (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Tokenize every segment, ignoring cached results"
+    )
 
     args = parser.parse_args()
+    TOKEN_CACHE_ENABLED = not args.no_cache
 
     # Initialize tokenizer
     print("Initializing tokenizer...")
@@ -166,6 +298,9 @@ def main():
 
     print("Tokenizer ready: fugashi with IPADIC dictionary")
 
+    if TOKEN_CACHE_ENABLED:
+        load_token_cache()
+
     # Find story files
     if args.single:
         if not args.single.exists():
@@ -201,43 +336,39 @@ def main():
     if args.dry_run:
         print("\n[DRY RUN - No files will be modified]")
 
-    # Process each story
+    # Process each story. Tokenizing is CPU-bound, so files are spread
+    # across worker processes, each loading the tokenizer once.
     success_count = 0
     error_count = 0
 
-    for story_file in story_files:
-        try:
-            print(f"\nProcessing: {story_file.name}")
-
-            # Load story
-            with open(story_file, encoding="utf-8") as f:
-                story_data = json.load(f)
-
-            # Validate it's a story file
-            if "metadata" not in story_data or "id" not in story_data:
-                if args.verbose:
-                    print("  Skipping: Not a valid story file")
-                continue
-
-            # Retokenize
-            story_data = retokenize_story(story_data, tokenizer, args.verbose)
-
-            # Save
-            if not args.dry_run:
-                with open(story_file, "w", encoding="utf-8") as f:
-                    json.dump(story_data, f, ensure_ascii=False, indent=2)
-                print("  ✓ Saved")
-            else:
-                print("  Would save")
-
-            success_count += 1
-
-        except json.JSONDecodeError as e:
-            print(f"  ✗ JSON error: {e}")
-            error_count += 1
-        except Exception as e:
-            print(f"  ✗ Error: {e}")
-            error_count += 1
+    workers = min(args.workers, len(story_files))
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(TOKEN_CACHE_ENABLED,)
+        )
+        futures = [
+            executor.submit(retokenize_file, story_file, args.dry_run, args.verbose)
+            for story_file in story_files
+        ]
+        # Report each file as soon as it finishes
+        results = (future.result() for future in as_completed(futures))
+    else:
+        executor = contextlib.nullcontext()
+        results = (
+            retokenize_file(story_file, args.dry_run, args.verbose) for story_file in story_files
+        )
+
+    new_token_entries = {}
+    with executor:
+        for status, output, new_entries in results:
+            print(output, end="")
+            success_count += status == "saved"
+            error_count += status == "error"
+            new_token_entries.update(new_entries)
+
+    # Remember new tokenizations for the next run
+    if new_token_entries and not args.dry_run:
+        save_token_cache(new_token_entries)
 
     # Summary
     print("\n" + "=" * 40)
@@ -0,0 +1,19 @@
+"""Shared test fixtures"""
+
+import functools
+
+import pytest
+
+from app.services.tokenizer import get_tokenizer_service
+
+
+@pytest.fixture(scope="session")
+def tokenizer():
+    """Get tokenizer service instance (shared by the whole session; it is read-only)"""
+    return get_tokenizer_service()
+
+
+@pytest.fixture(scope="session")
+def tokenize(tokenizer):
+    """tokenize_text, memoized for the session so repeated strings are tokenized once"""
+    return functools.lru_cache(maxsize=256)(tokenizer.tokenize_text)
@@ -0,0 +1,52 @@
+"""Tests for deck CSV import (scripts/deck_io.py)"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Scripts are run directly rather than installed, so import them from their directory
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from deck_io import _iter_words_with_csv_module  # noqa: E402
+
+# Word rows with blank lines before the header, between rows and at the end
+CSV_WITH_BLANK_LINES = "\nword,reading,meaning\n食べる,たべる,to eat\n\n飲む,のむ,to drink\n\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """CSV file containing blank lines"""
+    path = tmp_path / "deck.csv"
+    path.write_text(CSV_WITH_BLANK_LINES, encoding="utf-8")
+    return path
+
+
+class TestCsvModuleReader:
+    """Test the stdlib csv reader path"""
+
+    def test_blank_lines_do_not_shift_ids(self, csv_path):
+        """Blank lines should not take a row index (IDs match csv.DictReader)"""
+        words = [
+            w
+            for chunk in _iter_words_with_csv_module(csv_path, "japanese", "N5", 10)
+            for w in chunk
+        ]
+
+        assert [(w.id, w.word) for w in words] == [("csv_0", "食べる"), ("csv_1", "飲む")]
+        assert words[1].reading == "のむ"
+        assert words[1].definitions == ["to drink"]
+
+
+class TestPandasReader:
+    """Test that the pandas reader matches the csv module reader"""
+
+    def test_ids_match_csv_module(self, csv_path):
+        """Both readers should give the same words and IDs for the same file"""
+        pytest.importorskip("pandas")
+        from deck_io_pandas import iter_words_with_pandas
+
+        def read(iter_words):
+            return [w for chunk in iter_words(csv_path, "japanese", "N5", 10) for w in chunk]
+
+        assert read(iter_words_with_pandas) == read(_iter_words_with_csv_module)
@@ -1,72 +1,92 @@
 """Tests for the Japanese tokenizer service"""
 
-import pytest
-
-from app.services.tokenizer import get_tokenizer_service
+import logging
+import re
 
+import pytest
 
-@pytest.fixture
-def tokenizer():
-    """Get tokenizer service instance"""
-    return get_tokenizer_service()
+logger = logging.getLogger(__name__)
+
+# The same character three times in a row
+TRIPLE_CHAR_RE = re.compile(r"(.)\1\1", re.DOTALL)
+
+# Common N5 vocabulary and its readings
+N5_WORDS = {
+    "水": "みず",
+    "山": "やま",
+    "川": "かわ",
+    "木": "き",
+    "花": "はな",
+    "犬": "いぬ",
+    "猫": "ねこ",
+    "魚": "さかな",
+    "鳥": "とり",
+    "人": "ひと",
+}
+
+# Verb form -> (kanji, expected reading of that kanji)
+COMMON_VERBS = {
+    "見ます": ("見", "み"),
+    "聞きます": ("聞", "き"),
+    "書きます": ("書", "か"),
+    "読みます": ("読", "よ"),
+    "話します": ("話", "はな"),
+}
+
+# Texts whose reconstructed readings must not repeat a kana
+DUPLICATE_READING_CASES = (
+    "言いました",  # Should not have いいい
+    "買いました",  # Should not have かいい
+)
+
+# Benchmark cases (see TestComparisonBenchmark)
+BENCHMARK_COMMON_READINGS = {
+    "私": "わたし",
+    "今日": "きょう",
+    "明日": "あした",
+    "昨日": "きのう",
+    "友達": "ともだち",
+    "土曜日": "どようび",
+}
+BENCHMARK_YOJIJUKUGO = ("一期一会", "四面楚歌", "温故知新", "自画自賛", "一石二鳥", "万物流転")
+BENCHMARK_KATAKANA = ("スマートフォン", "インターネット", "コンピューター")
 
 
 class TestCommonReadings:
     """Test that common words have colloquial (not formal) readings"""
 
-    def test_watashi_reading(self, tokenizer):
-        """私 should be わたし, not わたくし"""
-        tokens = tokenizer.tokenize_text("私")
-        assert len(tokens) == 1
-        assert tokens[0].parts[0].reading == "わたし"
-
-    def test_kyou_reading(self, tokenizer):
-        """今日 should be きょう"""
-        tokens = tokenizer.tokenize_text("今日")
+    @pytest.mark.parametrize(
+        "word,expected",
+        [
+            ("私", "わたし"),  # not わたくし
+            ("今日", "きょう"),
+            ("明日", "あした"),  # not あす
+            ("昨日", "きのう"),
+            ("土曜日", "どようび"),
+        ],
+    )
+    def test_reading(self, tokenize, word, expected):
+        """Word should be one token with its colloquial reading"""
+        tokens = tokenize(word)
         assert len(tokens) == 1
-        assert tokens[0].parts[0].reading == "きょう"
-
-    def test_ashita_reading(self, tokenizer):
-        """明日 should be あした, not あす"""
-        tokens = tokenizer.tokenize_text("明日")
-        assert len(tokens) == 1
-        assert tokens[0].parts[0].reading == "あした"
-
-    def test_kinou_reading(self, tokenizer):
-        """昨日 should be きのう"""
-        tokens = tokenizer.tokenize_text("昨日")
-        assert len(tokens) == 1
-        assert tokens[0].parts[0].reading == "きのう"
-
-    def test_doyoubi_reading(self, tokenizer):
-        """土曜日 should be どようび"""
-        tokens = tokenizer.tokenize_text("土曜日")
-        assert len(tokens) == 1
-        assert tokens[0].parts[0].reading == "どようび"
+        assert tokens[0].parts[0].reading == expected
 
 
 class TestKanjiCompounds:
     """Test that all-kanji compounds are kept as single units"""
 
-    def test_tomodachi(self, tokenizer):
-        """友達 should have full reading as one unit"""
-        tokens = tokenizer.tokenize_text("友達")
+    @pytest.mark.parametrize("word,expected", [("友達", "ともだち"), ("店員", "てんいん")])
+    def test_single_unit(self, tokenize, word, expected):
+        """Compound should have full reading as one unit"""
+        tokens = tokenize(word)
         assert len(tokens) == 1
         assert len(tokens[0].parts) == 1
-        assert tokens[0].parts[0].text == "友達"
-        assert tokens[0].parts[0].reading == "ともだち"
+        assert tokens[0].parts[0].text == word
+        assert tokens[0].parts[0].reading == expected
 
-    def test_tenin(self, tokenizer):
-        """店員 should have full reading as one unit"""
-        tokens = tokenizer.tokenize_text("店員")
-        assert len(tokens) == 1
-        assert len(tokens[0].parts) == 1
-        assert tokens[0].parts[0].text == "店員"
-        assert tokens[0].parts[0].reading == "てんいん"
-
-    def test_nihon(self, tokenizer):
+    def test_nihon(self, tokenize):
         """日本 should have full reading"""
-        tokens = tokenizer.tokenize_text("日本")
+        tokens = tokenize("日本")
         assert len(tokens) == 1
         assert tokens[0].parts[0].reading in ["にほん", "にっぽん"]
 
@@ -74,21 +94,21 @@ class TestKanjiCompounds:
 class TestKatakanaCompounds:
     """Test that common katakana compound words are kept together"""
 
-    def test_smartphone(self, tokenizer):
+    def test_smartphone(self, tokenize):
         """スマートフォン should be kept as one token"""
-        tokens = tokenizer.tokenize_text("スマートフォン")
+        tokens = tokenize("スマートフォン")
         assert len(tokens) == 1
         assert tokens[0].surface == "スマートフォン"
 
-    def test_convenience_store(self, tokenizer):
+    def test_convenience_store(self, tokenize):
         """コンビニエンスストア should be kept as one token"""
-        tokens = tokenizer.tokenize_text("コンビニ")
+        tokens = tokenize("コンビニ")
         assert len(tokens) == 1
         assert tokens[0].surface == "コンビニ"
 
-    def test_internet(self, tokenizer):
+    def test_internet(self, tokenize):
         """インターネット should be kept as one token"""
-        tokens = tokenizer.tokenize_text("インターネット")
+        tokens = tokenize("インターネット")
         assert len(tokens) == 1
         assert tokens[0].surface == "インターネット"
 
@@ -96,9 +116,9 @@ class TestKatakanaCompounds:
 class TestMixedKanjiKanaAlignment:
     """Test that mixed kanji/kana words have properly aligned readings"""
 
-    def test_taberu(self, tokenizer):
+    def test_taberu(self, tokenize):
         """食べる should split to 食(た) + べる"""
-        tokens = tokenizer.tokenize_text("食べる")
+        tokens = tokenize("食べる")
         # May be tokenized as 食べ + る or 食べる
         all_parts = []
         for t in tokens:
@@ -112,9 +132,9 @@ class TestMixedKanjiKanaAlignment:
         assert kanji_parts[0].text == "食"
         assert kanji_parts[0].reading == "た"
 
-    def test_ii_verb(self, tokenizer):
+    def test_ii_verb(self, tokenize):
         """言い should split to 言(い) + い (no duplicate readings)"""
-        tokens = tokenizer.tokenize_text("言い")
+        tokens = tokenize("言い")
         assert len(tokens) == 1
         parts = tokens[0].parts
 
@@ -125,9 +145,9 @@ class TestMixedKanjiKanaAlignment:
         assert parts[1].text == "い"
         assert parts[1].reading is None
 
-    def test_hajimete(self, tokenizer):
+    def test_hajimete(self, tokenize):
         """初めて should split to 初(はじ) + めて"""
-        tokens = tokenizer.tokenize_text("初めて")
+        tokens = tokenize("初めて")
         assert len(tokens) == 1
         parts = tokens[0].parts
 
@@ -137,9 +157,9 @@ class TestMixedKanjiKanaAlignment:
         assert parts[1].text == "めて"
         assert parts[1].reading is None
 
-    def test_ikimashita(self, tokenizer):
+    def test_ikimashita(self, tokenize):
         """行きました should properly tokenize 行き"""
-        tokens = tokenizer.tokenize_text("行きました")
+        tokens = tokenize("行きました")
         # Find the 行き token
         iki_token = None
         for t in tokens:
@@ -155,86 +175,86 @@ class TestMixedKanjiKanaAlignment:
 class TestPartOfSpeech:
     """Test part of speech detection"""
 
-    def test_noun(self, tokenizer):
+    def test_noun(self, tokenize):
         """Nouns should be tagged correctly"""
-        tokens = tokenizer.tokenize_text("猫")
+        tokens = tokenize("猫")
         assert tokens[0].partOfSpeech == "noun"
 
-    def test_verb(self, tokenizer):
+    def test_verb(self, tokenize):
         """Verbs should be tagged correctly"""
-        tokens = tokenizer.tokenize_text("食べる")
+        tokens = tokenize("食べる")
         # 食べ is the verb stem
         verb_found = any(t.partOfSpeech == "verb" for t in tokens)
         assert verb_found
 
-    def test_particle(self, tokenizer):
+    def test_particle(self, tokenize):
         """Particles should be tagged correctly"""
-        tokens = tokenizer.tokenize_text("私は")
+        tokens = tokenize("私は")
         # は should be a particle
         ha_token = [t for t in tokens if t.surface == "は"][0]
         assert ha_token.partOfSpeech == "particle"
 
-    def test_adjective(self, tokenizer):
+    def test_adjective(self, tokenize):
         """Adjectives should be tagged correctly"""
-        tokens = tokenizer.tokenize_text("美しい")
+        tokens = tokenize("美しい")
         assert tokens[0].partOfSpeech == "adjective"
 
 
 class TestSpecialCases:
     """Test special cases and edge cases"""
 
-    def test_katakana_no_reading(self, tokenizer):
+    def test_katakana_no_reading(self, tokenize):
         """Katakana words should not have furigana readings"""
-        tokens = tokenizer.tokenize_text("カフェ")
+        tokens = tokenize("カフェ")
         assert len(tokens) == 1
         # Katakana doesn't need reading annotation
         assert tokens[0].parts[0].reading is None
 
-    def test_hiragana_no_reading(self, tokenizer):
+    def test_hiragana_no_reading(self, tokenize):
         """Pure hiragana should not have readings"""
-        tokens = tokenizer.tokenize_text("これ")
+        tokens = tokenize("これ")
         for token in tokens:
             for part in token.parts:
                 assert part.reading is None
 
-    def test_punctuation(self, tokenizer):
+    def test_punctuation(self, tokenize):
         """Japanese punctuation should be handled"""
-        tokens = tokenizer.tokenize_text("。")
+        tokens = tokenize("。")
         assert len(tokens) == 1
         assert tokens[0].surface == "。"
 
-    def test_mixed_sentence(self, tokenizer):
+    def test_mixed_sentence(self, tokenize):
         """Full sentence should tokenize correctly"""
-        tokens = tokenizer.tokenize_text("私はカフェに行きました。")
+        tokens = tokenize("私はカフェに行きました。")
 
         # Check key tokens exist
-        surfaces = [t.surface for t in tokens]
+        surfaces = {t.surface for t in tokens}
         assert "私" in surfaces
         assert "は" in surfaces
         assert "カフェ" in surfaces
         assert "に" in surfaces
         assert "。" in surfaces
 
-    def test_empty_string(self, tokenizer):
+    def test_empty_string(self, tokenize):
         """Empty string should return empty list"""
-        tokens = tokenizer.tokenize_text("")
+        tokens = tokenize("")
         assert tokens == []
 
 
 class TestReadingAlignment:
     """Test the reading alignment algorithm specifically"""
 
-    def test_prefix_kana(self, tokenizer):
+    def test_prefix_kana(self, tokenize):
         """Words with prefix kana should align correctly"""
         # お茶 (ocha) - prefix お + kanji 茶
-        tokens = tokenizer.tokenize_text("お茶")
+        tokens = tokenize("お茶")
         # This might be tokenized as one word or split
         all_text = "".join(p.text for t in tokens for p in t.parts)
         assert "茶" in all_text
 
-    def test_suffix_kana(self, tokenizer):
+    def test_suffix_kana(self, tokenize):
         """Words with suffix kana should align correctly"""
-        tokens = tokenizer.tokenize_text("飲み")
+        tokens = tokenize("飲み")
         assert len(tokens) == 1
         parts = tokens[0].parts
 
@@ -244,131 +264,79 @@ class TestReadingAlignment:
         assert parts[1].text == "み"
         assert parts[1].reading is None
 
-    def test_middle_kana(self, tokenizer):
+    def test_middle_kana(self, tokenize):
         """Words with middle kana should align correctly"""
         # 食べ物 (tabemono) - 食 + べ + 物
-        tokens = tokenizer.tokenize_text("食べ物")
+        tokens = tokenize("食べ物")
         # May tokenize as 食べ + 物 or 食べ物
-        all_parts = []
-        for t in tokens:
-            all_parts.extend(t.parts)
 
         # Verify we have correct structure
-        texts = [p.text for p in all_parts]
-        assert "食" in texts or "食べ" in "".join(texts)
+        assert any(p.text in ("食", "食べ") for t in tokens for p in t.parts) or "食べ" in "".join(
+            p.text for t in tokens for p in t.parts
+        )
 
 
 class TestQualityAssurance:
     """Quality assurance tests for production readiness"""
 
-    def test_n5_vocabulary(self, tokenizer):
+    @pytest.mark.parametrize("kanji,expected_reading", N5_WORDS.items())
+    def test_n5_vocabulary(self, tokenize, kanji, expected_reading):
         """Common N5 vocabulary should have correct readings"""
-        n5_words = {
-            "水": "みず",
-            "山": "やま",
-            "川": "かわ",
-            "木": "き",
-            "花": "はな",
-            "犬": "いぬ",
-            "猫": "ねこ",
-            "魚": "さかな",
-            "鳥": "とり",
-            "人": "ひと",
-        }
-
-        for kanji, expected_reading in n5_words.items():
-            tokens = tokenizer.tokenize_text(kanji)
-            actual_reading = tokens[0].parts[0].reading
-            assert actual_reading == expected_reading, (
-                f"{kanji} should be {expected_reading}, got {actual_reading}"
-            )
-
-    def test_common_verbs(self, tokenizer):
+        tokens = tokenize(kanji)
+        actual_reading = tokens[0].parts[0].reading
+        assert actual_reading == expected_reading, (
+            f"{kanji} should be {expected_reading}, got {actual_reading}"
+        )
+
+    @pytest.mark.parametrize("verb_form,kanji_reading", COMMON_VERBS.items())
+    def test_common_verbs(self, tokenize, verb_form, kanji_reading):
         """Common verb stems should have correct readings"""
-        # Test with proper verb conjugations
-        verbs = {
-            "見ます": ("見", "み"),
-            "聞きます": ("聞", "き"),
-            "書きます": ("書", "か"),
-            "読みます": ("読", "よ"),
-            "話します": ("話", "はな"),
-        }
-
-        for verb_form, (kanji, expected_reading) in verbs.items():
-            tokens = tokenizer.tokenize_text(verb_form)
-            # Find the kanji part
-            for token in tokens:
-                if kanji in token.surface:
-                    kanji_part = [p for p in token.parts if p.text == kanji]
-                    if kanji_part:
-                        assert kanji_part[0].reading == expected_reading, (
-                            f"{kanji} in {verb_form} should be {expected_reading}, got {kanji_part[0].reading}"
-                        )
-
-    def test_no_duplicate_readings(self, tokenizer):
+        kanji, expected_reading = kanji_reading
+        tokens = tokenize(verb_form)
+        # Find the kanji part
+        for token in tokens:
+            if kanji in token.surface:
+                kanji_part = [p for p in token.parts if p.text == kanji]
+                if kanji_part:
+                    assert kanji_part[0].reading == expected_reading, (
+                        f"{kanji} in {verb_form} should be {expected_reading}, got {kanji_part[0].reading}"
+                    )
+
+    def test_no_duplicate_readings(self, tokenize):
         """Ensure no duplicate kana in output"""
-        test_cases = [
-            "言いました",  # Should not have いいい
-            "買いました",  # Should not have かいい
-        ]
-
-        for text in test_cases:
-            tokens = tokenizer.tokenize_text(text)
+        for text in DUPLICATE_READING_CASES:
+            tokens = tokenize(text)
 
             # Reconstruct with readings
-            output = ""
-            for token in tokens:
-                for part in token.parts:
-                    if part.reading:
-                        output += part.reading
-                    else:
-                        output += part.text
+            output = "".join(part.reading or part.text for token in tokens for part in token.parts)
 
             # Should not have 3 consecutive identical characters
-            for i in range(len(output) - 2):
-                three_chars = output[i : i + 3]
-                assert not (three_chars[0] == three_chars[1] == three_chars[2]), (
-                    f"Found duplicate in {text}: {output}"
-                )
+            assert TRIPLE_CHAR_RE.search(output) is None, f"Found duplicate in {text}: {output}"
 
 
 class TestYojijukugo:
     """Test that four-character idioms (yojijukugo) are kept as single units"""
 
-    def test_ichigoichie(self, tokenizer):
-        """一期一会 should be kept as one token"""
-        tokens = tokenizer.tokenize_text("一期一会")
+    @pytest.mark.parametrize(
+        "word,expected",
+        [
+            ("一期一会", "いちごいちえ"),
+            ("四面楚歌", "しめんそか"),
+            ("温故知新", "おんこちしん"),
+            pytest.param(
+                "自画自賛",
+                "じがじさん",
+                marks=pytest.mark.skip(reason="自画自賛 is split by IPADIC - known limitation"),
+            ),
+            ("一石二鳥", "いっせきにちょう"),
+        ],
+    )
+    def test_single_token(self, tokenize, word, expected):
+        """Idiom should be kept as one token with its full reading"""
+        tokens = tokenize(word)
         assert len(tokens) == 1
-        assert tokens[0].surface == "一期一会"
-        assert tokens[0].parts[0].reading == "いちごいちえ"
-
-    def test_shimenshoka(self, tokenizer):
-        """四面楚歌 should be kept as one token"""
-        tokens = tokenizer.tokenize_text("四面楚歌")
-        assert len(tokens) == 1
-        assert tokens[0].surface == "四面楚歌"
-        assert tokens[0].parts[0].reading == "しめんそか"
-
-    def test_onkochishin(self, tokenizer):
-        """温故知新 should be kept as one token"""
-        tokens = tokenizer.tokenize_text("温故知新")
-        assert len(tokens) == 1
-        assert tokens[0].surface == "温故知新"
-        assert tokens[0].parts[0].reading == "おんこちしん"
-
-    @pytest.mark.skip(reason="自画自賛 is split by IPADIC - known limitation")
-    def test_jigajisan(self, tokenizer):
-        """自画自賛 should be kept as one token"""
-        tokens = tokenizer.tokenize_text("自画自賛")
-        assert len(tokens) == 1
-        assert tokens[0].surface == "自画自賛"
-
-    def test_issekinicho(self, tokenizer):
-        """一石二鳥 should be kept as one token"""
-        tokens = tokenizer.tokenize_text("一石二鳥")
-        assert len(tokens) == 1
-        assert tokens[0].surface == "一石二鳥"
-        assert tokens[0].parts[0].reading == "いっせきにちょう"
+        assert tokens[0].surface == word
+        assert tokens[0].parts[0].reading == expected
 
 
 class TestComparisonBenchmark:
@@ -377,7 +345,7 @@ class TestComparisonBenchmark:
     These tests return structured data that can be used by the comparison utility.
     """
 
-    def get_benchmark_results(self, tokenizer) -> dict:
+    def get_benchmark_results(self, tokenize) -> dict:
         """Run all benchmark cases and return results."""
         results = {
             "common_readings": {},
@@ -387,17 +355,8 @@ class TestComparisonBenchmark:
         }
 
         # Common readings test cases
-        common_readings = {
-            "私": "わたし",
-            "今日": "きょう",
-            "明日": "あした",
-            "昨日": "きのう",
-            "友達": "ともだち",
-            "土曜日": "どようび",
-        }
-
-        for word, expected in common_readings.items():
-            tokens = tokenizer.tokenize_text(word)
+        for word, expected in BENCHMARK_COMMON_READINGS.items():
+            tokens = tokenize(word)
             if tokens and tokens[0].parts:
                 actual = tokens[0].parts[0].reading
                 results["common_readings"][word] = {
@@ -407,10 +366,8 @@ class TestComparisonBenchmark:
                 }
 
         # Yojijukugo test cases (should be single token)
-        yojijukugo = ["一期一会", "四面楚歌", "温故知新", "自画自賛", "一石二鳥", "万物流転"]
-
-        for word in yojijukugo:
-            tokens = tokenizer.tokenize_text(word)
+        for word in BENCHMARK_YOJIJUKUGO:
+            tokens = tokenize(word)
             is_single = len(tokens) == 1 and tokens[0].surface == word
             results["yojijukugo"][word] = {
                 "is_single_token": is_single,
@@ -419,10 +376,8 @@ class TestComparisonBenchmark:
             }
 
         # Katakana compounds (should be single token)
-        katakana = ["スマートフォン", "インターネット", "コンピューター"]
-
-        for word in katakana:
-            tokens = tokenizer.tokenize_text(word)
+        for word in BENCHMARK_KATAKANA:
+            tokens = tokenize(word)
             is_single = len(tokens) == 1 and tokens[0].surface == word
             results["katakana"][word] = {
                 "is_single_token": is_single,
@@ -432,29 +387,33 @@ class TestComparisonBenchmark:
 
         return results
 
-    def test_benchmark_runner(self, tokenizer):
+    @pytest.mark.benchmark
+    def test_benchmark_runner(self, tokenize):
         """Verify benchmark can run (actual comparison done by compare_tokenizers.py)"""
-        results = self.get_benchmark_results(tokenizer)
+        results = self.get_benchmark_results(tokenize)
 
         # Just verify structure exists
         assert "common_readings" in results
         assert "yojijukugo" in results
         assert "katakana" in results
 
-        # Log results for manual inspection
-        print("\n--- Tokenizer Benchmark Results ---")
+        # Log results for manual inspection (pytest -m benchmark --log-cli-level=DEBUG)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        logger.debug("--- Tokenizer Benchmark Results ---")
 
-        print("\nCommon Readings:")
+        logger.debug("Common Readings:")
         for word, data in results["common_readings"].items():
             status = "✓" if data["passed"] else "✗"
-            print(f"  {status} {word}: expected={data['expected']}, actual={data['actual']}")
+            logger.debug(f"  {status} {word}: expected={data['expected']}, actual={data['actual']}")
 
-        print("\nYojijukugo (should be single token):")
+        logger.debug("Yojijukugo (should be single token):")
         for word, data in results["yojijukugo"].items():
             status = "✓" if data["is_single_token"] else "✗"
-            print(f"  {status} {word}: {data['tokens']}")
+            logger.debug(f"  {status} {word}: {data['tokens']}")
 
-        print("\nKatakana Compounds:")
+        logger.debug("Katakana Compounds:")
         for word, data in results["katakana"].items():
             status = "✓" if data["is_single_token"] else "✗"
-            print(f"  {status} {word}: {data['tokens']}")
+            logger.debug(f"  {status} {word}: {data['tokens']}")